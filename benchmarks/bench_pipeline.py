@@ -0,0 +1,361 @@
+"""
+Benchmark the research, scoring and quality stages and the whole daily pipeline offline
+
+Feeds are served from recorded fixtures in benchmarks/fixtures (their dates
+shifted so the newest entry is as old as when it was recorded), and OpenAI
+is replaced by generation.stub_transport.StubTransport answering with the
+recorded completions in benchmarks/fixtures/completions.json. Everything
+runs in a scratch directory, so no caches or analytics are touched.
+
+Reports per-stage throughput and end-to-end run_daily_pipeline latency
+(best of several samples) and compares them against
+benchmarks/baselines/pipeline.json. Baselines are machine-specific: save
+one on the machine you compare on. On a shared or single-core machine
+timings drift by a third between runs, hence the wide default
+--tolerance; it catches pathological slowdowns, not small ones.
+
+Usage:
+    python benchmarks/bench_pipeline.py [--repeat 5] [--check] [--tolerance 0.5]
+    python benchmarks/bench_pipeline.py --save-baseline
+    python benchmarks/bench_pipeline.py --record   # re-record feed fixtures (needs network)
+"""
+
+import argparse
+import gc
+import json
+import os
+import platform
+import re
+import shutil
+import sys
+import tempfile
+import time
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+REPO_ROOT = os.path.abspath(os.path.join(BENCH_DIR, '..'))
+FIXTURES_DIR = os.path.join(BENCH_DIR, 'fixtures')
+DEFAULT_BASELINE = os.path.join(BENCH_DIR, 'baselines', 'pipeline.json')
+
+sys.path.insert(0, os.path.join(REPO_ROOT, 'src'))
+
+# Keep the agent's console logging out of the report
+os.environ.setdefault('LOG_LEVEL', 'ERROR')
+
+_DATE_ELEMENT = re.compile(rb'<(pubDate|published|updated|dc:date)>([^<]+)</\1>')
+CHUNK_SIZE = 16 * 1024
+
+
+def load_fixtures(now: datetime) -> dict:
+    """Feed URL -> (body, response headers), with dates moved forward to `now`"""
+
+    with open(os.path.join(FIXTURES_DIR, 'manifest.json'), 'r', encoding='utf-8') as f:
+        manifest = json.load(f)
+
+    shift = now - datetime.fromisoformat(manifest['recorded_at'])
+
+    def shifted(match: re.Match) -> bytes:
+        value = match.group(2).decode('utf-8').strip()
+        try:
+            moved = format_datetime(parsedate_to_datetime(value) + shift)
+        except (TypeError, ValueError, IndexError):
+            try:
+                moved = (datetime.fromisoformat(value) + shift).isoformat()
+            except ValueError:
+                return match.group(0)
+        return b'<%s>%s</%s>' % (match.group(1), moved.encode('utf-8'), match.group(1))
+
+    fixtures = {}
+    for feed in manifest['feeds']:
+        with open(os.path.join(FIXTURES_DIR, feed['file']), 'rb') as f:
+            body = _DATE_ELEMENT.sub(shifted, f.read())
+        fixtures[feed['url']] = (body, {'content-type': feed['content_type']})
+    return fixtures
+
+
+def serve_fixtures(researcher, fixtures: dict) -> None:
+    """Point a NewsResearcher at the fixtures instead of the network"""
+
+    @contextmanager
+    def stream(url, extra_headers=None):
+        body, headers = fixtures[url]
+        yield (body[i:i + CHUNK_SIZE] for i in range(0, len(body), CHUNK_SIZE)), dict(headers), 200
+
+    researcher.fetcher.stream = stream
+    researcher.rss_feeds = list(fixtures)
+
+
+@contextmanager
+def scratch_workspace():
+    """Run in a temporary directory holding only the voice profile"""
+
+    previous = os.getcwd()
+    with tempfile.TemporaryDirectory(prefix='bench_pipeline_') as workspace:
+        os.makedirs(os.path.join(workspace, 'data'))
+        shutil.copy(os.path.join(REPO_ROOT, 'data', 'voice_profile.json'), os.path.join(workspace, 'data'))
+        os.chdir(workspace)
+        try:
+            yield workspace
+        finally:
+            os.chdir(previous)
+
+
+def reset_state() -> None:
+    """Forget feed caches, dedup history, topic trends and feed health between runs
+
+    The completion cache stays (it is bypassed anyway), as does the
+    analytics store, which the agent keeps open.
+    """
+
+    cache_dir = os.path.join('data', 'cache')
+    if not os.path.isdir(cache_dir):
+        return
+    for name in os.listdir(cache_dir):
+        if name.startswith('completions'):
+            continue
+        path = os.path.join(cache_dir, name)
+        if os.path.isdir(path):
+            shutil.rmtree(path)
+        else:
+            os.remove(path)
+
+
+def timed(fn, repeat: int, min_sample_seconds: float = 0.5) -> float:
+    """Fastest seconds per call over `repeat` samples
+
+    Like timeit's autorange, each sample repeats the call until it has run
+    for `min_sample_seconds`, so fast stages aren't dominated by timer noise.
+    The fastest sample is the least disturbed by other load on the machine.
+    As in timeit, garbage collection is paused while sampling so a cycle
+    collection triggered by earlier stages doesn't land in a later one.
+    """
+
+    calls = 1
+    while True:
+        started = time.perf_counter()
+        for _ in range(calls):
+            fn()
+        if time.perf_counter() - started >= min_sample_seconds:
+            break
+        calls *= 2
+
+    samples = []
+    gc.collect()
+    gc.disable()
+    try:
+        for _ in range(repeat):
+            started = time.perf_counter()
+            for _ in range(calls):
+                fn()
+            samples.append((time.perf_counter() - started) / calls)
+    finally:
+        gc.enable()
+    return min(samples)
+
+
+def make_agent(completions: list):
+    import main
+    from generation.content_generator import ResponsibleAIContentGenerator
+    from generation.stub_transport import StubTransport
+    from utils.config import get_section
+
+    agent = main.ResponsibleAIAgent(bypass_cache=True, refresh_research=True)
+    agent.content_generator = ResponsibleAIContentGenerator(
+        get_section(agent.config, 'apis.openai'),
+        get_section(agent.config, 'pipeline'),
+        transport=StubTransport(script=list(completions))
+    )
+    return agent
+
+
+def run_benchmarks(repeat: int) -> dict:
+    from research.news_research import NewsResearcher
+    from utils.config import get_section
+
+    with open(os.path.join(FIXTURES_DIR, 'completions.json'), 'r', encoding='utf-8') as f:
+        completions = json.load(f)
+
+    fixtures = load_fixtures(datetime.now(timezone.utc))
+    metrics = {}
+
+    with scratch_workspace():
+        agent = make_agent(completions)
+        news_config = get_section(agent.config, 'apis.news')
+        hours_back = news_config.get('hours_back', 24)
+
+        # Feed parsing: every fixture entry, no cutoff
+        researcher = NewsResearcher(news_config)
+        researcher.stale_entries_to_stop = 10 ** 9
+
+        def parse_all():
+            total = 0
+            for url, (body, headers) in fixtures.items():
+                chunks = (body[i:i + CHUNK_SIZE] for i in range(0, len(body), CHUNK_SIZE))
+                total += len(researcher._parse_feed_stream(url, chunks, headers, datetime.min, {}))
+            return total
+
+        entries = parse_all()
+        metrics['parse_entries_per_s'] = entries / timed(parse_all, repeat)
+
+        # Relevance filtering and scoring of every entry's text
+        texts = []
+        for url, (body, headers) in fixtures.items():
+            chunks = (body[i:i + CHUNK_SIZE] for i in range(0, len(body), CHUNK_SIZE))
+            for entry in researcher._parse_feed_stream(url, chunks, headers, datetime.min, {}):
+                content = entry.get('content') or [{}]
+                texts.append(f"{entry.get('title', '')} {entry.get('summary', '')} {content[0].get('value', '')}".lower())
+
+        def score_relevance():
+            for text in texts:
+                if researcher._is_ai_related(text):
+                    researcher._calculate_relevance(text)
+
+        metrics['relevance_entries_per_s'] = len(texts) / timed(score_relevance, repeat)
+
+        # Whole research phase: fetch (from fixtures), parse, filter, dedup and rank
+        def research():
+            reset_state()
+            fresh = NewsResearcher(news_config)
+            serve_fixtures(fresh, fixtures)
+            fresh.research_ai_news(hours_back=hours_back)
+
+        metrics['research_seconds'] = timed(research, repeat)
+
+        # Voice alignment and quality control of generated tweets
+        tweets = completions * 20
+
+        def score_voice():
+            for tweet in tweets:
+                agent.content_generator._evaluate_voice_alignment(tweet)
+
+        metrics['voice_tweets_per_s'] = len(tweets) / timed(score_voice, repeat)
+
+        content_results = [
+            {'content': tweet, 'quality_score': agent.content_generator._evaluate_voice_alignment(tweet),
+             'model_used': 'stub'}
+            for tweet in tweets
+        ]
+
+        def quality_control():
+            for content_result in content_results:
+                agent._execute_quality_control(content_result)
+
+        metrics['quality_tweets_per_s'] = len(content_results) / timed(quality_control, repeat)
+        metrics['quality_batch_tweets_per_s'] = len(content_results) / timed(
+            lambda: agent.quality_engine.evaluate_batch(content_results), repeat
+        )
+
+        # End to end, with research always fetched and OpenAI stubbed
+        def pipeline():
+            reset_state()
+            # A new researcher, so no dedup history or feed schedule carries over
+            agent.__dict__.pop('news_researcher', None)
+            serve_fixtures(agent.news_researcher, fixtures)
+            result = agent.run_daily_pipeline()
+            if not result['success']:
+                raise RuntimeError(f"Pipeline failed: {result.get('error')}")
+
+        metrics['pipeline_seconds'] = timed(pipeline, repeat)
+        agent.close()
+
+    return {'entries': entries, 'tweets': len(tweets), 'metrics': metrics}
+
+
+def compare(metrics: dict, baseline: dict, tolerance: float) -> list:
+    """Print each metric against its baseline; returns the names that regressed past `tolerance`"""
+
+    regressions = []
+    print(f"{'metric':<28}{'current':>14}{'baseline':>14}{'change':>10}")
+    for name, value in metrics.items():
+        base = baseline.get('metrics', {}).get(name)
+        if not base:
+            print(f"{name:<28}{value:>14.3f}{'-':>14}{'-':>10}")
+            continue
+
+        # Throughput should go up, durations down
+        change = (value - base) / base
+        worse = -change if name.endswith('_per_s') else change
+        flag = '  REGRESSION' if worse > tolerance else ''
+        if flag:
+            regressions.append(name)
+        print(f"{name:<28}{value:>14.3f}{base:>14.3f}{change:>+10.1%}{flag}")
+    return regressions
+
+
+def record_fixtures() -> None:
+    """Download the configured feeds into benchmarks/fixtures/feeds"""
+
+    from research.feed_fetcher import FeedFetcher
+    from research.feed_registry import FeedRegistry
+    from utils.config import get_section, load_config
+
+    news_config = get_section(load_config(), 'apis.news')
+    registry = FeedRegistry(news_config.get('feeds'), state_file=os.devnull)
+    fetcher = FeedFetcher({'User-Agent': 'ResponsibleAI-NewsBot/1.0 (Educational Research)'},
+                          timeout=news_config.get('request_timeout', 10), per_host_delay=0)
+
+    manifest = {'recorded_at': datetime.now(timezone.utc).isoformat(timespec='seconds'), 'feeds': []}
+    os.makedirs(os.path.join(FIXTURES_DIR, 'feeds'), exist_ok=True)
+    for url, source in registry.sources.items():
+        name = re.sub(r'[^a-z0-9]+', '_', source.get('name', url).lower()).strip('_') + '.xml'
+        try:
+            body, headers, _ = fetcher.fetch(url)
+        except Exception as e:
+            print(f"Skipping {url}: {e}")
+            continue
+        with open(os.path.join(FIXTURES_DIR, 'feeds', name), 'wb') as f:
+            f.write(body)
+        manifest['feeds'].append({'url': url, 'file': f'feeds/{name}',
+                                  'content_type': headers.get('content-type', 'application/rss+xml')})
+        print(f"Recorded {url} ({len(body) / 1024:.0f} KB) -> feeds/{name}")
+
+    with open(os.path.join(FIXTURES_DIR, 'manifest.json'), 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, indent=2)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--repeat', type=int, default=5, help="Samples per measurement; the fastest is reported")
+    parser.add_argument('--baseline', default=DEFAULT_BASELINE, help="Baseline JSON to compare against or save")
+    parser.add_argument('--save-baseline', action='store_true', help="Store this run's results as the baseline")
+    parser.add_argument('--check', action='store_true', help="Exit with status 1 if any metric regressed")
+    parser.add_argument('--tolerance', type=float, default=0.5,
+                        help="Allowed slowdown before flagging (0.5 = 50%%); tighten it on a quiet, dedicated machine")
+    parser.add_argument('--record', action='store_true', help="Re-record the feed fixtures from the network and exit")
+    args = parser.parse_args()
+
+    if args.record:
+        record_fixtures()
+        return
+
+    result = run_benchmarks(args.repeat)
+    print(f"Fixtures: {len(load_fixtures(datetime.now(timezone.utc)))} feeds, {result['entries']} entries, "
+          f"{result['tweets']} tweets; best of {args.repeat} samples\n")
+
+    baseline = {}
+    if os.path.exists(args.baseline):
+        with open(args.baseline, 'r', encoding='utf-8') as f:
+            baseline = json.load(f)
+    regressions = compare(result['metrics'], baseline, args.tolerance)
+
+    if args.save_baseline:
+        os.makedirs(os.path.dirname(args.baseline), exist_ok=True)
+        with open(args.baseline, 'w', encoding='utf-8') as f:
+            json.dump({
+                'saved_at': datetime.now().isoformat(timespec='seconds'),
+                'python': platform.python_version(),
+                'machine': f"{platform.system()} {platform.machine()}, {os.cpu_count()} CPUs",
+                'repeat': args.repeat,
+                'metrics': {name: round(value, 6) for name, value in result['metrics'].items()}
+            }, f, indent=2)
+        print(f"\nBaseline saved to {args.baseline}")
+
+    if args.check and regressions:
+        print(f"\nRegressed past {args.tolerance:.0%}: {', '.join(regressions)}")
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,126 @@
+"""
+Benchmark serializing pipeline results to JSON
+
+Compares the old path (recursively sanitize a copy, then json.dump with
+indent=2) against utils.serialization.dumps, which encodes the live objects
+with a default= hook, with and without orjson.
+
+Usage: python benchmarks/bench_serialization.py [--articles 500] [--body-chars 5000] [--repeat 5]
+"""
+
+import argparse
+import json
+import os
+import random
+import sys
+import time
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+
+from utils import serialization
+
+
+def sanitize_for_json(obj):
+    """The copy-then-encode approach previously used by ResponsibleAIAgent"""
+    if isinstance(obj, dict):
+        return {k: sanitize_for_json(v) for k, v in obj.items()}
+    elif isinstance(obj, list):
+        return [sanitize_for_json(item) for item in obj]
+    elif hasattr(obj, 'isoformat'):
+        return obj.isoformat()
+    elif isinstance(obj, (str, int, float, bool)) or obj is None:
+        return obj
+    else:
+        return str(obj)
+
+
+def make_results(articles: int, body_chars: int) -> dict:
+    """Pipeline results shaped like run_daily_pipeline's, with full article bodies"""
+
+    rng = random.Random(42)
+    words = "responsible ai audit bias governance model transparency data team trust policy".split()
+    now = datetime(2026, 1, 1, 12, 0, 0)
+
+    def text(chars: int) -> str:
+        out = []
+        while sum(len(w) + 1 for w in out) < chars:
+            out.append(rng.choice(words))
+        return ' '.join(out)
+
+    news_articles = [
+        {
+            'title': text(80),
+            'summary': text(300),
+            'body': text(body_chars),
+            'link': f'https://example.com/articles/{i}',
+            'published': now - timedelta(minutes=i),
+            'published_timestamp': (now - timedelta(minutes=i)).timestamp(),
+            'source': 'https://example.com/feed',
+            'sources': [{'source': 'https://example.com/feed', 'link': f'https://example.com/articles/{i}'}],
+            'relevance_score': rng.random() * 10,
+            'extracted_at': now
+        }
+        for i in range(articles)
+    ]
+
+    return {
+        'research': {
+            'news_articles': news_articles,
+            'trending_topics': ['AI Ethics', 'AI Safety', 'AI Governance'],
+            'topic_trends': [{'topic': 'AI Ethics', 'score': 3.2}],
+            'research_timestamp': now
+        },
+        'content': {'content': text(250), 'quality_score': 0.83, 'generated_at': now, 'model_used': 'gpt-4o-mini'},
+        'quality': {'score': 0.9, 'passed': True, 'issues': [], 'checks': {'timestamp': now}},
+        'posting': {'posted': False, 'action_taken': 'approved_for_posting', 'timestamp': now},
+        'pipeline_duration': 12.5
+    }
+
+
+def bench(label: str, fn, repeat: int) -> float:
+    best = float('inf')
+    size = 0
+    for _ in range(repeat):
+        started = time.perf_counter()
+        size = len(fn())
+        best = min(best, time.perf_counter() - started)
+    print(f"{label:<42} {best * 1000:8.2f} ms  {size / 1024:9.1f} KiB")
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark pipeline result serialization")
+    parser.add_argument('--articles', type=int, default=500)
+    parser.add_argument('--body-chars', type=int, default=5000)
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    results = make_results(args.articles, args.body_chars)
+    print(f"{args.articles} articles, {args.body_chars} body chars each, best of {args.repeat}\n")
+
+    baseline = bench("sanitize + json.dumps(indent=2)",
+                     lambda: json.dumps(sanitize_for_json(results), indent=2, ensure_ascii=False), args.repeat)
+
+    # Same decoded content either way; only whitespace differs
+    expected = json.loads(json.dumps(sanitize_for_json(results)))
+    orjson = serialization.orjson
+
+    serialization.orjson = None
+    assert json.loads(serialization.dumps(results)) == expected
+    stdlib = bench("dumps (stdlib, default= hook, compact)", lambda: serialization.dumps(results), args.repeat)
+    serialization.orjson = orjson
+
+    print(f"\nstdlib speedup: {baseline / stdlib:.1f}x")
+
+    if orjson is None:
+        print("orjson not installed; skipping")
+        return
+
+    assert json.loads(serialization.dumps(results)) == expected
+    fast = bench("dumps (orjson, compact)", lambda: serialization.dumps(results), args.repeat)
+    print(f"orjson speedup: {baseline / fast:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
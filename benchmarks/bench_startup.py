@@ -0,0 +1,98 @@
+"""
+Benchmark agent CLI startup
+
+Runs each subcommand in a fresh interpreter with -X importtime, reporting
+median wall time and import time over a bare interpreter plus the slowest
+imports, and fails if a lightweight subcommand loads the OpenAI SDK,
+feedparser, requests or NumPy.
+
+Usage: python benchmarks/bench_startup.py [--repeat 5]
+"""
+
+import argparse
+import os
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+REPO_ROOT = os.path.abspath(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+MAIN = os.path.join(REPO_ROOT, 'src', 'main.py')
+
+# Subcommands that must never pull in the network/generation stack
+SCENARIOS = {
+    'import main': [sys.executable, '-X', 'importtime', '-c', f"import sys; sys.path.insert(0, {os.path.dirname(MAIN)!r}); import main"],
+    'rescore --text': [sys.executable, '-X', 'importtime', MAIN, 'rescore', '--text', 'What would you audit first? #ResponsibleAI'],
+    'rescore': [sys.executable, '-X', 'importtime', MAIN, 'rescore'],
+    'export-analytics': [sys.executable, '-X', 'importtime', MAIN, 'export-analytics'],
+}
+HEAVY_MODULES = ('openai', 'feedparser', 'requests', 'numpy')
+
+
+def parse_importtime(stderr: str):
+    """(module, self_us, cumulative_us) for each line of -X importtime output"""
+
+    for line in stderr.splitlines():
+        if not line.startswith('import time:') or 'self [us]' in line:
+            continue
+        self_us, cumulative_us, module = line[len('import time:'):].split('|')
+        yield module.strip(), int(self_us), int(cumulative_us)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark CLI startup and import time")
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--top', type=int, default=5, help="Slowest imports to list per scenario")
+    args = parser.parse_args()
+
+    # Run from a scratch copy of data/ so the benchmark never touches real analytics
+    workdir = tempfile.mkdtemp(prefix='bench_startup_')
+    shutil.copy(os.path.join(REPO_ROOT, 'data', 'voice_profile.json'), workdir)
+    os.makedirs(os.path.join(workdir, 'data'))
+    shutil.move(os.path.join(workdir, 'voice_profile.json'), os.path.join(workdir, 'data', 'voice_profile.json'))
+
+    failed = False
+    try:
+        baseline = []
+        for _ in range(args.repeat):
+            started = time.perf_counter()
+            proc = subprocess.run([sys.executable, '-X', 'importtime', '-c', 'pass'], capture_output=True, text=True)
+            baseline.append(time.perf_counter() - started)
+        baseline_wall = statistics.median(baseline)
+        startup_modules = {module for module, _, _ in parse_importtime(proc.stderr)}
+        print(f"{'bare interpreter':<20} {baseline_wall * 1000:7.1f} ms wall, {len(startup_modules)} modules\n")
+
+        for name, command in SCENARIOS.items():
+            walls = []
+            for _ in range(args.repeat):
+                started = time.perf_counter()
+                proc = subprocess.run(command, cwd=workdir, capture_output=True, text=True)
+                walls.append(time.perf_counter() - started)
+                if proc.returncode != 0:
+                    print(f"{name}: exited with {proc.returncode}\n{proc.stdout}{proc.stderr[-2000:]}")
+                    failed = True
+                    break
+
+            # Only what the agent adds on top of interpreter startup
+            imports = [item for item in parse_importtime(proc.stderr) if item[0] not in startup_modules]
+            import_ms = sum(self_us for _, self_us, _ in imports) / 1000
+            heavy = sorted({module.split('.')[0] for module, _, _ in imports} & set(HEAVY_MODULES))
+
+            print(f"{name:<20} {statistics.median(walls) * 1000:7.1f} ms wall "
+                  f"(+{(statistics.median(walls) - baseline_wall) * 1000:.1f} ms), "
+                  f"{import_ms:.1f} ms importing {len(imports)} modules")
+            for module, self_us, _ in sorted(imports, key=lambda item: item[1], reverse=True)[:args.top]:
+                print(f"    {self_us / 1000:6.1f} ms  {module}")
+            if heavy:
+                print(f"    ❌ loaded {', '.join(heavy)}")
+                failed = True
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
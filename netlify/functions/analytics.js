@@ -19,6 +19,8 @@ exports.handler = async (event, context) => {
     const GITHUB_TOKEN = process.env.GITHUB_TOKEN;
     const REPO_OWNER = process.env.GITHUB_REPO_OWNER || 'your-username';
     const REPO_NAME = process.env.GITHUB_REPO_NAME || 'responsible-ai-agent';
+    // Branch the daily workflow publishes the pipeline's dashboard.json rollups to
+    const DASHBOARD_BRANCH = process.env.DASHBOARD_DATA_BRANCH || 'dashboard-data';
 
     if (!GITHUB_TOKEN) {
       throw new Error('GITHUB_TOKEN not configured');
@@ -36,12 +38,14 @@ exports.handler = async (event, context) => {
     // Get all content review issues (both open and closed)
     const allIssuesUrl = `${baseUrl}/issues?labels=content-review&state=all&per_page=100&sort=created&direction=desc`;
     const workflowRunsUrl = `${baseUrl}/actions/runs?per_page=50&status=completed`;
+    const dashboardUrl = `${baseUrl}/contents/dashboard.json?ref=${encodeURIComponent(DASHBOARD_BRANCH)}`;
     
     console.log('Fetching analytics data...');
     
-    const [issuesResponse, workflowResponse] = await Promise.all([
+    const [issuesResponse, workflowResponse, dashboardResponse] = await Promise.all([
       fetch(allIssuesUrl, { headers: githubHeaders }),
-      fetch(workflowRunsUrl, { headers: githubHeaders })
+      fetch(workflowRunsUrl, { headers: githubHeaders }),
+      fetch(dashboardUrl, { headers: { ...githubHeaders, 'Accept': 'application/vnd.github.raw' } })
     ]);
 
     if (!issuesResponse.ok || !workflowResponse.ok) {
@@ -51,8 +55,14 @@ exports.handler = async (event, context) => {
     const allIssues = await issuesResponse.json();
     const workflowRuns = await workflowResponse.json();
 
+    // Precomputed daily/weekly/topic rollups; missing until the workflow has published them once
+    const dashboard = dashboardResponse.ok ? await dashboardResponse.json() : null;
+    if (!dashboard) {
+      console.log('dashboard.json not available (' + dashboardResponse.status + '), using issue data only');
+    }
+
     // Calculate analytics from real data
-    const analytics = calculateRealAnalytics(allIssues, workflowRuns.workflow_runs);
+    const analytics = calculateRealAnalytics(allIssues, workflowRuns.workflow_runs, dashboard);
 
     return {
       statusCode: 200,
@@ -65,7 +75,7 @@ exports.handler = async (event, context) => {
         analytics: analytics,
         timestamp: new Date().toISOString(),
         demo_mode: false,
-        data_source: 'github_api'
+        data_source: dashboard ? 'dashboard_json' : 'github_api'
       }, null, 2)
     };
 
@@ -99,7 +109,7 @@ exports.handler = async (event, context) => {
   }
 };
 
-function calculateRealAnalytics(allIssues, workflowRuns) {
+function calculateRealAnalytics(allIssues, workflowRuns, dashboard) {
   const now = new Date();
   const thirtyDaysAgo = new Date(now.getTime() - (30 * 24 * 60 * 60 * 1000));
   const sevenDaysAgo = new Date(now.getTime() - (7 * 24 * 60 * 60 * 1000));
@@ -139,9 +149,14 @@ function calculateRealAnalytics(allIssues, workflowRuns) {
     }
   });
 
-  const averageQualityScore = qualityScores.length > 0 
-    ? qualityScores.reduce((a, b) => a + b, 0) / qualityScores.length 
-    : 0;
+  // Prefer the pipeline's rollup over the scores scraped from review issues, which only
+  // cover runs that needed review
+  const rollupQuality = dashboard && dashboard.totals ? dashboard.totals.avg_quality : null;
+  const averageQualityScore = rollupQuality !== null && rollupQuality !== undefined
+    ? rollupQuality
+    : qualityScores.length > 0
+      ? qualityScores.reduce((a, b) => a + b, 0) / qualityScores.length
+      : 0;
 
   // Analyze workflow runs for pipeline performance
   const recentWorkflows = workflowRuns.filter(run => 
@@ -201,6 +216,7 @@ function calculateRealAnalytics(allIssues, workflowRuns) {
       low: qualityScores.filter(score => score < 6.0).length
     },
     topic_performance: topicPerformance,
+    pipeline: summarizeRollups(dashboard),
     workflow_stats: {
       total_runs: workflowRuns.length,
       successful_runs: successfulRuns,
@@ -209,6 +225,27 @@ function calculateRealAnalytics(allIssues, workflowRuns) {
   };
 }
 
+function summarizeRollups(dashboard) {
+  // Passed through as exported by AnalyticsStore.export_dashboard: column-oriented
+  // daily/weekly series and [topic, mentions] pairs, ready to chart
+  if (!dashboard || !dashboard.totals) {
+    return null;
+  }
+
+  return {
+    generated_at: dashboard.generated_at,
+    window_days: dashboard.window_days,
+    runs: dashboard.totals.runs,
+    approval_rate: dashboard.totals.approval_rate !== null
+      ? Math.round(dashboard.totals.approval_rate * 10000) / 100
+      : 0,
+    average_quality_score: dashboard.totals.avg_quality,
+    daily: dashboard.daily,
+    weekly: dashboard.weekly,
+    topics: dashboard.topics
+  };
+}
+
 function calculateMonthlyStats(issues) {
   const months = ['january', 'february', 'march', 'april', 'may', 'june',
     'july', 'august', 'september', 'october', 'november', 'december'];
@@ -410,6 +410,10 @@ function buildDashboardHTML() {
                             <span>Avg Quality</span>
                             <span id="avgQuality">-</span>
                         </div>
+                        <div class="metric">
+                            <span>Pipeline Runs (30d)</span>
+                            <span id="pipelineRuns">-</span>
+                        </div>
                     </div>
 
                     <div class="section">
@@ -612,6 +616,10 @@ function buildDashboardHTML() {
             document.getElementById('weeklyEntries').textContent = stats.recent_entries || 0;
             document.getElementById('approvalRate2').textContent = Math.round(stats.approval_rate || 0) + '%';
             document.getElementById('avgQuality').textContent = (stats.average_quality_score || 0).toFixed(1) + '/10';
+            
+            // From the pipeline's precomputed dashboard.json rollups, when published
+            var pipeline = stats.pipeline || {};
+            document.getElementById('pipelineRuns').textContent = pipeline.runs || 0;
         }
 
         // Action functions
@@ -0,0 +1,184 @@
+import sqlite3
+from datetime import date, datetime, timedelta
+from typing import Dict, Iterable, List, Optional
+
+# Aggregates kept per day and per week (keyed by the week's Monday)
+ROLLUP_COLUMNS = (
+    'runs INTEGER NOT NULL,'
+    ' passed INTEGER NOT NULL,'
+    ' cached INTEGER NOT NULL,'
+    ' quality_sum REAL NOT NULL,'
+    ' quality_min REAL,'
+    ' quality_max REAL,'
+    ' voice_sum REAL NOT NULL,'
+    ' duration_sum REAL NOT NULL'
+)
+
+SCHEMA = [
+    f'CREATE TABLE IF NOT EXISTS daily_rollups (period TEXT PRIMARY KEY, {ROLLUP_COLUMNS})',
+    f'CREATE TABLE IF NOT EXISTS weekly_rollups (period TEXT PRIMARY KEY, {ROLLUP_COLUMNS})',
+    'CREATE TABLE IF NOT EXISTS topic_rollups ('
+    ' topic TEXT NOT NULL,'
+    ' day TEXT NOT NULL,'
+    ' mentions INTEGER NOT NULL,'
+    ' PRIMARY KEY (topic, day))',
+    'CREATE INDEX IF NOT EXISTS idx_topic_rollups_day ON topic_rollups (day)',
+]
+
+PERIOD_TABLES = {'daily': 'daily_rollups', 'weekly': 'weekly_rollups'}
+
+
+def week_start(day: date) -> date:
+    """Monday of the week containing `day`"""
+    return day - timedelta(days=day.weekday())
+
+
+def apply_run(conn: sqlite3.Connection, run_at: datetime, quality_score: Optional[float],
+              voice_alignment: Optional[float], passed: bool, from_cache: bool,
+              pipeline_duration: Optional[float], topics: Iterable[str]) -> None:
+    """Fold one run into the daily, weekly and topic rollups
+
+    Meant to run in the same transaction as the run's insert, so rollups
+    never drift from the raw tables.
+    """
+
+    quality_score = quality_score or 0.0
+    values = (1, int(bool(passed)), int(bool(from_cache)), quality_score, quality_score, quality_score,
+              voice_alignment or 0.0, pipeline_duration or 0.0)
+
+    day = run_at.date()
+    for table, period in (('daily_rollups', day), ('weekly_rollups', week_start(day))):
+        conn.execute(
+            f'INSERT INTO {table} (period, runs, passed, cached, quality_sum, quality_min, quality_max,'
+            ' voice_sum, duration_sum) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)'
+            ' ON CONFLICT (period) DO UPDATE SET'
+            ' runs = runs + excluded.runs,'
+            ' passed = passed + excluded.passed,'
+            ' cached = cached + excluded.cached,'
+            ' quality_sum = quality_sum + excluded.quality_sum,'
+            ' quality_min = MIN(COALESCE(quality_min, excluded.quality_min), excluded.quality_min),'
+            ' quality_max = MAX(COALESCE(quality_max, excluded.quality_max), excluded.quality_max),'
+            ' voice_sum = voice_sum + excluded.voice_sum,'
+            ' duration_sum = duration_sum + excluded.duration_sum',
+            (period.isoformat(),) + values
+        )
+
+    conn.executemany(
+        'INSERT INTO topic_rollups (topic, day, mentions) VALUES (?, ?, 1)'
+        ' ON CONFLICT (topic, day) DO UPDATE SET mentions = mentions + 1',
+        [(topic, day.isoformat()) for topic in dict.fromkeys(topics)]
+    )
+
+
+def rebuild(conn: sqlite3.Connection) -> int:
+    """Recompute every rollup from the runs still in the store; returns runs folded in
+
+    Rollups outlive retention compaction, so this is only for stores that
+    predate them or after a manual repair.
+    """
+
+    for table in ('daily_rollups', 'weekly_rollups', 'topic_rollups'):
+        conn.execute(f'DELETE FROM {table}')
+
+    topics_by_run: Dict[int, List[str]] = {}
+    for run_id, topic in conn.execute("SELECT run_id, topic FROM topics WHERE kind = 'trending' ORDER BY run_id, position"):
+        topics_by_run.setdefault(run_id, []).append(topic)
+
+    count = 0
+    rows = conn.execute(
+        'SELECT id, run_at, quality_score, voice_alignment, passed, from_cache, pipeline_duration FROM runs ORDER BY id'
+    ).fetchall()
+    for run_id, run_at, quality_score, voice_alignment, passed, from_cache, pipeline_duration in rows:
+        apply_run(conn, datetime.fromisoformat(run_at), quality_score, voice_alignment, passed, from_cache,
+                  pipeline_duration, topics_by_run.get(run_id, []))
+        count += 1
+
+    return count
+
+
+def query(conn: sqlite3.Connection, period: str = 'daily', since: Optional[date] = None,
+          limit: Optional[int] = None) -> List[Dict]:
+    """Rollups for `period` ('daily', 'weekly' or 'topic'), oldest first
+
+    Daily and weekly rows carry derived rates and averages; topic rows are
+    mention counts since `since`, most mentioned first.
+    """
+
+    since_key = since.isoformat() if since else ''
+
+    if period == 'topic':
+        rows = conn.execute(
+            'SELECT topic, SUM(mentions) AS mentions, COUNT(*) AS days, MAX(day) AS last_seen'
+            ' FROM topic_rollups WHERE day >= ? GROUP BY topic ORDER BY mentions DESC, topic'
+            + (' LIMIT ?' if limit else ''),
+            (since_key, limit) if limit else (since_key,)
+        ).fetchall()
+        return [{'topic': topic, 'mentions': mentions, 'days': days, 'last_seen': last_seen}
+                for topic, mentions, days, last_seen in rows]
+
+    if period not in PERIOD_TABLES:
+        raise ValueError(f"Unknown rollup period '{period}' (expected daily, weekly or topic)")
+
+    if period == 'weekly' and since:
+        since_key = week_start(since).isoformat()
+
+    # Newest `limit` periods, returned oldest first
+    rows = conn.execute(
+        'SELECT * FROM (SELECT period, runs, passed, cached, quality_sum, quality_min, quality_max, voice_sum,'
+        f' duration_sum FROM {PERIOD_TABLES[period]} WHERE period >= ? ORDER BY period DESC'
+        + (' LIMIT ?' if limit else '') + ') ORDER BY period',
+        (since_key, limit) if limit else (since_key,)
+    ).fetchall()
+
+    return [
+        {
+            'period': period_key,
+            'runs': runs,
+            'passed': passed,
+            'approval_rate': passed / runs,
+            'cache_hit_rate': cached / runs,
+            'avg_quality': quality_sum / runs,
+            'min_quality': quality_min,
+            'max_quality': quality_max,
+            'avg_voice_alignment': voice_sum / runs,
+            'avg_duration': duration_sum / runs
+        }
+        for period_key, runs, passed, cached, quality_sum, quality_min, quality_max, voice_sum, duration_sum in rows
+    ]
+
+
+def dashboard_summary(conn: sqlite3.Connection, days: int = 30, weeks: int = 12, top_topics: int = 20,
+                      now: Optional[datetime] = None) -> Dict:
+    """Compact, column-oriented rollups for the dashboard to chart directly"""
+
+    now = now or datetime.now()
+    since = (now - timedelta(days=days - 1)).date()
+
+    daily = query(conn, 'daily', since=since)
+    weekly = query(conn, 'weekly', limit=weeks)
+    topics = query(conn, 'topic', since=since, limit=top_topics)
+
+    runs = sum(row['runs'] for row in daily)
+    passed = sum(row['passed'] for row in daily)
+
+    def columns(rows: List[Dict]) -> Dict[str, List]:
+        return {
+            'period': [row['period'] for row in rows],
+            'runs': [row['runs'] for row in rows],
+            'approval_rate': [round(row['approval_rate'], 3) for row in rows],
+            'avg_quality': [round(row['avg_quality'], 3) for row in rows],
+            'avg_voice_alignment': [round(row['avg_voice_alignment'], 3) for row in rows]
+        }
+
+    return {
+        'generated_at': now.isoformat(timespec='seconds'),
+        'window_days': days,
+        'totals': {
+            'runs': runs,
+            'approval_rate': round(passed / runs, 3) if runs else None,
+            'avg_quality': round(sum(row['avg_quality'] * row['runs'] for row in daily) / runs, 3) if runs else None
+        },
+        'daily': columns(daily),
+        'weekly': columns(weekly),
+        'topics': [[row['topic'], row['mentions']] for row in topics]
+    }
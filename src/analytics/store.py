@@ -0,0 +1,250 @@
+import json
+import logging
+import sqlite3
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional
+
+from analytics import rollups
+from utils.serialization import dumps, write_json
+
+SCHEMA = [
+    'CREATE TABLE IF NOT EXISTS runs ('
+    ' id INTEGER PRIMARY KEY,'
+    ' run_at TEXT NOT NULL,'
+    ' quality_score REAL,'
+    ' voice_alignment REAL,'
+    ' passed INTEGER,'
+    ' action_taken TEXT,'
+    ' character_count INTEGER,'
+    ' model_used TEXT,'
+    ' from_cache INTEGER,'
+    ' pipeline_duration REAL,'
+    ' content TEXT,'
+    ' payload TEXT NOT NULL)',
+    # Covers quality_scores(), so score history is read from the index alone
+    'CREATE INDEX IF NOT EXISTS idx_runs_scores ON runs (run_at, quality_score, voice_alignment, passed)',
+    'DROP INDEX IF EXISTS idx_runs_run_at',
+
+    'CREATE TABLE IF NOT EXISTS articles ('
+    ' run_id INTEGER NOT NULL REFERENCES runs (id) ON DELETE CASCADE,'
+    ' position INTEGER NOT NULL,'
+    ' title TEXT,'
+    ' link TEXT,'
+    ' source TEXT,'
+    ' relevance_score REAL,'
+    ' published_timestamp REAL,'
+    ' data TEXT NOT NULL,'
+    ' PRIMARY KEY (run_id, position))',
+    'CREATE INDEX IF NOT EXISTS idx_articles_link ON articles (link)',
+
+    # kind is 'trending' (the run's shortlist) or 'trend' (the multi-day decayed ranking)
+    'CREATE TABLE IF NOT EXISTS topics ('
+    ' run_id INTEGER NOT NULL REFERENCES runs (id) ON DELETE CASCADE,'
+    ' kind TEXT NOT NULL,'
+    ' position INTEGER NOT NULL,'
+    ' topic TEXT NOT NULL,'
+    ' score REAL,'
+    ' PRIMARY KEY (run_id, kind, position))',
+    'CREATE INDEX IF NOT EXISTS idx_topics_topic ON topics (topic, run_id)',
+]
+
+
+class AnalyticsStore:
+    """Append-only SQLite store of pipeline runs with article and topic side tables
+
+    Every run is a new row, so same-day re-runs no longer overwrite each
+    other. Runs older than `retention_days` are deleted (cascading to their
+    articles and topics) whenever a run is appended, and the freed pages
+    are returned to the filesystem. Daily, weekly and per-topic rollups
+    (see analytics.rollups) are updated in the same transaction and kept
+    past retention.
+    """
+
+    def __init__(self, path: str = 'data/analytics/analytics.sqlite3', retention_days: Optional[float] = 90):
+        self.logger = logging.getLogger(__name__)
+        self.path = Path(path)
+        self.retention_days = retention_days
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with self._connect() as conn:
+            # Only takes effect before the first table exists
+            conn.execute('PRAGMA auto_vacuum = INCREMENTAL')
+            for statement in SCHEMA:
+                conn.execute(statement)
+
+            has_rollups = conn.execute("SELECT 1 FROM sqlite_master WHERE name = 'daily_rollups'").fetchone()
+            for statement in rollups.SCHEMA:
+                conn.execute(statement)
+            if not has_rollups:
+                rebuilt = rollups.rebuild(conn)
+                if rebuilt:
+                    self.logger.info("Built analytics rollups from %s stored runs", rebuilt)
+
+    def append_run(self, results: Dict, run_at: Optional[datetime] = None) -> int:
+        """Store one run's JSON-safe pipeline results; returns the run id"""
+
+        run_at = run_at or datetime.now()
+        research = results.get('research') or {}
+        content = results.get('content') or {}
+        quality = results.get('quality') or {}
+        posting = results.get('posting') or {}
+
+        # Articles and topics live in their own tables, so keep them out of the payload
+        payload = dict(results, research={
+            key: value for key, value in research.items() if key not in ('news_articles', 'trending_topics', 'topic_trends')
+        })
+
+        with self._connect() as conn:
+            cursor = conn.execute(
+                'INSERT INTO runs (run_at, quality_score, voice_alignment, passed, action_taken, character_count,'
+                ' model_used, from_cache, pipeline_duration, content, payload)'
+                ' VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)',
+                (
+                    run_at.isoformat(timespec='seconds'),
+                    quality.get('score'),
+                    content.get('quality_score'),
+                    quality.get('passed'),
+                    posting.get('action_taken'),
+                    len(content.get('content', '')),
+                    content.get('model_used'),
+                    content.get('from_cache'),
+                    results.get('pipeline_duration'),
+                    content.get('content'),
+                    dumps(payload)
+                )
+            )
+            run_id = cursor.lastrowid
+
+            conn.executemany(
+                'INSERT INTO articles (run_id, position, title, link, source, relevance_score, published_timestamp, data)'
+                ' VALUES (?, ?, ?, ?, ?, ?, ?, ?)',
+                [
+                    (run_id, position, article.get('title'), article.get('link'), article.get('source'),
+                     article.get('relevance_score'), article.get('published_timestamp'), dumps(article))
+                    for position, article in enumerate(research.get('news_articles') or [])
+                ]
+            )
+
+            topic_rows = [
+                (run_id, 'trending', position, topic, None)
+                for position, topic in enumerate(research.get('trending_topics') or [])
+            ]
+            topic_rows += [
+                (run_id, 'trend', position, trend['topic'], trend.get('score'))
+                for position, trend in enumerate(research.get('topic_trends') or [])
+            ]
+            conn.executemany('INSERT INTO topics (run_id, kind, position, topic, score) VALUES (?, ?, ?, ?, ?)', topic_rows)
+
+            rollups.apply_run(
+                conn, run_at, quality.get('score'), content.get('quality_score'), quality.get('passed'),
+                content.get('from_cache'), results.get('pipeline_duration'), research.get('trending_topics') or []
+            )
+
+        self.compact(now=run_at)
+        return run_id
+
+    def compact(self, now: Optional[datetime] = None) -> int:
+        """Delete runs past the retention window; returns how many were removed"""
+
+        if not self.retention_days:
+            return 0
+
+        cutoff = (now or datetime.now()) - timedelta(days=self.retention_days)
+        with self._connect() as conn:
+            deleted = conn.execute('DELETE FROM runs WHERE run_at < ?', (cutoff.isoformat(timespec='seconds'),)).rowcount
+
+        if deleted:
+            with self._connect() as conn:
+                conn.execute('PRAGMA incremental_vacuum')
+            self.logger.info("Compacted analytics store: removed %s runs older than %s days", deleted, self.retention_days)
+
+        return deleted
+
+    def quality_scores(self, days: float = 90, now: Optional[datetime] = None) -> List[Dict]:
+        """Quality and voice scores of every run in the last `days`, oldest first"""
+
+        since = (now or datetime.now()) - timedelta(days=days)
+        with self._connect() as conn:
+            rows = conn.execute(
+                'SELECT run_at, quality_score, voice_alignment, passed FROM runs WHERE run_at >= ? ORDER BY run_at',
+                (since.isoformat(timespec='seconds'),)
+            ).fetchall()
+        return [dict(row) for row in rows]
+
+    def stored_content(self, days: float = 90, now: Optional[datetime] = None) -> List[Dict]:
+        """Tweets stored in the last `days` with the scores they were given, oldest first"""
+
+        since = (now or datetime.now()) - timedelta(days=days)
+        with self._connect() as conn:
+            rows = conn.execute(
+                'SELECT id, run_at, content, model_used, voice_alignment, quality_score, passed'
+                ' FROM runs WHERE run_at >= ? ORDER BY run_at',
+                (since.isoformat(timespec='seconds'),)
+            ).fetchall()
+        return [dict(row) for row in rows]
+
+    def topic_counts(self, days: float = 90, kind: str = 'trending', now: Optional[datetime] = None) -> Dict[str, int]:
+        """How many runs in the last `days` listed each topic, most frequent first"""
+
+        since = (now or datetime.now()) - timedelta(days=days)
+        with self._connect() as conn:
+            rows = conn.execute(
+                'SELECT topics.topic, COUNT(*) AS runs FROM topics JOIN runs ON runs.id = topics.run_id'
+                ' WHERE topics.kind = ? AND runs.run_at >= ? GROUP BY topics.topic ORDER BY runs DESC, topics.topic',
+                (kind, since.isoformat(timespec='seconds'))
+            ).fetchall()
+        return {row['topic']: row['runs'] for row in rows}
+
+    def rollups(self, period: str = 'daily', days: Optional[float] = None, limit: Optional[int] = None,
+                now: Optional[datetime] = None) -> List[Dict]:
+        """Daily, weekly or per-topic aggregates, optionally for the last `days` only"""
+
+        since = ((now or datetime.now()) - timedelta(days=days)).date() if days else None
+        with self._connect() as conn:
+            return rollups.query(conn, period, since=since, limit=limit)
+
+    def export_dashboard(self, path: str = 'data/analytics/dashboard.json', days: int = 30,
+                         now: Optional[datetime] = None) -> Dict:
+        """Write the dashboard's precomputed rollups as one small JSON file"""
+
+        with self._connect() as conn:
+            summary = rollups.dashboard_summary(conn, days=days, now=now)
+
+        write_json(path, summary)
+
+        return summary
+
+    def run(self, run_id: int) -> Optional[Dict]:
+        """Reassemble one run's stored results, including its articles and topics"""
+
+        with self._connect() as conn:
+            row = conn.execute('SELECT payload FROM runs WHERE id = ?', (run_id,)).fetchone()
+            if row is None:
+                return None
+            articles = conn.execute('SELECT data FROM articles WHERE run_id = ? ORDER BY position', (run_id,)).fetchall()
+            topics = conn.execute(
+                'SELECT kind, topic, score FROM topics WHERE run_id = ? ORDER BY kind, position', (run_id,)
+            ).fetchall()
+
+        results = json.loads(row['payload'])
+        research = results.setdefault('research', {})
+        research['news_articles'] = [json.loads(article['data']) for article in articles]
+        research['trending_topics'] = [topic['topic'] for topic in topics if topic['kind'] == 'trending']
+        research['topic_trends'] = [{'topic': topic['topic'], 'score': topic['score']}
+                                    for topic in topics if topic['kind'] == 'trend']
+        return results
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        """Connection that commits on success and is always closed"""
+
+        conn = sqlite3.connect(self.path, timeout=10)
+        conn.row_factory = sqlite3.Row
+        conn.execute('PRAGMA foreign_keys = ON')
+        try:
+            with conn:
+                yield conn
+        finally:
+            conn.close()
@@ -0,0 +1,351 @@
+"""
+Offline backtest of the voice evaluator and quality gate
+Streams a JSONL or CSV corpus of tweets through both scorers without calling any API
+Quality checks come from config.yaml, so alternative gates can be compared with --config
+
+Usage: python backtest.py corpus.jsonl [--workers N] [--scores-out scores.jsonl] [--json]
+"""
+
+import argparse
+import csv
+import json
+import os
+import sys
+import time
+from collections import Counter, deque
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Iterator, List, Optional, Tuple, Union
+
+# Add src to Python path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from generation.voice_profile import VoiceProfile
+from quality.engine import QualityControlEngine
+from utils.config import load_config, get_section
+
+# Column names tried, in order, when --field isn't given
+CONTENT_FIELDS = ('content', 'text', 'tweet', 'full_text')
+# Voice alignment above this counts as on-voice, as in ResponsibleAIContentGenerator
+VOICE_ALIGNMENT_THRESHOLD = 0.75
+HISTOGRAM_BINS = 10
+
+# Per-process voice profile and quality engine, built once by _init_worker
+_profile: Optional[VoiceProfile] = None
+_engine: Optional[QualityControlEngine] = None
+
+
+class BacktestStats:
+    """Mergeable summary of scored rows whose size doesn't grow with the corpus
+
+    Scores only take a handful of distinct values, so exact distributions
+    are kept as counters of rounded scores.
+    """
+
+    def __init__(self):
+        self.rows = 0
+        self.invalid_rows = 0
+        self.passed = 0
+        self.on_voice = 0
+        self.voice_scores = Counter()
+        self.quality_scores = Counter()
+        self.character_counts = Counter()
+        self.issues = Counter()
+
+    def add(self, voice_score: float, quality_result: Dict) -> None:
+        self.rows += 1
+        self.passed += quality_result['passed']
+        self.on_voice += voice_score > VOICE_ALIGNMENT_THRESHOLD
+        self.voice_scores[round(voice_score, 4)] += 1
+        self.quality_scores[round(quality_result['score'], 4)] += 1
+        self.character_counts[quality_result['checks']['character_count']] += 1
+        for issue in quality_result['issues']:
+            # Drop the per-row detail, e.g. "Content too long (301/280 characters)"
+            self.issues[issue.split(' (')[0]] += 1
+
+    def merge(self, other: 'BacktestStats') -> None:
+        self.rows += other.rows
+        self.invalid_rows += other.invalid_rows
+        self.passed += other.passed
+        self.on_voice += other.on_voice
+        self.voice_scores.update(other.voice_scores)
+        self.quality_scores.update(other.quality_scores)
+        self.character_counts.update(other.character_counts)
+        self.issues.update(other.issues)
+
+    def report(self, elapsed: float) -> Dict:
+        return {
+            'rows': self.rows,
+            'invalid_rows': self.invalid_rows,
+            'elapsed_seconds': round(elapsed, 3),
+            'rows_per_second': round(self.rows / elapsed, 1) if elapsed > 0 else None,
+            'pass_rate': self._rate(self.passed),
+            'voice_alignment_rate': self._rate(self.on_voice),
+            'voice_alignment': _distribution(self.voice_scores),
+            'quality_score': _distribution(self.quality_scores),
+            'character_count': _distribution(self.character_counts),
+            'issues': {issue: {'count': count, 'rate': self._rate(count)}
+                       for issue, count in self.issues.most_common()}
+        }
+
+    def _rate(self, count: int) -> Optional[float]:
+        return round(count / self.rows, 4) if self.rows else None
+
+
+def _distribution(counts: Counter) -> Dict:
+    """Summary statistics and an equal-width histogram of a value counter"""
+
+    total = sum(counts.values())
+    if not total:
+        return {}
+
+    values = sorted(counts)
+    mean = sum(value * count for value, count in counts.items()) / total
+
+    def percentile(p: float) -> float:
+        rank = p * (total - 1)
+        seen = 0
+        for value in values:
+            seen += counts[value]
+            if seen > rank:
+                return value
+        return values[-1]
+
+    low, high = values[0], values[-1]
+    width = (high - low) / HISTOGRAM_BINS or 1
+    histogram = [0] * HISTOGRAM_BINS
+    for value, count in counts.items():
+        histogram[min(int((value - low) / width), HISTOGRAM_BINS - 1)] += count
+
+    return {
+        'mean': round(mean, 4),
+        'min': low,
+        'p10': percentile(0.10),
+        'p50': percentile(0.50),
+        'p90': percentile(0.90),
+        'max': high,
+        'histogram': [
+            {'from': round(low + i * width, 4), 'to': round(low + (i + 1) * width, 4), 'count': count}
+            for i, count in enumerate(histogram)
+        ]
+    }
+
+
+def _init_worker(voice_profile_path: str, quality_config: Dict, pass_threshold: Optional[float]) -> None:
+    global _profile, _engine
+    _profile = VoiceProfile.load(voice_profile_path)
+    _engine = QualityControlEngine(quality_config, pass_threshold)
+
+
+def _score_chunk(rows: List[Union[str, Dict]], field: Optional[str],
+                 keep_scores: bool) -> Tuple[BacktestStats, List[Dict]]:
+    """Score a chunk of raw JSONL lines or CSV rows in a worker process"""
+
+    stats = BacktestStats()
+    content_results = []
+    scores = []
+
+    for row in rows:
+        row = _parse_row(row)
+        content = _row_content(row, field)
+        if content is None:
+            stats.invalid_rows += 1
+            content_results.append(None)
+            continue
+
+        content_results.append({
+            'content': content,
+            'quality_score': _profile.evaluate(content),
+            'model_used': row.get('model_used') or 'unknown' if isinstance(row, dict) else 'unknown'
+        })
+
+    quality_results = iter(_engine.evaluate_batch([c for c in content_results if c is not None])['results'])
+
+    for content_result in content_results:
+        if content_result is None:
+            if keep_scores:
+                scores.append({'error': 'no content'})
+            continue
+
+        quality_result = next(quality_results)
+        stats.add(content_result['quality_score'], quality_result)
+
+        if keep_scores:
+            scores.append({
+                'voice_alignment': content_result['quality_score'],
+                'quality_score': quality_result['score'],
+                'passed': quality_result['passed'],
+                'issues': quality_result['issues']
+            })
+
+    return stats, scores
+
+
+def _parse_row(row: Union[str, Dict]):
+    """Decode a raw JSONL line; CSV rows arrive as dicts already"""
+
+    if not isinstance(row, str):
+        return row
+    try:
+        return json.loads(row)
+    except ValueError:
+        return None
+
+
+def _row_content(row, field: Optional[str]) -> Optional[str]:
+    if isinstance(row, str):
+        return row
+
+    if not isinstance(row, dict):
+        return None
+
+    for name in ((field,) if field else CONTENT_FIELDS):
+        content = row.get(name)
+        if isinstance(content, str):
+            return content
+    return None
+
+
+def iter_chunks(path: str, chunk_size: int, fmt: str, limit: Optional[int] = None) -> Iterator[List]:
+    """Lazily read the corpus in chunks; JSONL lines are left for workers to parse"""
+
+    count = 0
+    with open(path, 'r', encoding='utf-8', newline='') as f:
+        if fmt == 'csv':
+            csv.field_size_limit(sys.maxsize)
+            rows = csv.DictReader(f)
+        else:
+            rows = (line for line in f if line.strip())
+
+        chunk = []
+        for row in rows:
+            if limit is not None and count >= limit:
+                break
+            chunk.append(row)
+            count += 1
+            if len(chunk) >= chunk_size:
+                yield chunk
+                chunk = []
+        if chunk:
+            yield chunk
+
+
+def run_backtest(path: str, voice_profile_path: str = 'data/voice_profile.json', workers: Optional[int] = None,
+                 chunk_size: int = 2000, fmt: Optional[str] = None, field: Optional[str] = None,
+                 limit: Optional[int] = None, scores_out: Optional[str] = None,
+                 config_path: Optional[str] = None) -> Dict:
+    """Score every row of the corpus and return the aggregate report
+
+    At most two chunks per worker are in flight, and per-row scores are
+    written out in input order as chunks finish, so memory stays flat
+    regardless of corpus size.
+    """
+
+    fmt = fmt or ('csv' if path.lower().endswith('.csv') else 'jsonl')
+    workers = workers or os.cpu_count() or 1
+    keep_scores = scores_out is not None
+
+    # Build both scorers up front so a bad profile or config fails before any work starts
+    config = load_config(config_path)
+    quality_config = get_section(config, 'quality_control')
+    pass_threshold = get_section(config, 'responsible_ai.content_rules').get('quality_threshold')
+    VoiceProfile.load(voice_profile_path)
+    QualityControlEngine(quality_config, pass_threshold)
+
+    stats = BacktestStats()
+    started = time.perf_counter()
+    scores_file = open(scores_out, 'w', encoding='utf-8') if keep_scores else None
+
+    def collect(chunk_stats: BacktestStats, chunk_scores: List[Dict]) -> None:
+        stats.merge(chunk_stats)
+        for score in chunk_scores:
+            scores_file.write(json.dumps(score) + '\n')
+
+    try:
+        chunks = iter_chunks(path, chunk_size, fmt, limit)
+
+        if workers == 1:
+            _init_worker(voice_profile_path, quality_config, pass_threshold)
+            for chunk in chunks:
+                collect(*_score_chunk(chunk, field, keep_scores))
+        else:
+            with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                     initargs=(voice_profile_path, quality_config, pass_threshold)) as executor:
+                pending = deque()
+                for chunk in chunks:
+                    pending.append(executor.submit(_score_chunk, chunk, field, keep_scores))
+                    if len(pending) >= workers * 2:
+                        collect(*pending.popleft().result())
+                while pending:
+                    collect(*pending.popleft().result())
+    finally:
+        if scores_file:
+            scores_file.close()
+
+    report = stats.report(time.perf_counter() - started)
+    report.update({'corpus': path, 'format': fmt, 'workers': workers})
+    return report
+
+
+def print_report(report: Dict) -> None:
+    print("\n📊 BACKTEST RESULTS")
+    print("=" * 50)
+    print(f"Corpus: {report['corpus']} ({report['format']})")
+    print(f"Rows: {report['rows']:,} scored, {report['invalid_rows']:,} skipped")
+    print(f"Throughput: {report['rows_per_second'] or 0:,.0f} rows/s on {report['workers']} worker(s) "
+          f"({report['elapsed_seconds']:.2f}s)")
+
+    if not report['rows']:
+        return
+
+    print(f"Pass rate: {report['pass_rate']:.1%}")
+    print(f"Voice alignment > {VOICE_ALIGNMENT_THRESHOLD}: {report['voice_alignment_rate']:.1%}")
+
+    for name in ('voice_alignment', 'quality_score', 'character_count'):
+        dist = report[name]
+        print(f"\n{name}: mean {dist['mean']:.3f}, p10 {dist['p10']}, p50 {dist['p50']}, "
+              f"p90 {dist['p90']} (min {dist['min']}, max {dist['max']})")
+        peak = max(bucket['count'] for bucket in dist['histogram']) or 1
+        for bucket in dist['histogram']:
+            bar = '█' * round(30 * bucket['count'] / peak)
+            print(f"  {bucket['from']:>8.3f} – {bucket['to']:<8.3f} {bar} {bucket['count']:,}")
+
+    if report['issues']:
+        print("\nIssues:")
+        for issue, info in report['issues'].items():
+            print(f"  {issue}: {info['count']:,} ({info['rate']:.1%})")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Backtest voice alignment and quality gate scoring offline")
+    parser.add_argument('corpus', help="JSONL or CSV file of tweets")
+    parser.add_argument('--format', choices=['jsonl', 'csv'], help="Corpus format (default: from file extension)")
+    parser.add_argument('--field', help=f"Column holding the tweet text (default: first of {', '.join(CONTENT_FIELDS)})")
+    parser.add_argument('--config', help="config.yaml whose quality_control checks are applied (default: repo config)")
+    parser.add_argument('--voice-profile', default='data/voice_profile.json', help="Voice profile JSON")
+    parser.add_argument('--workers', type=int, help="Worker processes (default: CPU count)")
+    parser.add_argument('--chunk-size', type=int, default=2000, help="Rows per worker task")
+    parser.add_argument('--limit', type=int, help="Only score the first N rows")
+    parser.add_argument('--scores-out', help="Write per-row scores as JSONL, in input order")
+    parser.add_argument('--json', action='store_true', help="Print the report as JSON")
+    args = parser.parse_args()
+
+    report = run_backtest(
+        args.corpus,
+        voice_profile_path=args.voice_profile,
+        workers=args.workers,
+        chunk_size=args.chunk_size,
+        fmt=args.format,
+        field=args.field,
+        limit=args.limit,
+        scores_out=args.scores_out,
+        config_path=args.config
+    )
+
+    if args.json:
+        print(json.dumps(report, indent=2))
+    else:
+        print_report(report)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,125 @@
+"""
+Long-running scheduler that keeps one ResponsibleAIAgent warm between runs
+Research refreshes on a short interval; generation runs at the posting times
+"""
+
+import logging
+import signal
+import threading
+import time
+from datetime import datetime
+from typing import Dict, List, Optional
+
+import schedule
+
+from utils.config import get_section
+
+
+class AgentDaemon:
+    """Run research and the daily pipeline on `schedule`, reusing one agent
+
+    The agent's components are built once, so the voice profile, completion
+    cache, feed registry and the OpenAI and feed HTTP connection pools
+    survive between ticks. Every research tick saves a new research
+    snapshot (see research.snapshot), so the pipeline at posting time reuses
+    it and only pays for generation and quality control.
+
+    SIGINT and SIGTERM let a running job finish, then stop the loop and
+    close the agent's connections.
+    """
+
+    def __init__(self, agent, daemon_config: Optional[Dict] = None):
+        self.logger = logging.getLogger(__name__)
+        self.agent = agent
+
+        daemon_config = daemon_config or {}
+        posting_schedule = get_section(agent.config, 'responsible_ai.posting_schedule')
+        self.research_interval = daemon_config.get('research_interval_minutes', 60)
+        self.generation_times: List[str] = daemon_config.get('generation_times') or [posting_schedule.get('time', '12:00')]
+        self.timezone = daemon_config.get('timezone') or posting_schedule.get('timezone')
+        self.research_on_start = daemon_config.get('research_on_start', True)
+        self.max_idle_seconds = daemon_config.get('max_idle_seconds', 30)
+
+        self.scheduler = schedule.Scheduler()
+        self._stop = threading.Event()
+
+    def run(self) -> None:
+        """Block until a shutdown signal arrives"""
+
+        previous_handlers = {sig: signal.signal(sig, self._request_stop) for sig in (signal.SIGINT, signal.SIGTERM)}
+
+        try:
+            self.agent._initialize_components('news_researcher', 'content_generator', 'quality_engine', 'analytics_store')
+            self._schedule_jobs()
+
+            if self.research_on_start:
+                self.refresh_research()
+
+            while not self._stop.is_set():
+                self.scheduler.run_pending()
+                idle = self.scheduler.idle_seconds
+                self._stop.wait(min(max(idle if idle is not None else self.max_idle_seconds, 0), self.max_idle_seconds))
+        finally:
+            self.logger.info("🛑 Daemon stopping")
+            self.scheduler.clear()
+            self.agent.close()
+            for sig, handler in previous_handlers.items():
+                signal.signal(sig, handler)
+
+    def refresh_research(self) -> None:
+        """Research tick: fetch and save a new snapshot for the next generation to reuse"""
+
+        started = time.perf_counter()
+        refresh_research, self.agent.refresh_research = self.agent.refresh_research, True
+        try:
+            research = self.agent._execute_research_phase()
+            self.logger.info("🔄 Research refreshed in %.1fs: %d articles",
+                             time.perf_counter() - started, len(research['news_articles']))
+        except Exception as e:
+            self.logger.error("Research tick failed: %s", e)
+        finally:
+            self.agent.refresh_research = refresh_research
+
+    def generate(self) -> None:
+        """Generation tick: the daily pipeline, reusing the latest research snapshot"""
+
+        try:
+            result = self.agent.run_daily_pipeline()
+            self.logger.info("🕒 Scheduled run %s in %.1fs",
+                             'succeeded' if result['success'] else 'failed', result.get('pipeline_time', 0))
+        except Exception as e:
+            self.logger.error("Generation tick failed: %s", e)
+
+    def stop(self) -> None:
+        self._stop.set()
+
+    def _request_stop(self, signum, frame) -> None:
+        self.logger.info("Received %s; stopping after the current job", signal.Signals(signum).name)
+        self.stop()
+
+    def _schedule_jobs(self) -> None:
+        self.scheduler.every(self.research_interval).minutes.do(self.refresh_research)
+
+        for at_time in self.generation_times:
+            self.scheduler.every().day.at(*self._local_time(at_time)).do(self.generate)
+
+        self.logger.info("🗓️ Research every %s min; generation daily at %s %s", self.research_interval,
+                         ', '.join(self.generation_times), self.timezone or 'local time')
+
+    def _local_time(self, at_time: str) -> tuple:
+        """Arguments for Job.at(): schedule needs pytz for time zones, so convert when it is missing"""
+
+        if not self.timezone:
+            return (at_time,)
+
+        try:
+            import pytz  # noqa: F401
+            return (at_time, self.timezone)
+        except ImportError:
+            from zoneinfo import ZoneInfo
+
+            hour, minute = (int(part) for part in at_time.split(':')[:2])
+            zoned = datetime.now(ZoneInfo(self.timezone)).replace(hour=hour, minute=minute, second=0, microsecond=0)
+            local = zoned.astimezone().strftime('%H:%M')
+            self.logger.info("pytz is not installed; scheduling %s %s as %s local time", at_time, self.timezone, local)
+            return (local,)
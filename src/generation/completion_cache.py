@@ -0,0 +1,91 @@
+import hashlib
+import json
+import logging
+import sqlite3
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional
+
+
+class CompletionCache:
+    """Content-addressed SQLite cache of chat completions
+
+    Entries are keyed on a hash of everything that shapes the completion
+    (model, temperature, max_tokens, n and the exact messages). They expire
+    after `ttl_hours`, and once more than `max_entries` are stored the least
+    recently used ones are evicted.
+    """
+
+    def __init__(self, path: str = 'data/cache/completions.sqlite3', ttl_hours: float = 24, max_entries: int = 500):
+        self.logger = logging.getLogger(__name__)
+        self.path = Path(path)
+        self.ttl_seconds = ttl_hours * 3600
+        self.max_entries = max_entries
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with self._connect() as conn:
+            conn.execute(
+                'CREATE TABLE IF NOT EXISTS completions ('
+                ' key TEXT PRIMARY KEY,'
+                ' completions TEXT NOT NULL,'
+                ' created_at REAL NOT NULL,'
+                ' last_used_at REAL NOT NULL)'
+            )
+            conn.execute('CREATE INDEX IF NOT EXISTS idx_completions_last_used ON completions (last_used_at)')
+
+    @staticmethod
+    def make_key(request: Dict) -> str:
+        """Stable hash of the request fields that determine the completion"""
+
+        fields = {name: request.get(name) for name in ('model', 'temperature', 'max_tokens', 'n', 'messages')}
+        payload = json.dumps(fields, sort_keys=True, ensure_ascii=False, separators=(',', ':'))
+        return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+    def get(self, key: str) -> Optional[List[str]]:
+        """Cached completion texts for `key`, or None if missing or expired"""
+
+        now = time.time()
+        try:
+            with self._connect() as conn:
+                row = conn.execute(
+                    'SELECT completions FROM completions WHERE key = ? AND created_at >= ?',
+                    (key, now - self.ttl_seconds)
+                ).fetchone()
+                if row is None:
+                    return None
+                conn.execute('UPDATE completions SET last_used_at = ? WHERE key = ?', (now, key))
+            return json.loads(row[0])
+        except (sqlite3.Error, ValueError) as e:
+            self.logger.warning("Completion cache read failed: %s", e)
+            return None
+
+    def put(self, key: str, completions: List[str]) -> None:
+        """Store completion texts and apply TTL and LRU eviction"""
+
+        now = time.time()
+        try:
+            with self._connect() as conn:
+                conn.execute(
+                    'INSERT OR REPLACE INTO completions (key, completions, created_at, last_used_at) VALUES (?, ?, ?, ?)',
+                    (key, json.dumps(completions, ensure_ascii=False), now, now)
+                )
+                conn.execute('DELETE FROM completions WHERE created_at < ?', (now - self.ttl_seconds,))
+                conn.execute(
+                    'DELETE FROM completions WHERE key IN ('
+                    ' SELECT key FROM completions ORDER BY last_used_at DESC LIMIT -1 OFFSET ?)',
+                    (self.max_entries,)
+                )
+        except sqlite3.Error as e:
+            self.logger.warning("Completion cache write failed: %s", e)
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        """Connection that commits on success and is always closed"""
+
+        conn = sqlite3.connect(self.path, timeout=5)
+        try:
+            with conn:
+                yield conn
+        finally:
+            conn.close()
@@ -1,88 +1,289 @@
-import json
 import os
 import logging
 import random
-from typing import Dict, List
+import asyncio
+from typing import Callable, Dict, List, Optional, Tuple
 from datetime import datetime
+import httpx
 from openai import OpenAI
 
+from generation.completion_cache import CompletionCache
+from generation.openai_client import AsyncCompletionClient, RetryPolicy
+from generation.voice_profile import VoiceProfile, VoiceProfileError
+
 class ResponsibleAIContentGenerator:
     """Generate content using your authentic voice profile"""
     
-    def __init__(self):
+    def __init__(self, config: Optional[Dict] = None, pipeline_config: Optional[Dict] = None,
+                 transport: Optional[httpx.AsyncBaseTransport] = None, twitter_handle: Optional[str] = None):
         self.logger = logging.getLogger(__name__)
         
-        # Load your voice profile
+        # The account the prompts write as, with or without a leading @
+        self.twitter_handle = (twitter_handle or 'ResponsibleAI').lstrip('@')
+        
+        # Settings from the `apis.openai` section of config.yaml
+        openai_config = config or {}
+        self.model = openai_config.get('model', 'gpt-4o-mini')
+        self.max_tokens = openai_config.get('max_tokens', 120)
+        self.temperature = openai_config.get('temperature', 0.7)
+        self.timeout = openai_config.get('timeout', 30)
+        self.num_candidates = max(1, openai_config.get('candidates', 1))
+        self.max_connections = openai_config.get('max_connections', 10)
+        
+        # Fixed seed makes the system prompt, and so cache keys, reproducible
+        self.prompt_seed = openai_config.get('prompt_seed')
+        
+        # Content-addressed cache of completions for identical prompts
+        cache_config = openai_config.get('completion_cache') or {}
+        self.completion_cache = None
+        if cache_config.get('enabled', True):
+            self.completion_cache = CompletionCache(
+                path=cache_config.get('path', 'data/cache/completions.sqlite3'),
+                ttl_hours=cache_config.get('ttl_hours', 24),
+                max_entries=cache_config.get('max_entries', 500)
+            )
+        
+        # Backoff settings come from the `pipeline` section
+        self.retry_policy = RetryPolicy.from_config(pipeline_config, openai_config)
+        
+        # Load your voice profile (validated once, cached until the JSON changes)
+        self.voice_profile_path = openai_config.get('voice_profile', 'data/voice_profile.json')
         try:
-            with open('data/voice_profile.json', 'r') as f:
-                self.voice_data = json.load(f)
-                self.voice = self.voice_data['brand_voice_analysis']
+            self.voice_profile = VoiceProfile.load(self.voice_profile_path)
+            self.voice_data = self.voice_profile.data
+            self.voice = self.voice_profile.voice
         except FileNotFoundError:
-            self.logger.error("Voice profile not found! Please ensure data/voice_profile.json exists")
+            self.logger.error("Voice profile not found! Please ensure %s exists", self.voice_profile_path)
             raise
-        except KeyError:
-            self.logger.error("Invalid voice profile structure")
+        except VoiceProfileError as e:
+            self.logger.error("Invalid voice profile structure: %s", e)
             raise
         
         # Initialize OpenAI client (v1 API)
         api_key = os.getenv('OPENAI_API_KEY')
-        if not api_key:
+        if not api_key and transport is None:
             raise ValueError("OPENAI_API_KEY environment variable not set")
         
-        self.client = OpenAI(api_key=api_key)
+        # `transport` (e.g. StubTransport) replaces the network for offline runs; one that
+        # is async-only serves generate_tweet_async, and generate_tweet keeps the network
+        self.api_key = api_key or 'stub-key'
+        self.transport = transport
+        http_client = None
+        if isinstance(transport, httpx.BaseTransport):
+            http_client = httpx.Client(transport=transport, timeout=self.timeout)
         
-    def generate_tweet(self, research_data: Dict) -> Dict:
-        """Generate a tweet based on research data and your voice profile"""
+        # Retries are handled by our policy, not the SDK's
+        self.client = OpenAI(api_key=self.api_key, max_retries=0, http_client=http_client)
         
-        # Extract key info from research
-        trending_topics = research_data.get('trending_topics', [])
-        viral_content = research_data.get('viral_tweets', [])
-        news_articles = research_data.get('news_articles', [])
+        # Created on first async use, bound to that event loop
+        self._async_client = None
+        self._async_loop = None
         
-        # Build the prompt using your voice profile
-        prompt = self._build_generation_prompt(trending_topics, news_articles)
+    def generate_tweet(self, research_data: Dict, num_candidates: Optional[int] = None,
+                       candidate_scorer: Optional[Callable[[Dict], float]] = None,
+                       bypass_cache: bool = False) -> Dict:
+        """Generate a tweet based on research data and your voice profile
+        
+        With more than one candidate, all of them come back from a single
+        request (the `n` parameter) and the best one is returned, ranked by
+        `candidate_scorer` if given, otherwise by voice alignment. The others
+        are listed under 'candidates'. Identical requests are answered from
+        the completion cache unless `bypass_cache` is set.
+        """
+        
+        request, research_used = self._prepare_request(research_data, num_candidates)
         
         try:
-            # Use OpenAI v1 API
-            response = self.client.chat.completions.create(
-                model="gpt-4o-mini",  # Updated to better, cheaper model
-                messages=[
-                    {"role": "system", "content": self._get_system_prompt()},
-                    {"role": "user", "content": prompt}
-                ],
-                max_tokens=120,
-                temperature=0.7,
-                timeout=30  # Add timeout
-            )
+            completions = self._cached_completions(request, bypass_cache)
+            from_cache = completions is not None
             
-            generated_content = response.choices[0].message.content.strip()
+            if not from_cache:
+                # Use OpenAI v1 API, retrying transient failures
+                response = self.retry_policy.call(self.client.chat.completions.create, self.timeout, **request)
+                completions = self._completion_texts(response)
+                self._cache_completions(request, completions, bypass_cache)
             
-            # Quality check against your voice profile
-            quality_score = self._evaluate_voice_alignment(generated_content)
+            return self._select_from_completions(completions, research_used, candidate_scorer, from_cache)
             
-            return {
-                'content': generated_content,
-                'quality_score': quality_score,
-                'research_used': {
-                    'trending_topics': trending_topics[:3],
-                    'news_count': len(news_articles)
-                },
-                'generated_at': datetime.now().isoformat(),
-                'voice_alignment': quality_score > 0.75,
-                'model_used': 'gpt-4o-mini',
-                'character_count': len(generated_content)
-            }
+        except Exception as e:
+            self.logger.error("Error generating content: %s", e)
+            return self._get_fallback_content()
+    
+    async def generate_tweet_async(self, research_data: Dict, num_candidates: Optional[int] = None,
+                                   candidate_scorer: Optional[Callable[[Dict], float]] = None,
+                                   bypass_cache: bool = False) -> Dict:
+        """Async generate_tweet; concurrent calls share one pooled HTTP client"""
+        
+        request, research_used = self._prepare_request(research_data, num_candidates)
+        
+        try:
+            completions = self._cached_completions(request, bypass_cache)
+            from_cache = completions is not None
+            
+            if not from_cache:
+                client = self._get_async_client()
+                response = await client.create_chat_completion(**request)
+                completions = self._completion_texts(response)
+                self._cache_completions(request, completions, bypass_cache)
+            
+            return self._select_from_completions(completions, research_used, candidate_scorer, from_cache)
             
         except Exception as e:
-            self.logger.error(f"Error generating content: {e}")
+            self.logger.error("Error generating content: %s", e)
             return self._get_fallback_content()
     
+    async def aclose(self) -> None:
+        """Close the pooled async HTTP client"""
+        if self._async_client is not None:
+            await self._async_client.aclose()
+            self._async_client = None
+            self._async_loop = None
+    
+    def share_async_client(self, client: AsyncCompletionClient) -> None:
+        """Use a client owned by the caller (e.g. one pool and concurrency limit for many generators)
+        
+        Must be called from the event loop the client will run on; the caller
+        is responsible for closing it.
+        """
+        self._async_client = client
+        self._async_loop = asyncio.get_running_loop()
+    
+    def _get_async_client(self) -> AsyncCompletionClient:
+        """Shared async client for the running event loop"""
+        
+        loop = asyncio.get_running_loop()
+        if self._async_client is None or self._async_loop is not loop:
+            self._async_client = AsyncCompletionClient(
+                self.api_key,
+                retry_policy=self.retry_policy,
+                timeout=self.timeout,
+                max_connections=self.max_connections,
+                transport=self.transport
+            )
+            self._async_loop = loop
+        
+        return self._async_client
+    
+    def _prepare_request(self, research_data: Dict, num_candidates: Optional[int] = None) -> Tuple[Dict, Dict]:
+        """Chat completion arguments and a summary of the research used"""
+        
+        # Extract key info from research
+        trending_topics = research_data.get('trending_topics', [])
+        viral_content = research_data.get('viral_tweets', [])
+        news_articles = research_data.get('news_articles', [])
+        
+        # Build the prompt using your voice profile
+        prompt = self._build_generation_prompt(trending_topics, news_articles)
+        
+        request = {
+            'model': self.model,
+            'messages': [
+                {"role": "system", "content": self._get_system_prompt()},
+                {"role": "user", "content": prompt}
+            ],
+            'max_tokens': self.max_tokens,
+            'temperature': self.temperature,
+            'n': max(1, num_candidates or self.num_candidates)
+        }
+        research_used = {
+            'trending_topics': trending_topics[:3],
+            'news_count': len(news_articles)
+        }
+        
+        return request, research_used
+    
+    def _cached_completions(self, request: Dict, bypass_cache: bool) -> Optional[List[str]]:
+        if self.completion_cache is None or bypass_cache:
+            return None
+        
+        completions = self.completion_cache.get(CompletionCache.make_key(request))
+        if completions:
+            self.logger.info("♻️ Reusing cached completion for identical prompt")
+        return completions or None
+    
+    def _cache_completions(self, request: Dict, completions: List[str], bypass_cache: bool) -> None:
+        if self.completion_cache is not None and not bypass_cache and completions:
+            self.completion_cache.put(CompletionCache.make_key(request), completions)
+    
+    def _completion_texts(self, response) -> List[str]:
+        """Non-empty completion texts from a chat completion response"""
+        return [
+            choice.message.content.strip()
+            for choice in response.choices
+            if choice.message.content and choice.message.content.strip()
+        ]
+    
+    def _select_from_completions(self, completions: List[str], research_used: Dict,
+                                 candidate_scorer: Optional[Callable[[Dict], float]] = None,
+                                 from_cache: bool = False) -> Dict:
+        """Score completions and return the best candidate"""
+        
+        if not completions:
+            raise ValueError("OpenAI returned no usable completions")
+        
+        candidates = [self._build_content_result(content, research_used) for content in completions]
+        best = self._select_best_candidate(candidates, candidate_scorer)
+        best['from_cache'] = from_cache
+        
+        return best
+    
+    def _build_content_result(self, generated_content: str, research_used: Dict) -> Dict:
+        """Score one completion against your voice profile"""
+        
+        # Quality check against your voice profile
+        quality_score = self._evaluate_voice_alignment(generated_content)
+        
+        return {
+            'content': generated_content,
+            'quality_score': quality_score,
+            'research_used': dict(research_used),
+            'generated_at': datetime.now().isoformat(),
+            'voice_alignment': quality_score > 0.75,
+            'model_used': self.model,
+            'character_count': len(generated_content)
+        }
+    
+    def _select_best_candidate(self, candidates: List[Dict],
+                               candidate_scorer: Optional[Callable[[Dict], float]] = None) -> Dict:
+        """Rank candidates and return the best, keeping the runner-ups for review"""
+        
+        for candidate in candidates:
+            try:
+                selection_score = candidate_scorer(candidate) if candidate_scorer else candidate['quality_score']
+            except Exception as e:
+                self.logger.warning("Could not score candidate: %s", e)
+                selection_score = candidate['quality_score']
+            candidate['selection_score'] = selection_score
+        
+        # Ties go to the better voice match
+        ranked = sorted(candidates, key=lambda c: (c['selection_score'], c['quality_score']), reverse=True)
+        best = ranked[0]
+        best['candidates'] = [
+            {
+                'content': candidate['content'],
+                'quality_score': candidate['quality_score'],
+                'selection_score': candidate['selection_score'],
+                'character_count': candidate['character_count']
+            }
+            for candidate in ranked[1:]
+        ]
+        
+        if len(candidates) > 1:
+            # Joined here: log arguments are formatted later, on the logging listener thread
+            scores = ', '.join(f"{c['selection_score']:.2f}" for c in ranked)
+            self.logger.info("Selected best of %d candidates (scores: %s)", len(candidates), scores)
+        
+        return best
+    
     def _get_system_prompt(self) -> str:
         """Create system prompt based on your voice profile"""
         
         voice = self.voice
         
-        return f"""You are the @ResponsibleAI Twitter account with this personality:
+        # A fresh seeded generator gives the same prompt on every call
+        rng = random.Random(self.prompt_seed) if self.prompt_seed is not None else random
+        
+        return f"""You are the @{self.twitter_handle} Twitter account with this personality:
 
 CORE IDENTITY:
 - {voice['overall_personality']['personality_description']}
@@ -98,14 +299,14 @@ TONE: {voice['tone_characteristics']['primary_tone']}
 - Transparency: {voice['tone_characteristics']['tone_attributes']['transparency']}/10
 
 LANGUAGE STYLE:
-- Use signature phrases like: "{random.choice(voice['language_style']['signature_phrases'])}"
+- Use signature phrases like: "{rng.choice(voice['language_style']['signature_phrases'])}"
 - Power words: {', '.join(voice['language_style']['power_words'][:5])}
 - Avoid: {', '.join(voice['language_style']['avoided_language'][:3])}
 
 VOICE RULES:
-- {random.choice(voice['writing_guidelines']['do'])}
-- {random.choice(voice['writing_guidelines']['do'])}
-- Never: {random.choice(voice['writing_guidelines']['avoid'])}
+- {rng.choice(voice['writing_guidelines']['do'])}
+- {rng.choice(voice['writing_guidelines']['do'])}
+- Never: {rng.choice(voice['writing_guidelines']['avoid'])}
 
 Write tweets that sound like a knowledgeable friend sharing discoveries about responsible AI."""
 
@@ -127,7 +328,7 @@ Write tweets that sound like a knowledgeable friend sharing discoveries about re
         
         return f"""Current AI landscape: {context}
 
-Create a tweet for @ResponsibleAI that:
+Create a tweet for @{self.twitter_handle} that:
 
 1. ADDRESSES TRENDING TOPICS: Reference what people are discussing right now
 2. USES YOUR AUTHENTIC VOICE: Sound like the conversational mentor you are
@@ -148,51 +349,7 @@ Tweet:"""
 
     def _evaluate_voice_alignment(self, content: str) -> float:
         """Evaluate how well the content matches your voice profile"""
-        
-        voice = self.voice
-        score = 0.0
-        max_score = 6.0  # Total possible points
-        
-        content_lower = content.lower()
-        
-        # Check for signature phrases (1 point)
-        signature_phrases = voice['language_style']['signature_phrases']
-        for phrase in signature_phrases:
-            if phrase.lower() in content_lower:
-                score += 1.0
-                break
-        
-        # Check for power words (1 point)
-        power_words = voice['language_style']['power_words']
-        power_word_count = sum(1 for word in power_words if word.lower() in content_lower)
-        if power_word_count > 0:
-            score += 1.0
-        
-        # Check for avoided language (negative 0.5 points each)
-        avoided_language = voice['language_style']['avoided_language']
-        for avoid in avoided_language:
-            if avoid.lower() in content_lower:
-                score -= 0.5
-        
-        # Check for personal pronouns (1 point)
-        personal_pronouns = ['you', 'i', 'we', 'your', 'our']
-        if any(pronoun in content_lower.split() for pronoun in personal_pronouns):
-            score += 1.0
-        
-        # Check for question/engagement (1 point)
-        if '?' in content or any(word in content_lower for word in ['what', 'how', 'why', 'think', 'thoughts']):
-            score += 1.0
-        
-        # Check length appropriateness (1 point)
-        word_count = len(content.split())
-        if 15 <= word_count <= 35:  # Good Twitter length
-            score += 1.0
-        
-        # Check for hashtags (1 point)
-        if '#' in content:
-            score += 1.0
-        
-        return min(score / max_score, 1.0)  # Cap at 1.0
+        return self.voice_profile.evaluate(content)
     
     def _get_fallback_content(self) -> Dict:
         """Return fallback content if generation fails"""
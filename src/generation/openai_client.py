@@ -0,0 +1,159 @@
+import asyncio
+import logging
+import random
+import time
+from typing import Callable, Dict, Optional
+
+import httpx
+import openai
+from openai import AsyncOpenAI
+
+# HTTP statuses worth retrying: timeouts, conflicts, rate limits and server errors
+RETRYABLE_STATUS_CODES = {408, 409, 429, 500, 502, 503, 504}
+
+
+class RetryPolicy:
+    """Jittered exponential backoff within an overall deadline
+
+    `retries` extra attempts are made after the first one, waiting
+    `base_delay * backoff_multiplier ** attempt` (randomized between half and
+    the full value, and never less than a server's Retry-After) in between.
+    No attempt starts or waits past `deadline` seconds from the first one.
+    """
+
+    def __init__(self, retries: int = 3, backoff_multiplier: float = 2.0, base_delay: float = 1.0,
+                 max_delay: float = 30.0, deadline: float = 90.0):
+        self.logger = logging.getLogger(__name__)
+        self.retries = max(0, retries)
+        self.backoff_multiplier = backoff_multiplier
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.deadline = deadline
+
+    @classmethod
+    def from_config(cls, pipeline_config: Optional[Dict] = None, openai_config: Optional[Dict] = None) -> 'RetryPolicy':
+        """Build from the `pipeline` and `apis.openai` sections of config.yaml"""
+
+        pipeline_config = pipeline_config or {}
+        openai_config = openai_config or {}
+
+        return cls(
+            retries=pipeline_config.get('retry_attempts', 3),
+            backoff_multiplier=pipeline_config.get('backoff_multiplier', 2),
+            base_delay=openai_config.get('retry_base_delay', 1.0),
+            deadline=openai_config.get('deadline', 90)
+        )
+
+    def is_retryable(self, error: Exception) -> bool:
+        if isinstance(error, openai.APIConnectionError):  # includes APITimeoutError
+            return True
+        if isinstance(error, openai.APIStatusError):
+            return error.status_code in RETRYABLE_STATUS_CODES
+        return False
+
+    def backoff(self, attempt: int, error: Optional[Exception] = None) -> float:
+        """Seconds to wait before retry number `attempt` (0-based)"""
+
+        delay = min(self.max_delay, self.base_delay * self.backoff_multiplier ** attempt)
+        delay = random.uniform(delay / 2, delay)
+
+        retry_after = self._retry_after(error)
+        return max(delay, retry_after) if retry_after is not None else delay
+
+    def call(self, request: Callable, timeout: float, **kwargs):
+        """Run a blocking request with retries, passing each attempt's timeout"""
+
+        started = time.monotonic()
+
+        for attempt in range(self.retries + 1):
+            remaining = self.deadline - (time.monotonic() - started)
+            try:
+                return request(timeout=self._attempt_timeout(timeout, remaining), **kwargs)
+            except Exception as e:
+                delay = self._next_delay(attempt, e, started)
+                time.sleep(delay)
+
+    async def call_async(self, request: Callable, timeout: float, **kwargs):
+        """Await a request coroutine with retries, passing each attempt's timeout"""
+
+        started = time.monotonic()
+
+        for attempt in range(self.retries + 1):
+            remaining = self.deadline - (time.monotonic() - started)
+            try:
+                return await request(timeout=self._attempt_timeout(timeout, remaining), **kwargs)
+            except Exception as e:
+                delay = self._next_delay(attempt, e, started)
+                await asyncio.sleep(delay)
+
+    def _attempt_timeout(self, timeout: float, remaining: float) -> float:
+        if remaining <= 0:
+            raise TimeoutError(f"Request deadline of {self.deadline}s exhausted")
+        return min(timeout, remaining)
+
+    def _next_delay(self, attempt: int, error: Exception, started: float) -> float:
+        """Delay before the next attempt, re-raising `error` if we should give up"""
+
+        if attempt >= self.retries or not self.is_retryable(error):
+            raise error
+
+        delay = self.backoff(attempt, error)
+        if time.monotonic() - started + delay >= self.deadline:
+            raise error
+
+        self.logger.warning("OpenAI request failed (%s), retry %d/%d in %.1fs", error, attempt + 1, self.retries, delay)
+        return delay
+
+    def _retry_after(self, error: Optional[Exception]) -> Optional[float]:
+        response = getattr(error, 'response', None)
+        if response is None:
+            return None
+        try:
+            return float(response.headers.get('retry-after'))
+        except (TypeError, ValueError):
+            return None
+
+
+class AsyncCompletionClient:
+    """AsyncOpenAI wrapper with a pooled HTTP client and retry policy
+
+    One instance should be shared by every concurrent generation on an
+    event loop so they reuse the same connection pool. `transport` swaps
+    the network for something like generation.stub_transport.StubTransport.
+    `max_concurrency` caps requests in flight across all callers; a slot is
+    held per attempt, so backoff sleeps don't block other requests.
+    """
+
+    def __init__(self, api_key: str, retry_policy: Optional[RetryPolicy] = None, timeout: float = 30,
+                 max_connections: int = 10, transport: Optional[httpx.AsyncBaseTransport] = None,
+                 base_url: Optional[str] = None, max_concurrency: Optional[int] = None):
+        self.retry_policy = retry_policy or RetryPolicy()
+        self.timeout = timeout
+        self._semaphore = asyncio.Semaphore(max_concurrency) if max_concurrency else None
+
+        self._http_client = httpx.AsyncClient(
+            limits=httpx.Limits(max_connections=max_connections, max_keepalive_connections=max_connections),
+            timeout=timeout,
+            transport=transport
+        )
+        # Retries are handled by our policy, not the SDK's
+        self.client = AsyncOpenAI(api_key=api_key, http_client=self._http_client, max_retries=0, base_url=base_url)
+
+    async def create_chat_completion(self, **kwargs):
+        """chat.completions.create with backoff and a per-call deadline"""
+        return await self.retry_policy.call_async(self._create, self.timeout, **kwargs)
+
+    async def _create(self, **kwargs):
+        if self._semaphore is None:
+            return await self.client.chat.completions.create(**kwargs)
+        async with self._semaphore:
+            return await self.client.chat.completions.create(**kwargs)
+
+    async def aclose(self) -> None:
+        await self.client.close()
+
+    async def __aenter__(self) -> 'AsyncCompletionClient':
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
@@ -0,0 +1,81 @@
+import asyncio
+import itertools
+import json
+import threading
+import time
+from typing import Iterable, List, Optional, Union
+
+import httpx
+
+DEFAULT_STUB_TWEET = (
+    "Here's what I discovered: the best AI audits start with one simple question. "
+    "What would you ask first about the tools your team uses? #ResponsibleAI #AIEthics"
+)
+
+
+class StubTransport(httpx.MockTransport):
+    """Offline stand-in for the OpenAI chat completions endpoint
+
+    Works for both the sync and async OpenAI clients. Each request consumes
+    the next item of `script`:
+
+    - a string is returned as the completion text (for every choice of `n`)
+    - an int is returned as an HTTP error with that status code
+    - an exception instance is raised, e.g. httpx.ConnectTimeout
+
+    Once the script runs out, `default_content` is returned. Requests are
+    recorded in `requests` for inspection.
+    """
+
+    def __init__(self, script: Optional[Iterable[Union[str, int, Exception]]] = None,
+                 default_content: str = DEFAULT_STUB_TWEET, latency: float = 0.0):
+        self.script = list(script or [])
+        self.default_content = default_content
+        self.latency = latency
+        self.requests: List[dict] = []
+        self._ids = itertools.count(1)
+        self._lock = threading.Lock()
+        super().__init__(self._respond)
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        if self.latency:
+            time.sleep(self.latency)
+        request.read()
+        return self._respond(request)
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        # Simulated latency must not block other requests on the event loop
+        if self.latency:
+            await asyncio.sleep(self.latency)
+        await request.aread()
+        return self._respond(request)
+
+    def _respond(self, request: httpx.Request) -> httpx.Response:
+        body = json.loads(request.content or b'{}')
+
+        with self._lock:
+            self.requests.append(body)
+            step = self.script.pop(0) if self.script else self.default_content
+            request_id = next(self._ids)
+
+        if isinstance(step, Exception):
+            raise step
+
+        if isinstance(step, int):
+            return httpx.Response(
+                step,
+                json={'error': {'message': f'Stub error {step}', 'type': 'stub_error', 'code': str(step)}}
+            )
+
+        choices = [
+            {'index': i, 'message': {'role': 'assistant', 'content': step}, 'finish_reason': 'stop'}
+            for i in range(body.get('n') or 1)
+        ]
+        return httpx.Response(200, json={
+            'id': f'chatcmpl-stub-{request_id}',
+            'object': 'chat.completion',
+            'created': int(time.time()),
+            'model': body.get('model', 'stub'),
+            'choices': choices,
+            'usage': {'prompt_tokens': 0, 'completion_tokens': 0, 'total_tokens': 0}
+        })
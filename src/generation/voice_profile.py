@@ -0,0 +1,151 @@
+import json
+import logging
+from pathlib import Path
+from typing import Dict
+
+# (path, expected type) pairs every profile must provide under brand_voice_analysis
+REQUIRED_FIELDS = [
+    ('overall_personality.personality_description', str),
+    ('overall_personality.primary_traits', list),
+    ('target_audience.primary_audience', str),
+    ('target_audience.psychographics.pain_points', list),
+    ('target_audience.psychographics.motivations', list),
+    ('tone_characteristics.primary_tone', str),
+    ('tone_characteristics.tone_attributes.warmth', (int, float)),
+    ('tone_characteristics.tone_attributes.relatability', (int, float)),
+    ('tone_characteristics.tone_attributes.transparency', (int, float)),
+    ('language_style.signature_phrases', list),
+    ('language_style.power_words', list),
+    ('language_style.avoided_language', list),
+    ('writing_guidelines.do', list),
+    ('writing_guidelines.avoid', list),
+]
+
+# Lists the system prompt picks from, so they must not be empty
+NON_EMPTY_FIELDS = {
+    'language_style.signature_phrases',
+    'writing_guidelines.do',
+    'writing_guidelines.avoid',
+}
+
+PERSONAL_PRONOUNS = frozenset(['you', 'i', 'we', 'your', 'our'])
+ENGAGEMENT_WORDS = ('what', 'how', 'why', 'think', 'thoughts')
+
+
+class VoiceProfileError(ValueError):
+    """Raised when a voice profile file does not match the expected schema"""
+
+
+class VoiceProfile:
+    """Validated voice profile with precomputed lookups for fast scoring"""
+
+    def __init__(self, data: Dict, source: str = '<memory>'):
+        self.logger = logging.getLogger(__name__)
+        self.source = source
+        self.data = data
+        self.voice = self.validate(data, source)
+
+        language = self.voice['language_style']
+        self.signature_phrases = tuple(dict.fromkeys(p.lower() for p in language['signature_phrases']))
+        self.power_words = tuple(dict.fromkeys(w.lower() for w in language['power_words']))
+        # Duplicates count once per listing, like the original per-entry loop
+        self.avoided_language = tuple(a.lower() for a in language['avoided_language'])
+
+    @staticmethod
+    def validate(data: Dict, source: str = '<memory>') -> Dict:
+        """Check the schema, reporting every problem at once; returns brand_voice_analysis"""
+
+        if not isinstance(data, dict) or not isinstance(data.get('brand_voice_analysis'), dict):
+            raise VoiceProfileError(f"{source}: missing 'brand_voice_analysis' object")
+
+        voice = data['brand_voice_analysis']
+        problems = []
+
+        for dotted_path, expected_type in REQUIRED_FIELDS:
+            value = voice
+            for key in dotted_path.split('.'):
+                value = value.get(key) if isinstance(value, dict) else None
+                if value is None:
+                    break
+
+            if value is None:
+                problems.append(f"missing '{dotted_path}'")
+            elif not isinstance(value, expected_type) or isinstance(value, bool):
+                problems.append(f"'{dotted_path}' should be {_type_name(expected_type)}, got {type(value).__name__}")
+            elif isinstance(value, list):
+                if dotted_path in NON_EMPTY_FIELDS and not value:
+                    problems.append(f"'{dotted_path}' must not be empty")
+                if any(not isinstance(item, str) for item in value):
+                    problems.append(f"'{dotted_path}' should only contain strings")
+
+        if problems:
+            raise VoiceProfileError(f"{source}: invalid voice profile: " + '; '.join(problems))
+
+        return voice
+
+    @classmethod
+    def load(cls, path: str = 'data/voice_profile.json') -> 'VoiceProfile':
+        """Load and validate a profile from its JSON file"""
+
+        source = Path(path)
+        raw = source.read_bytes()  # FileNotFoundError propagates to the caller
+
+        try:
+            # strict=False tolerates raw tabs/newlines inside strings
+            data = json.loads(raw.decode('utf-8'), strict=False)
+        except (UnicodeDecodeError, json.JSONDecodeError) as e:
+            raise VoiceProfileError(f"{source}: not valid JSON: {e}") from e
+
+        return cls(data, str(source))
+
+    def evaluate(self, content: str) -> float:
+        """Score 0..1 for how well `content` matches the voice profile"""
+
+        score = 0.0
+        max_score = 6.0  # Total possible points
+
+        content_lower = content.lower()
+
+        # Signature phrase (1 point)
+        for phrase in self.signature_phrases:
+            if phrase in content_lower:
+                score += 1.0
+                break
+
+        # Power words (1 point)
+        for word in self.power_words:
+            if word in content_lower:
+                score += 1.0
+                break
+
+        # Avoided language (negative 0.5 points each)
+        for avoid in self.avoided_language:
+            if avoid in content_lower:
+                score -= 0.5
+
+        # Lowercased tokens, shared by the pronoun and length checks
+        words = content_lower.split()
+
+        # Personal pronouns (1 point)
+        if not PERSONAL_PRONOUNS.isdisjoint(words):
+            score += 1.0
+
+        # Question/engagement (1 point)
+        if '?' in content or any(word in content_lower for word in ENGAGEMENT_WORDS):
+            score += 1.0
+
+        # Length appropriateness (1 point)
+        if 15 <= len(words) <= 35:  # Good Twitter length
+            score += 1.0
+
+        # Hashtags (1 point)
+        if '#' in content:
+            score += 1.0
+
+        return min(score / max_score, 1.0)  # Cap at 1.0
+
+
+def _type_name(expected_type) -> str:
+    if isinstance(expected_type, tuple):
+        return 'a number'
+    return {str: 'a string', list: 'a list'}.get(expected_type, expected_type.__name__)
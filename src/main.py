@@ -5,74 +5,171 @@ Runs research → generation → quality control → posting pipeline
 
 import os
 import sys
-import json
-import logging
+import argparse
+from contextlib import nullcontext
 from datetime import datetime
+from functools import cached_property
 from typing import Dict, Optional
 from dotenv import load_dotenv
 
 # Add src to Python path
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
-# Import our modules
-from research.news_research import NewsResearcher
-from generation.content_generator import ResponsibleAIContentGenerator
+# Import our modules; research and generation (feedparser, requests, the
+# OpenAI SDK) are only imported when a component that needs them is built
+from analytics.store import AnalyticsStore
+from quality.engine import QualityControlEngine
 from utils.logger import setup_logging
+from utils.config import load_config, get_section
+from utils.serialization import write_json
 
 class ResponsibleAIAgent:
     """Main orchestration class for the AI content agent"""
     
-    def __init__(self):
+    def __init__(self, offline: bool = False, bypass_cache: bool = False, profiler: Optional[str] = None,
+                 refresh_research: bool = False):
         # Load environment variables
         load_dotenv()
         
+        # Load config.yaml
+        self.config = load_config()
+        
         # Setup logging
-        self.logger = setup_logging()
+        self.logger = setup_logging(get_section(self.config, 'logging'))
         self.logger.info("Initializing ResponsibleAI Agent...")
         
-        # Initialize components
+        # Skip the completion cache and always call OpenAI
+        self.bypass_cache = bypass_cache
+        
+        self.news_config = get_section(self.config, 'apis.news')
+        
+        # Re-runs within the freshness window reuse the last research snapshot unless refreshing
+        self.snapshot_config = self.news_config.get('snapshot') or {}
+        self.refresh_research = refresh_research
+        
+        # Per-stage timing, and optionally a cProfile/pyinstrument dump per run
+        self.instrumentation = get_section(self.config, 'instrumentation')
+        self.profiler = profiler or self.instrumentation.get('profiler')
+        self.metrics = None
+        
+        # Components are built on first use, so subcommands only pay for what they touch
+        self.offline = offline
+        analytics_config = get_section(self.config, 'analytics')
+        self.dashboard_file = analytics_config.get('dashboard_file', 'data/analytics/dashboard.json')
+        self.dashboard_days = analytics_config.get('dashboard_days', 30)
+    
+    @cached_property
+    def news_researcher(self):
+        from research.news_research import NewsResearcher
+        return NewsResearcher(self.news_config, offline=self.offline)
+    
+    @cached_property
+    def research_snapshots(self):
+        from research.snapshot import ResearchSnapshotStore
+        return ResearchSnapshotStore(
+            self.snapshot_config.get('path', 'data/cache/research_snapshot.json'),
+            max_age_minutes=self.snapshot_config.get('max_age_minutes', 180)
+        )
+    
+    @cached_property
+    def content_generator(self):
+        from generation.content_generator import ResponsibleAIContentGenerator
+        return ResponsibleAIContentGenerator(
+            get_section(self.config, 'apis.openai'),
+            get_section(self.config, 'pipeline'),
+            twitter_handle=get_section(self.config, 'responsible_ai').get('twitter_handle')
+        )
+    
+    @cached_property
+    def quality_engine(self) -> QualityControlEngine:
+        return QualityControlEngine(
+            get_section(self.config, 'quality_control'),
+            pass_threshold=get_section(self.config, 'responsible_ai.content_rules').get('quality_threshold')
+        )
+    
+    @cached_property
+    def analytics_store(self) -> AnalyticsStore:
+        analytics_config = get_section(self.config, 'analytics')
+        return AnalyticsStore(
+            analytics_config.get('store_file', 'data/analytics/analytics.sqlite3'),
+            retention_days=analytics_config.get('retention_days', 90)
+        )
+    
+    def _initialize_components(self, *names: str) -> None:
+        """Build the named components now, so configuration errors surface before any work"""
+        
         try:
-            self.news_researcher = NewsResearcher()
-            self.content_generator = ResponsibleAIContentGenerator()
-            
+            for name in names:
+                getattr(self, name)
             self.logger.info("✅ All components initialized successfully")
             
         except Exception as e:
-            self.logger.error(f"❌ Failed to initialize components: {e}")
+            self.logger.error("❌ Failed to initialize components: %s", e)
             raise
     
     def run_daily_pipeline(self) -> Dict:
         """Execute the complete daily content generation pipeline"""
         
+        from utils.metrics import StageMetrics, profiled
+        
+        self._initialize_components('news_researcher', 'content_generator', 'quality_engine', 'analytics_store')
+        
         pipeline_start = datetime.now()
-        self.logger.info(f"🚀 Starting daily pipeline at {pipeline_start}")
+        self.logger.info("🚀 Starting daily pipeline at %s", pipeline_start)
+        
+        if self.instrumentation.get('enabled', True):
+            self.metrics = StageMetrics(trace_memory=self.instrumentation.get('trace_memory', False))
+        self.news_researcher.metrics = self.metrics
+        
+        try:
+            with profiled(self.profiler, self.instrumentation.get('profile_dir', 'data/analytics/profiles')):
+                return self._run_phases(pipeline_start)
+        finally:
+            self._store_pipeline_metrics()
+            self.news_researcher.metrics = None
+    
+    def close(self) -> None:
+        """Release the HTTP connections of components that were built"""
+        
+        if 'news_researcher' in self.__dict__:
+            self.news_researcher.fetcher.close()
+        if 'content_generator' in self.__dict__:
+            self.content_generator.client.close()
+    
+    def _run_phases(self, pipeline_start: datetime) -> Dict:
+        """Run each pipeline phase under its own stage timer"""
         
         try:
             # Phase 1: Research
             self.logger.info("📊 Phase 1: Researching trending AI content...")
-            research_data = self._execute_research_phase()
+            with self._stage('research'):
+                research_data = self._execute_research_phase()
             
             # Phase 2: Content Generation
             self.logger.info("✍️ Phase 2: Generating content...")
-            content_result = self._execute_generation_phase(research_data)
+            with self._stage('generation'):
+                content_result = self._execute_generation_phase(research_data)
             
             # Phase 3: Quality Control
             self.logger.info("🔍 Phase 3: Quality control...")
-            quality_result = self._execute_quality_control(content_result)
+            with self._stage('quality_control'):
+                quality_result = self._execute_quality_control(content_result)
             
             # Phase 4: Posting Decision
             self.logger.info("🎯 Phase 4: Making posting decision...")
-            posting_result = self._execute_posting_phase(quality_result, content_result)
+            with self._stage('posting'):
+                posting_result = self._execute_posting_phase(quality_result, content_result)
             
             # Phase 5: Analytics & Learning
             self.logger.info("📈 Phase 5: Storing analytics...")
-            self._store_pipeline_results({
-                'research': research_data,
-                'content': content_result,
-                'quality': quality_result,
-                'posting': posting_result,
-                'pipeline_duration': (datetime.now() - pipeline_start).total_seconds()
-            })
+            with self._stage('analytics'):
+                self._store_pipeline_results({
+                    'research': research_data,
+                    'content': content_result,
+                    'quality': quality_result,
+                    'posting': posting_result,
+                    'pipeline_duration': (datetime.now() - pipeline_start).total_seconds()
+                })
             
             return {
                 'success': True,
@@ -85,39 +182,70 @@ class ResponsibleAIAgent:
             }
             
         except Exception as e:
-            self.logger.error(f"❌ Pipeline failed: {e}")
+            self.logger.error("❌ Pipeline failed: %s", e)
             return {
                 'success': False,
                 'error': str(e),
                 'pipeline_time': (datetime.now() - pipeline_start).total_seconds()
             }
     
+    def _stage(self, name: str):
+        """Time a pipeline phase when instrumentation is enabled"""
+        return self.metrics.stage(name) if self.metrics else nullcontext({})
+    
     def _execute_research_phase(self) -> Dict:
         """Execute research phase - gather trending content"""
         
+        snapshots_enabled = self.snapshot_config.get('enabled', True)
+        if snapshots_enabled and not self.refresh_research:
+            snapshot = self.research_snapshots.load(self.research_snapshots.config_key(self.news_config, offline=self.offline))
+            if snapshot:
+                self.logger.info(
+                    "♻️ Reusing research snapshot %s (%.0f min old, %s articles)",
+                    snapshot['snapshot_id'][:12], snapshot['snapshot_age_minutes'], len(snapshot['news_articles'])
+                )
+                return snapshot
+        
         research_results = {
             'news_articles': [],
             'trending_topics': [],
+            'topic_trends': [],
             'research_timestamp': datetime.now().isoformat()
         }
         
         try:
             # Get AI news articles
             self.logger.info("🔍 Researching AI news...")
-            news_articles = self.news_researcher.research_ai_news(hours_back=24)
+            news_articles = self.news_researcher.research_ai_news(hours_back=self.news_config.get('hours_back', 24))
             research_results['news_articles'] = news_articles
             
             # Extract trending topics
             trending_topics = self.news_researcher.get_trending_topics(news_articles)
             research_results['trending_topics'] = trending_topics
             
-            self.logger.info(f"📰 Found {len(news_articles)} relevant articles")
-            self.logger.info(f"🔥 Trending topics: {', '.join(trending_topics[:3])}")
+            # Topics trending over the last few days, not just today's shortlist
+            topic_trends = self.news_researcher.get_topic_trends()
+            research_results['topic_trends'] = topic_trends
+            
+            self.logger.info("📰 Found %s relevant articles", len(news_articles))
+            self.logger.info("🔥 Trending topics: %s", ', '.join(trending_topics[:3]))
+            if topic_trends:
+                self.logger.info("📈 Multi-day trends: %s", ', '.join(t['topic'] for t in topic_trends[:3]))
             
         except Exception as e:
-            self.logger.warning(f"Research phase warning: {e}")
+            self.logger.warning("Research phase warning: %s", e)
             # Continue with partial data
         
+        # Only snapshot research that found something, so a retry fetches again after a bad run
+        if snapshots_enabled and research_results['news_articles']:
+            try:
+                research_results['snapshot_id'] = self.research_snapshots.save(
+                    research_results, self.research_snapshots.config_key(self.news_config, offline=self.offline)
+                )
+                self.logger.info("💾 Research snapshot %s saved", research_results['snapshot_id'][:12])
+            except Exception as e:
+                self.logger.warning("Could not save research snapshot: %s", e)
+        
         return research_results
     
     def _execute_generation_phase(self, research_data: Dict) -> Dict:
@@ -125,85 +253,42 @@ class ResponsibleAIAgent:
         
         try:
             # Generate tweet content
-            content_result = self.content_generator.generate_tweet(research_data)
+            # Candidates are ranked with the same checks as the quality control phase
+            content_result = self.content_generator.generate_tweet(
+                research_data,
+                candidate_scorer=lambda candidate: self._evaluate_quality(candidate)['score'],
+                bypass_cache=self.bypass_cache
+            )
             
-            self.logger.info(f"✍️ Generated content: {content_result['content'][:50]}...")
-            self.logger.info(f"🎤 Voice alignment score: {content_result['quality_score']:.2f}")
-            self.logger.info(f"📏 Character count: {content_result.get('character_count', 0)}/280")
+            self.logger.info("✍️ Generated content: %s...", content_result['content'][:50])
+            self.logger.info("🎤 Voice alignment score: %.2f", content_result['quality_score'])
+            self.logger.info("📏 Character count: %s/280", content_result.get('character_count', 0))
             
             return content_result
             
         except Exception as e:
-            self.logger.error(f"Content generation failed: {e}")
+            self.logger.error("Content generation failed: %s", e)
             # Use fallback content
             return self.content_generator._get_fallback_content()
     
     def _execute_quality_control(self, content_result: Dict) -> Dict:
         """Execute quality control checks"""
         
-        content = content_result.get('content', '')
-        quality_checks = {
-            'voice_alignment': content_result.get('quality_score', 0),
-            'character_count': len(content),
-            'has_hashtags': '#' in content,
-            'has_engagement': '?' in content,
-            'timestamp': datetime.now().isoformat(),
-            'model_used': content_result.get('model_used', 'unknown')
-        }
-        
-        # Calculate overall quality score
-        checks_passed = 0.0
-        
-        # Voice alignment check (weight: 40%)
-        voice_score = quality_checks['voice_alignment']
-        if voice_score > 0.75:
-            checks_passed += 0.4
-        elif voice_score > 0.5:
-            checks_passed += 0.2
-        
-        # Length check (weight: 25%)
-        char_count = quality_checks['character_count']
-        if 50 <= char_count <= 280:
-            checks_passed += 0.25
-        elif char_count <= 320:
-            checks_passed += 0.1
-        
-        # Hashtag check (weight: 15%)
-        if quality_checks['has_hashtags']:
-            checks_passed += 0.15
-        
-        # Engagement check (weight: 15%)
-        if quality_checks['has_engagement']:
-            checks_passed += 0.15
-        
-        # Model check (weight: 5%)
-        if quality_checks['model_used'] != 'fallback':
-            checks_passed += 0.05
-        
-        overall_score = checks_passed
-        
-        quality_result = {
-            'score': overall_score,
-            'checks': quality_checks,
-            'passed': overall_score > 0.7,
-            'needs_review': overall_score <= 0.7,
-            'issues': []
-        }
-        
-        # Identify specific issues
-        if char_count > 280:
-            quality_result['issues'].append(f"Content too long ({char_count}/280 characters)")
-        if voice_score < 0.5:
-            quality_result['issues'].append(f"Low voice alignment ({voice_score:.2f})")
-        if not quality_checks['has_hashtags']:
-            quality_result['issues'].append("Missing hashtags")
+        quality_result = self._evaluate_quality(content_result)
         
-        self.logger.info(f"🔍 Quality score: {overall_score:.2f} ({'PASS' if quality_result['passed'] else 'NEEDS REVIEW'})")
+        self.logger.info("🔍 Quality score: %.2f (%s)", quality_result['score'], 'PASS' if quality_result['passed'] else 'NEEDS REVIEW')
         if quality_result['issues']:
-            self.logger.warning(f"Issues found: {', '.join(quality_result['issues'])}")
+            self.logger.warning("Issues found: %s", ', '.join(quality_result['issues']))
+        
+        timings = ', '.join(f"{name} {seconds * 1e6:.0f}µs" for name, seconds in quality_result['timings'].items())
+        self.logger.debug("Quality check timings: %s", timings)
         
         return quality_result
     
+    def _evaluate_quality(self, content_result: Dict) -> Dict:
+        """Score content against the quality checks without logging"""
+        return self.quality_engine.evaluate(content_result)
+    
     def _execute_posting_phase(self, quality_result: Dict, content_result: Dict) -> Dict:
         """Execute posting phase (or queue for review)"""
         
@@ -239,34 +324,36 @@ class ResponsibleAIAgent:
     def _store_pipeline_results(self, results: Dict) -> None:
         """Store pipeline results for analytics and learning"""
         
-        os.makedirs('data/analytics', exist_ok=True)
-        
-        date_str = datetime.now().strftime('%Y-%m-%d')
-        results_file = f'data/analytics/pipeline_results_{date_str}.json'
-        
         try:
-            sanitized_results = self._sanitize_for_json(results)
+            run_id = self.analytics_store.append_run(results)
             
-            with open(results_file, 'w', encoding='utf-8') as f:
-                json.dump(sanitized_results, f, indent=2, ensure_ascii=False)
+            self.logger.info("📊 Results stored as run %s in %s", run_id, self.analytics_store.path)
             
-            self.logger.info(f"📊 Results stored in {results_file}")
+            # Precomputed rollups so the dashboard reads one small file
+            self.analytics_store.export_dashboard(self.dashboard_file, days=self.dashboard_days)
             
         except Exception as e:
-            self.logger.error(f"Failed to store results: {e}")
+            self.logger.error("Failed to store results: %s", e)
     
-    def _sanitize_for_json(self, obj):
-        """Recursively sanitize object for JSON serialization"""
-        if isinstance(obj, dict):
-            return {k: self._sanitize_for_json(v) for k, v in obj.items()}
-        elif isinstance(obj, list):
-            return [self._sanitize_for_json(item) for item in obj]
-        elif hasattr(obj, 'isoformat'):
-            return obj.isoformat()
-        elif isinstance(obj, (str, int, float, bool)) or obj is None:
-            return obj
-        else:
-            return str(obj)
+    def _store_pipeline_metrics(self) -> None:
+        """Write this run's stage metrics next to the analytics results"""
+        
+        if not self.metrics:
+            return
+        
+        # One file per run, so a same-day re-run or retry keeps the failed run's timings
+        run_str = self.metrics.started_at.strftime('%Y-%m-%d_%H%M%S')
+        metrics_file = f'data/analytics/pipeline_metrics_{run_str}.json'
+        
+        try:
+            self.metrics.write(metrics_file)
+            summary = self.metrics.summary()
+            stages = ', '.join(f"{name} {total['wall_seconds']:.2f}s" for name, total in summary.items())
+            self.logger.info("⏱️ Stage timings: %s", stages)
+        except Exception as e:
+            self.logger.error("Failed to store metrics: %s", e)
+        finally:
+            self.metrics.close()
     
     def _set_github_output(self, name: str, value: str) -> None:
         """Set GitHub Actions output variable"""
@@ -275,9 +362,62 @@ class ResponsibleAIAgent:
             if github_output and os.path.exists(os.path.dirname(github_output)):
                 with open(github_output, 'a', encoding='utf-8') as f:
                     f.write(f"{name}={value}\n")
-                self.logger.debug(f"Set GitHub output: {name}={value[:50]}...")
+                self.logger.debug("Set GitHub output: %s=%s...", name, value[:50])
+        except Exception as e:
+            self.logger.warning("Could not set GitHub output %s: %s", name, e)
+    
+    def rescore_stored_runs(self, days: float = 30) -> Dict:
+        """Re-run voice and quality scoring on stored tweets with the current profile and checks"""
+        
+        from generation.voice_profile import VoiceProfile
+        
+        voice_profile = VoiceProfile.load(get_section(self.config, 'apis.openai').get('voice_profile', 'data/voice_profile.json'))
+        runs = self.analytics_store.stored_content(days=days)
+        
+        content_results = [
+            {'content': run['content'] or '', 'model_used': run['model_used'],
+             'quality_score': voice_profile.evaluate(run['content'] or '')}
+            for run in runs
+        ]
+        batch = self.quality_engine.evaluate_batch(content_results)
+        
+        changed = [
+            {'run_id': run['id'], 'run_at': run['run_at'], 'stored_score': run['quality_score'], 'score': result['score']}
+            for run, result in zip(runs, batch['results'])
+            if bool(run['passed']) != result['passed']
+        ]
+        
+        return {
+            'runs': len(runs),
+            'stored_pass_rate': sum(bool(run['passed']) for run in runs) / len(runs) if runs else None,
+            'pass_rate': sum(result['passed'] for result in batch['results']) / len(runs) if runs else None,
+            'changed_decisions': changed,
+            'timings': batch['timings']
+        }
+    
+    def rescore_text(self, content: str) -> Dict:
+        """Voice and quality scores for one draft tweet, without calling OpenAI"""
+        
+        from generation.voice_profile import VoiceProfile
+        
+        voice_profile = VoiceProfile.load(get_section(self.config, 'apis.openai').get('voice_profile', 'data/voice_profile.json'))
+        return self.quality_engine.evaluate({'content': content, 'quality_score': voice_profile.evaluate(content)})
+    
+    def run_persona_batch(self) -> Dict:
+        """Research once and draft a quality-checked tweet for every configured persona"""
+        
+        from persona_runner import PersonaBatchRunner
+        
+        batch = PersonaBatchRunner(self, get_section(self.config, 'personas')).run()
+        
+        batch_file = f"data/analytics/persona_batch_{datetime.now().strftime('%Y-%m-%d')}.json"
+        try:
+            write_json(batch_file, batch, indent=True)
+            self.logger.info("💾 Persona batch saved to %s", batch_file)
         except Exception as e:
-            self.logger.warning(f"Could not set GitHub output {name}: {e}")
+            self.logger.error("Failed to store persona batch: %s", e)
+        
+        return batch
     
     def test_full_pipeline(self) -> None:
         """Test the complete pipeline without posting"""
@@ -285,6 +425,10 @@ class ResponsibleAIAgent:
         print("🧪 Running full pipeline test...")
         print("=" * 50)
         
+        # Same-day test runs build identical prompts, so repeats hit the completion cache
+        if self.content_generator.prompt_seed is None:
+            self.content_generator.prompt_seed = datetime.now().date().toordinal()
+        
         result = self.run_daily_pipeline()
         
         print(f"\n📊 Pipeline Results:")
@@ -303,11 +447,74 @@ class ResponsibleAIAgent:
 def main():
     """Main entry point"""
     
+    parser = argparse.ArgumentParser(description="@ResponsibleAI content agent")
+    parser.add_argument('command', nargs='?', default='run', choices=['run', 'research', 'rescore', 'export-analytics', 'personas', 'daemon'],
+                        help="run the daily pipeline (default), only refresh the research snapshot, re-score stored "
+                             "tweets, export dashboard analytics, draft a tweet for every configured persona, "
+                             "or keep running on the configured schedule")
+    parser.add_argument('--test', action='store_true', help="Run the full pipeline without posting")
+    parser.add_argument('--offline', action='store_true', help="Replay research from the feed cache instead of the network")
+    parser.add_argument('--refresh-research', action='store_true',
+                        help="Research again even if a fresh research snapshot exists")
+    parser.add_argument('--no-cache', action='store_true', help="Always call OpenAI instead of reusing cached completions")
+    parser.add_argument('--profile', nargs='?', const='cprofile', choices=['cprofile', 'pyinstrument'],
+                        help="Dump a profile of the run to data/analytics/profiles")
+    parser.add_argument('--days', type=float, help="rescore/export-analytics: how many days of runs to cover")
+    parser.add_argument('--text', help="rescore: score this draft tweet instead of stored runs")
+    parser.add_argument('--output', help="export-analytics: where to write the dashboard JSON")
+    args = parser.parse_args()
+    
     try:
-        agent = ResponsibleAIAgent()
+        agent = ResponsibleAIAgent(offline=args.offline, bypass_cache=args.no_cache, profiler=args.profile,
+                                   refresh_research=args.refresh_research)
+        
+        if args.command == 'research':
+            research = agent._execute_research_phase()
+            print(f"Research snapshot {research.get('snapshot_id', 'not saved')[:12]}: "
+                  f"{len(research['news_articles'])} articles")
+            print(f"Trending topics: {', '.join(research['trending_topics'][:5])}")
+            if not research['news_articles']:
+                # No snapshot is saved, so the pipeline researches again and falls back to trending topics
+                print("No articles found; the pipeline will research again")
+            return
+        
+        if args.command == 'rescore':
+            if args.text is not None:
+                result = agent.rescore_text(args.text)
+                print(f"Quality Score: {result['score']:.2f} ({'PASS' if result['passed'] else 'NEEDS REVIEW'})")
+                print(f"Voice Alignment: {result['checks']['voice_alignment']:.2f}")
+                for issue in result['issues']:
+                    print(f"Issue: {issue}")
+                return
+            
+            summary = agent.rescore_stored_runs(days=args.days or 30)
+            print(f"Re-scored {summary['runs']} stored runs")
+            if summary['runs']:
+                print(f"Pass rate: {summary['stored_pass_rate']:.1%} stored → {summary['pass_rate']:.1%} with current checks")
+                for run in summary['changed_decisions']:
+                    print(f"Changed: run {run['run_id']} ({run['run_at']}) {run['stored_score']:.2f} → {run['score']:.2f}")
+            return
+        
+        if args.command == 'export-analytics':
+            output = args.output or agent.dashboard_file
+            summary = agent.analytics_store.export_dashboard(output, days=int(args.days or agent.dashboard_days))
+            print(f"Dashboard analytics written to {output} ({summary['totals']['runs']} runs)")
+            return
+        
+        if args.command == 'daemon':
+            from daemon import AgentDaemon
+            AgentDaemon(agent, get_section(agent.config, 'daemon')).run()
+            return
+        
+        if args.command == 'personas':
+            batch = agent.run_persona_batch()
+            for result in batch['personas']:
+                status = 'PASS' if result['passed'] else 'NEEDS REVIEW'
+                print(f"{result['persona']}: {result['quality_score']:.2f} ({status}) {result['content']}")
+            return
         
         # Check if running in test mode
-        if len(sys.argv) > 1 and sys.argv[1] == '--test':
+        if args.test:
             agent.test_full_pipeline()
         else:
             # Run normal pipeline
@@ -321,6 +528,7 @@ def main():
                 print(f"Ready to Post: {'Yes' if result.get('content_posted') else 'Needs Review'}")
             else:
                 print(f"Error: {result.get('error', 'Unknown error')}")
+                sys.exit(1)
     except Exception as e:
         print(f"Unexpected error in main: {e}")
         sys.exit(1)  # Optional: Exit with error code
@@ -0,0 +1,180 @@
+"""
+Batch runner for several personas sharing one research phase
+Each persona has its own voice profile and topic list; generations run concurrently
+"""
+
+import asyncio
+import logging
+import time
+from datetime import datetime
+from typing import Dict, List, Optional
+
+import httpx
+
+from generation.content_generator import ResponsibleAIContentGenerator
+from generation.openai_client import AsyncCompletionClient
+from utils.config import get_section
+
+
+class PersonaBatchRunner:
+    """Research once, then generate and quality-check a tweet per persona
+
+    Personas come from the `personas` section of config.yaml. Without one,
+    the agent's own handle, topics and voice profile form a single persona.
+    All generations share one pooled OpenAI client, and at most
+    `max_concurrency` requests are in flight across every persona.
+    """
+
+    def __init__(self, agent, personas_config: Optional[Dict] = None,
+                 transport: Optional[httpx.AsyncBaseTransport] = None):
+        self.logger = logging.getLogger(__name__)
+        self.agent = agent
+        self.transport = transport
+
+        personas_config = personas_config or {}
+        self.max_concurrency = max(1, personas_config.get('max_concurrency', 4))
+        self.personas = personas_config.get('profiles') or [self._default_persona()]
+
+        names = [persona.get('name') for persona in self.personas]
+        if not all(names) or len(set(names)) != len(names):
+            raise ValueError("Every persona needs a unique `name`")
+
+        # Prompts are written as the persona's handle; two personas sharing one would post as one account
+        handles = [self._handle(persona).lower() for persona in self.personas]
+        if len(set(handles)) != len(handles):
+            raise ValueError("Every persona needs a unique `twitter_handle` (defaults to responsible_ai.twitter_handle)")
+
+    def _default_persona(self) -> Dict:
+        brand_config = get_section(self.agent.config, 'responsible_ai')
+        return {
+            'name': brand_config.get('twitter_handle', 'default'),
+            'twitter_handle': brand_config.get('twitter_handle'),
+            'topics': brand_config.get('topics', []),
+        }
+
+    def _handle(self, persona: Dict) -> str:
+        handle = persona.get('twitter_handle') or get_section(self.agent.config, 'responsible_ai').get('twitter_handle')
+        return (handle or 'ResponsibleAI').lstrip('@')
+
+    def run(self) -> Dict:
+        """Run the batch and return a result per persona"""
+
+        self.agent._initialize_components('news_researcher', 'quality_engine')
+        batch_start = datetime.now()
+
+        started = time.perf_counter()
+        research_data = self.agent._execute_research_phase()
+        research_seconds = time.perf_counter() - started
+
+        generators = {persona['name']: self._build_generator(persona) for persona in self.personas}
+
+        started = time.perf_counter()
+        results = asyncio.run(self._generate_all(research_data, generators))
+        generation_seconds = time.perf_counter() - started
+
+        self.logger.info(
+            "👥 %s personas: research %.1fs, generation %.1fs (max %s concurrent requests)",
+            len(results), research_seconds, generation_seconds, self.max_concurrency
+        )
+
+        return {
+            'started_at': batch_start.isoformat(),
+            'research_seconds': research_seconds,
+            'generation_seconds': generation_seconds,
+            'articles': len(research_data.get('news_articles', [])),
+            'personas': results
+        }
+
+    def _build_generator(self, persona: Dict) -> ResponsibleAIContentGenerator:
+        """Generator using the persona's voice profile and any `openai` overrides"""
+
+        openai_config = dict(get_section(self.agent.config, 'apis.openai'), **(persona.get('openai') or {}))
+        if persona.get('voice_profile'):
+            openai_config['voice_profile'] = persona['voice_profile']
+
+        return ResponsibleAIContentGenerator(
+            openai_config,
+            get_section(self.agent.config, 'pipeline'),
+            transport=self.transport,
+            twitter_handle=self._handle(persona)
+        )
+
+    async def _generate_all(self, research_data: Dict,
+                            generators: Dict[str, ResponsibleAIContentGenerator]) -> List[Dict]:
+        first = next(iter(generators.values()))
+        client = AsyncCompletionClient(
+            first.api_key,
+            retry_policy=first.retry_policy,
+            timeout=first.timeout,
+            max_connections=self.max_concurrency,
+            transport=self.transport,
+            max_concurrency=self.max_concurrency
+        )
+
+        try:
+            for generator in generators.values():
+                generator.share_async_client(client)
+
+            return await asyncio.gather(*(
+                self._generate_for(persona, generators[persona['name']], research_data)
+                for persona in self.personas
+            ))
+        finally:
+            await client.aclose()
+
+    async def _generate_for(self, persona: Dict, generator: ResponsibleAIContentGenerator,
+                            research_data: Dict) -> Dict:
+        started = time.perf_counter()
+        persona_research = self._research_for(persona, research_data)
+
+        content_result = await generator.generate_tweet_async(
+            persona_research,
+            candidate_scorer=lambda candidate: self.agent._evaluate_quality(candidate)['score'],
+            bypass_cache=self.agent.bypass_cache
+        )
+        quality_result = self.agent._evaluate_quality(content_result)
+
+        self.logger.info(
+            "✍️ [%s] quality %.2f (%s): %s...",
+            persona['name'], quality_result['score'], 'PASS' if quality_result['passed'] else 'NEEDS REVIEW',
+            content_result['content'][:50]
+        )
+
+        return {
+            'persona': persona['name'],
+            'twitter_handle': f"@{generator.twitter_handle}",
+            'content': content_result.get('content', ''),
+            'quality_score': quality_result['score'],
+            'voice_alignment': content_result.get('quality_score', 0),
+            'passed': quality_result['passed'],
+            'issues': quality_result['issues'],
+            'model_used': content_result.get('model_used'),
+            'from_cache': content_result.get('from_cache', False),
+            'articles_used': len(persona_research.get('news_articles', [])),
+            'seconds': time.perf_counter() - started
+        }
+
+    def _research_for(self, persona: Dict, research_data: Dict) -> Dict:
+        """Narrow the shared research to articles mentioning the persona's topics
+
+        Falls back to all articles when none match, rather than prompting
+        with no news at all.
+        """
+
+        topics = [topic.lower() for topic in persona.get('topics') or []]
+        articles = research_data.get('news_articles', [])
+        if not topics or not articles:
+            return research_data
+
+        matching = [
+            article for article in articles
+            if any(topic in f"{article.get('title', '')} {article.get('summary', '')}".lower() for topic in topics)
+        ]
+        if not matching:
+            return research_data
+
+        return dict(
+            research_data,
+            news_articles=matching,
+            trending_topics=self.agent.news_researcher.get_trending_topics(matching)
+        )
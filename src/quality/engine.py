@@ -0,0 +1,247 @@
+import re
+import time
+from datetime import datetime
+from typing import Callable, Dict, List, Optional, Tuple
+
+# Used when config.yaml has no `quality_control` section; matches the original hard-coded gate
+DEFAULT_CHECKS = {
+    'voice_alignment': {'weight': 0.4, 'threshold': 0.75, 'partial_weight': 0.2, 'partial_threshold': 0.5},
+    'length': {'weight': 0.25, 'min_chars': 50, 'max_chars': 280, 'overflow_weight': 0.1, 'overflow_chars': 320},
+    'hashtags': {'weight': 0.15, 'required': True},
+    'engagement': {'weight': 0.15, 'patterns': ['?']},
+    'model_quality': {'weight': 0.05, 'exclude_fallback': True},
+}
+# Used when responsible_ai.content_rules has no quality_threshold
+DEFAULT_PASS_THRESHOLD = 0.7
+
+# A compiled check turns one item's features into (points, issue or None)
+Check = Callable[[Dict], Tuple[float, Optional[str]]]
+
+
+def _voice_alignment_check(settings: Dict) -> Check:
+    weight = settings.get('weight', 0.4)
+    threshold = settings.get('threshold', 0.75)
+    partial_weight = settings.get('partial_weight', weight / 2)
+    partial_threshold = settings.get('partial_threshold', 0.5)
+
+    def check(item: Dict) -> Tuple[float, Optional[str]]:
+        voice_score = item['voice_alignment']
+        issue = f"Low voice alignment ({voice_score:.2f})" if voice_score < partial_threshold else None
+        if voice_score > threshold:
+            return weight, issue
+        if voice_score > partial_threshold:
+            return partial_weight, issue
+        return 0.0, issue
+
+    return check
+
+
+def _length_check(settings: Dict) -> Check:
+    weight = settings.get('weight', 0.25)
+    min_chars = settings.get('min_chars', 50)
+    max_chars = settings.get('max_chars', 280)
+    overflow_weight = settings.get('overflow_weight', 0.0)
+    overflow_chars = settings.get('overflow_chars', max_chars)
+
+    def check(item: Dict) -> Tuple[float, Optional[str]]:
+        char_count = item['character_count']
+        issue = f"Content too long ({char_count}/{max_chars} characters)" if char_count > max_chars else None
+        if min_chars <= char_count <= max_chars:
+            return weight, issue
+        if char_count <= overflow_chars:
+            return overflow_weight, issue
+        return 0.0, issue
+
+    return check
+
+
+def _hashtags_check(settings: Dict) -> Check:
+    weight = settings.get('weight', 0.15)
+    missing_issue = "Missing hashtags" if settings.get('required', True) else None
+
+    def check(item: Dict) -> Tuple[float, Optional[str]]:
+        return (weight, None) if item['has_hashtags'] else (0.0, missing_issue)
+
+    return check
+
+
+def engagement_matcher(patterns: List[str]) -> Callable[[str], bool]:
+    """Test for engagement cues in lowercased text: words ("how") match whole words only, symbols ("?") anywhere"""
+
+    substrings = []
+    words = []
+    other = []
+    for pattern in (pattern.lower() for pattern in patterns):
+        starts_word = re.match(r'\w', pattern) is not None
+        ends_word = re.search(r'\w$', pattern) is not None
+        if starts_word and ends_word:
+            words.append(re.escape(pattern))
+        elif starts_word or ends_word:
+            other.append((r'\b' if starts_word else '') + re.escape(pattern) + (r'\b' if ends_word else ''))
+        else:
+            substrings.append(pattern)
+
+    # Symbols are cheap substring tests; words share one boundary check per position
+    alternatives = ([r'\b(?:' + '|'.join(words) + r')\b'] if words else []) + other
+    regex = re.compile('|'.join(alternatives)) if alternatives else None
+
+    def matches(text: str) -> bool:
+        if any(substring in text for substring in substrings):
+            return True
+        return regex is not None and regex.search(text) is not None
+
+    return matches
+
+
+def _engagement_check(settings: Dict) -> Check:
+    # The patterns are matched once in QualityControlEngine._features, so the
+    # reported has_engagement flag always agrees with this check
+    weight = settings.get('weight', 0.15)
+
+    def check(item: Dict) -> Tuple[float, Optional[str]]:
+        return (weight, None) if item['has_engagement'] else (0.0, None)
+
+    return check
+
+
+def _model_quality_check(settings: Dict) -> Check:
+    weight = settings.get('weight', 0.05)
+    exclude_fallback = settings.get('exclude_fallback', True)
+
+    def check(item: Dict) -> Tuple[float, Optional[str]]:
+        if exclude_fallback and item['model_used'] == 'fallback':
+            return 0.0, None
+        return weight, None
+
+    return check
+
+
+# Check types that can appear under quality_control.checks; a check's `type` defaults to its name
+CHECK_TYPES: Dict[str, Callable[[Dict], Check]] = {
+    'voice_alignment': _voice_alignment_check,
+    'length': _length_check,
+    'hashtags': _hashtags_check,
+    'engagement': _engagement_check,
+    'model_quality': _model_quality_check,
+}
+
+
+class QualityControlEngine:
+    """Quality gate compiled from the `quality_control` section of config.yaml
+
+    Each configured check becomes a closure over its settings, so scoring is
+    a walk over a flat list of functions. Batches are evaluated check by
+    check, which keeps per-check timing cheap and shows which check
+    dominates latency.
+    """
+
+    def __init__(self, config: Optional[Dict] = None, pass_threshold: Optional[float] = None):
+        """`pass_threshold` is responsible_ai.content_rules.quality_threshold; scores above it pass"""
+
+        config = config or {}
+        checks_config = config.get('checks') or DEFAULT_CHECKS
+        self.pass_threshold = pass_threshold if pass_threshold is not None else DEFAULT_PASS_THRESHOLD
+        self.checks: List[Tuple[str, float, Check]] = self._compile(checks_config)
+
+        engagement = [settings or {} for name, settings in checks_config.items()
+                      if (settings or {}).get('type', name) == 'engagement']
+        if len(engagement) > 1:
+            raise ValueError("Only one engagement quality check is supported")
+        self._has_engagement = engagement_matcher(engagement[0].get('patterns', ['?']) if engagement else ['?'])
+
+    @staticmethod
+    def _compile(checks_config: Dict) -> List[Tuple[str, float, Check]]:
+        compiled = []
+        for name, settings in checks_config.items():
+            settings = settings or {}
+            check_type = settings.get('type', name)
+            if check_type not in CHECK_TYPES:
+                raise ValueError(
+                    f"Unknown quality check type '{check_type}' for '{name}' "
+                    f"(expected one of: {', '.join(CHECK_TYPES)})"
+                )
+            compiled.append((name, settings.get('weight', 0.0), CHECK_TYPES[check_type](settings)))
+        return compiled
+
+    def evaluate(self, content_result: Dict) -> Dict:
+        """Score one generated tweet; the result carries per-check timings"""
+
+        clock = time.perf_counter
+        item = self._features(content_result)
+        score = 0.0
+        points_by_check = {}
+        issues = []
+        timings = {}
+
+        for name, _, check in self.checks:
+            check_started = clock()
+            points, issue = check(item)
+            timings[name] = clock() - check_started
+            score += points
+            points_by_check[name] = points
+            if issue:
+                issues.append(issue)
+
+        result = self._result(item, score, points_by_check, issues, datetime.now().isoformat())
+        result['timings'] = timings
+        return result
+
+    def evaluate_batch(self, content_results: List[Dict]) -> Dict:
+        """Score many tweets in one pass over the checks
+
+        Returns {'results': [...], 'timings': {check: seconds}, 'seconds': total}
+        where each result has the same shape as `evaluate` without timings.
+        """
+
+        started = time.perf_counter()
+        items = [self._features(content_result) for content_result in content_results]
+
+        scores = [0.0] * len(items)
+        issues: List[List[str]] = [[] for _ in items]
+        points_by_check = {}
+        timings = {}
+
+        for name, _, check in self.checks:
+            check_started = time.perf_counter()
+            outcomes = [check(item) for item in items]
+            timings[name] = time.perf_counter() - check_started
+
+            points_by_check[name] = [points for points, _ in outcomes]
+            for i, (points, issue) in enumerate(outcomes):
+                scores[i] += points
+                if issue:
+                    issues[i].append(issue)
+
+        timestamp = datetime.now().isoformat()
+        results = [
+            self._result(item, scores[i], {name: points[i] for name, points in points_by_check.items()},
+                         issues[i], timestamp)
+            for i, item in enumerate(items)
+        ]
+
+        return {'results': results, 'timings': timings, 'seconds': time.perf_counter() - started}
+
+    def _features(self, content_result: Dict) -> Dict:
+        """Values the checks read, computed once per tweet"""
+
+        content = content_result.get('content', '')
+        return {
+            'voice_alignment': content_result.get('quality_score', 0),
+            'character_count': len(content),
+            'has_hashtags': '#' in content,
+            'has_engagement': self._has_engagement(content.lower()),
+            'model_used': content_result.get('model_used', 'unknown')
+        }
+
+    def _result(self, item: Dict, score: float, points_by_check: Dict[str, float],
+                issues: List[str], timestamp: str) -> Dict:
+        checks = dict(item, timestamp=timestamp)
+
+        return {
+            'score': score,
+            'checks': checks,
+            'check_points': points_by_check,
+            'passed': score > self.pass_threshold,
+            'needs_review': score <= self.pass_threshold,
+            'issues': issues
+        }
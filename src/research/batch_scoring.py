@@ -0,0 +1,108 @@
+import re
+from concurrent.futures import ProcessPoolExecutor
+from typing import List
+
+import numpy as np
+
+from research.keyword_index import KeywordIndex
+
+# Joins texts into one corpus; neither a word character nor whitespace, so
+# it is a word boundary that multi-word keywords cannot span
+_SEPARATOR = '\x00'
+
+# Smallest share of texts worth shipping to another process
+_MIN_CHUNK = 5000
+
+
+class BatchRelevanceScorer:
+    """Score many article texts at once with array operations
+
+    The whole batch is lowercased and scanned with the KeywordIndex regex
+    in one pass. Matches become an (articles x keywords) count matrix, and
+    the containment expansion, per-keyword caps, weights and title boost
+    are applied to the matrix instead of per article. Keeping the count
+    matrix lets weights be re-tuned without scanning the texts again.
+    """
+
+    def __init__(self, keyword_index: KeywordIndex, max_score: float = 10.0, title_boost: float = 1.2):
+        self.keyword_index = keyword_index
+        self.max_score = max_score
+        self.title_boost = title_boost
+
+        terms = keyword_index.terms
+        term_columns = {term: i for i, term in enumerate(terms)}
+        weighted_terms = [term for term in terms if term in keyword_index.weights]
+
+        # Direct match counts times `expansion` gives counts that include
+        # keywords implied by longer matches, e.g. "ai" at the start of "ai safety"
+        expansion = np.eye(len(terms), dtype=np.int64)
+        for term in terms:
+            for other, occurrences in keyword_index.implied(term):
+                expansion[term_columns[term], term_columns[other]] += occurrences
+
+        self.term_columns = term_columns
+        self.weighted_terms = weighted_terms
+        self.projection = expansion[:, [term_columns[term] for term in weighted_terms]]
+        self.caps = np.array([keyword_index.weights[term][1] for term in weighted_terms], dtype=np.int64)
+        self.weights = np.array([keyword_index.weights[term][0] for term in weighted_terms], dtype=np.float64)
+
+        # Matched text -> column; the separator between texts leaves the
+        # keyword group empty and is marked with -1
+        self._hit_columns = dict(term_columns)
+        self._hit_columns[''] = -1
+        self._corpus_pattern = re.compile(f'{_SEPARATOR}|{keyword_index.pattern.pattern}')
+
+    def count_matrix(self, texts: List[str], workers: int = 1) -> np.ndarray:
+        """Weighted-keyword counts, one row per text and one column per weighted keyword
+
+        The regex scan dominates the cost, so large backfills can split the
+        texts across `workers` processes.
+        """
+
+        if workers > 1 and len(texts) >= workers * _MIN_CHUNK:
+            chunk_size = -(-len(texts) // workers)
+            chunks = [texts[i:i + chunk_size] for i in range(0, len(texts), chunk_size)]
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                return np.vstack(list(executor.map(self.count_matrix, chunks)))
+
+        num_texts = len(texts)
+        num_terms = len(self.term_columns)
+        if num_texts == 0:
+            return np.zeros((0, len(self.weighted_terms)), dtype=np.int64)
+
+        corpus = _SEPARATOR.join(text.replace(_SEPARATOR, ' ') if text else '' for text in texts).lower()
+
+        # Separators come back as hits too, so a running count of them gives each match's row
+        hits = self._corpus_pattern.findall(corpus)
+        columns = list(map(self._hit_columns.get, hits))
+
+        # Unseen hyphen/whitespace variants ("machine-learning") are resolved once
+        if None in columns:
+            for i, hit in enumerate(hits):
+                if columns[i] is None:
+                    columns[i] = self._hit_columns[hit] = self.term_columns[self.keyword_index.term_for(hit)]
+
+        columns = np.array(columns, dtype=np.int64)
+        is_separator = columns < 0
+        rows = np.cumsum(is_separator)[~is_separator]
+        columns = columns[~is_separator]
+
+        # Sparse (row, column) hits accumulated into a dense matrix
+        direct = np.bincount(rows * num_terms + columns, minlength=num_texts * num_terms)
+        direct = direct.reshape(num_texts, num_terms)
+
+        return direct @ self.projection
+
+    def score(self, texts: List[str], workers: int = 1) -> np.ndarray:
+        """Relevance scores matching NewsResearcher._calculate_relevance for each text"""
+        return self.score_counts(self.count_matrix(texts, workers), texts)
+
+    def score_counts(self, counts: np.ndarray, texts: List[str]) -> np.ndarray:
+        """Scores from a precomputed count matrix, e.g. to re-weight without rescanning"""
+
+        scores = np.minimum(counts, self.caps) @ self.weights
+
+        boosted = np.fromiter(('title' in text.lower() if text else False for text in texts), dtype=bool, count=len(texts))
+        scores[boosted] *= self.title_boost
+
+        return np.minimum(scores, self.max_score)
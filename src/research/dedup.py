@@ -0,0 +1,269 @@
+import hashlib
+import json
+import logging
+import os
+import random
+import re
+import threading
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+# Query parameters that only track where a click came from
+TRACKING_PARAMS = {'fbclid', 'gclid', 'mc_cid', 'mc_eid', 'ref', 'ref_src', 'cmpid', 'taid', 'guccounter'}
+
+TITLE_STOPWORDS = {
+    'a', 'an', 'the', 'and', 'or', 'of', 'to', 'in', 'on', 'for', 'with', 'at', 'by', 'from',
+    'as', 'is', 'are', 'be', 'it', 'its', 'this', 'that', 'new', 'says', 'say', 'over', 'who'
+}
+
+# MinHash parameters: 64 permutations in 16 bands of 4 rows. Titles with a
+# Jaccard similarity of 0.8 share at least one band with ~99.9% probability.
+NUM_PERMUTATIONS = 64
+BAND_ROWS = 4
+_MERSENNE_PRIME = (1 << 61) - 1
+_rng = random.Random(0x5EED)
+_PERMUTATIONS = [(_rng.randrange(1, _MERSENNE_PRIME), _rng.randrange(0, _MERSENNE_PRIME)) for _ in range(NUM_PERMUTATIONS)]
+
+
+def canonicalize_link(link: str) -> str:
+    """Normalize an article URL so syndicated copies of one link compare equal"""
+
+    if not link:
+        return ''
+
+    try:
+        parts = urlsplit(link.strip())
+    except ValueError:
+        return link.strip()
+
+    host = parts.netloc.lower()
+    if host.startswith('www.'):
+        host = host[4:]
+
+    query = [
+        (key, value) for key, value in parse_qsl(parts.query, keep_blank_values=True)
+        if not key.lower().startswith('utm_') and key.lower() not in TRACKING_PARAMS
+    ]
+    path = parts.path.rstrip('/') or '/'
+
+    return urlunsplit(('https', host, path, urlencode(sorted(query)), ''))
+
+
+def title_tokens(title: str) -> frozenset:
+    """Lowercased, lightly stemmed title words without stopwords"""
+
+    tokens = set()
+    for word in re.findall(r'[a-z0-9]+', (title or '').lower()):
+        if word in TITLE_STOPWORDS:
+            continue
+        if len(word) > 4 and word.endswith('es'):
+            word = word[:-2]
+        elif len(word) > 3 and word.endswith('s') and not word.endswith('ss'):
+            word = word[:-1]
+        tokens.add(word)
+
+    return frozenset(tokens)
+
+
+def title_signature(title: str) -> Optional[Tuple[int, ...]]:
+    """MinHash signature of a title's word set (None for empty titles)"""
+
+    tokens = title_tokens(title)
+    if not tokens:
+        return None
+
+    # Stable 64-bit token hashes (the builtin hash() is salted per process)
+    hashes = [int.from_bytes(hashlib.blake2b(token.encode('utf-8'), digest_size=8).digest(), 'big') for token in tokens]
+
+    return tuple(
+        min((a * h + b) % _MERSENNE_PRIME for h in hashes)
+        for a, b in _PERMUTATIONS
+    )
+
+
+def signature_similarity(first: Tuple[int, ...], second: Tuple[int, ...]) -> float:
+    """Estimated Jaccard similarity of two MinHash signatures"""
+    return sum(1 for x, y in zip(first, second) if x == y) / NUM_PERMUTATIONS
+
+
+def _bands(signature: Tuple[int, ...]) -> List[Tuple[int, Tuple[int, ...]]]:
+    return [(i, signature[i:i + BAND_ROWS]) for i in range(0, NUM_PERMUTATIONS, BAND_ROWS)]
+
+
+class ArticleDeduplicator:
+    """Merge syndicated copies of a story and suppress stories covered on earlier days
+
+    Duplicates are found by canonical link or by near-identical titles
+    (MinHash with LSH banding). Within a run, copies are folded into the
+    first article registered as extra entries in its `sources` list;
+    NewsResearcher registers feeds in configured order, so which copy
+    represents a story doesn't depend on download timing. Articles that made
+    the research shortlist are remembered in `history_file` for
+    `history_days` and skipped on later days.
+    """
+
+    def __init__(self, history_file: str = 'data/cache/article_history.json',
+                 similarity_threshold: float = 0.8, history_days: int = 14):
+        self.logger = logging.getLogger(__name__)
+        self.history_file = Path(history_file)
+        self.similarity_threshold = similarity_threshold
+        self.history_days = history_days
+
+        self._lock = threading.Lock()
+        self._history = []
+        self.start_run()
+
+    def start_run(self, use_history: bool = True) -> None:
+        """Reset the per-run index and (re)load articles covered on earlier days"""
+
+        with self._lock:
+            self._links = {}
+            self._band_index = {}
+            self._articles = []
+            self.merged_count = 0
+            self.suppressed_count = 0
+
+            self._history = self._load_history() if use_history else []
+            self._history_links = set()
+            self._history_band_index = {}
+
+            today = datetime.now().date().isoformat()
+            for record in self._history:
+                # Only earlier days are suppressed, so same-day re-runs see the same news
+                if record.get('covered_on', today) >= today:
+                    continue
+                if record.get('link'):
+                    self._history_links.add(record['link'])
+                signature = tuple(record['signature']) if record.get('signature') else None
+                if signature:
+                    for band in _bands(signature):
+                        self._history_band_index.setdefault(band, []).append(signature)
+
+    def absorb(self, title: str, link: str, source: str) -> bool:
+        """Fold an entry into a known article before it is scored
+
+        Returns True if the entry is a duplicate (merged or suppressed) and
+        needs no further processing.
+        """
+
+        canonical = canonicalize_link(link)
+        signature = title_signature(title)
+
+        with self._lock:
+            return self._absorb_locked(title, link, source, canonical, signature)
+
+    def add(self, article: Dict) -> bool:
+        """Register a scored article; returns False if it turned out to be a duplicate"""
+
+        title = article.get('title', '')
+        link = article.get('link', '')
+        canonical = canonicalize_link(link)
+        signature = title_signature(title)
+
+        with self._lock:
+            # Another feed may have registered the same story since absorb()
+            if self._absorb_locked(title, link, article.get('source', ''), canonical, signature):
+                return False
+
+            article['sources'] = [self._source_entry(title, link, article.get('source', ''))]
+            index = len(self._articles)
+            self._articles.append((article, signature))
+
+            if canonical:
+                self._links[canonical] = index
+            if signature:
+                for band in _bands(signature):
+                    self._band_index.setdefault(band, []).append(index)
+
+        return True
+
+    def record_covered(self, articles: Iterable[Dict]) -> None:
+        """Remember articles that made the shortlist and persist the history"""
+
+        today = datetime.now().date().isoformat()
+        cutoff = (datetime.now() - timedelta(days=self.history_days)).date().isoformat()
+
+        covered = []
+        for article in articles:
+            signature = title_signature(article.get('title', ''))
+            covered.append({
+                'link': canonicalize_link(article.get('link', '')),
+                'signature': list(signature) if signature else None,
+                'covered_on': today
+            })
+        covered_links = {record['link'] for record in covered if record['link']}
+
+        with self._lock:
+            # Same-day re-runs replace their earlier records instead of piling up
+            history = [
+                record for record in self._history
+                if record.get('covered_on', today) >= cutoff and record.get('link') not in covered_links
+            ]
+            history.extend(covered)
+            self._history = history
+
+        self._save_history(history)
+
+    def _absorb_locked(self, title: str, link: str, source: str,
+                       canonical: str, signature: Optional[Tuple[int, ...]]) -> bool:
+        if self._is_historical(canonical, signature):
+            self.suppressed_count += 1
+            return True
+
+        index = self._find(canonical, signature)
+        if index is None:
+            return False
+
+        article = self._articles[index][0]
+        article['sources'].append(self._source_entry(title, link, source))
+        self.merged_count += 1
+        return True
+
+    def _is_historical(self, canonical: str, signature: Optional[Tuple[int, ...]]) -> bool:
+        if canonical and canonical in self._history_links:
+            return True
+        if signature:
+            for band in _bands(signature):
+                for candidate in self._history_band_index.get(band, ()):
+                    if signature_similarity(signature, candidate) >= self.similarity_threshold:
+                        return True
+        return False
+
+    def _find(self, canonical: str, signature: Optional[Tuple[int, ...]]) -> Optional[int]:
+        if canonical and canonical in self._links:
+            return self._links[canonical]
+        if signature:
+            checked = set()
+            for band in _bands(signature):
+                for index in self._band_index.get(band, ()):
+                    if index in checked:
+                        continue
+                    checked.add(index)
+                    if signature_similarity(signature, self._articles[index][1]) >= self.similarity_threshold:
+                        return index
+        return None
+
+    def _source_entry(self, title: str, link: str, source: str) -> Dict:
+        return {'title': title, 'link': link, 'source': source}
+
+    def _load_history(self) -> List[Dict]:
+        try:
+            with open(self.history_file, 'r', encoding='utf-8') as f:
+                return json.load(f).get('articles', [])
+        except FileNotFoundError:
+            return []
+        except (OSError, ValueError, AttributeError) as e:
+            self.logger.warning("Ignoring unreadable article history %s: %s", self.history_file, e)
+            return []
+
+    def _save_history(self, history: List[Dict]) -> None:
+        try:
+            self.history_file.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.history_file.with_suffix(f'.{os.getpid()}.tmp')
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump({'articles': history}, f)
+            os.replace(tmp_path, self.history_file)
+        except OSError as e:
+            self.logger.warning("Could not save article history %s: %s", self.history_file, e)
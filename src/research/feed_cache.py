@@ -0,0 +1,154 @@
+import hashlib
+import json
+import logging
+import os
+import time
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import feedparser
+
+
+class FeedCache:
+    """On-disk cache of feed validators (ETag/Last-Modified) and parsed entries
+
+    One JSON file per feed URL. Records older than `ttl_hours` are treated as
+    missing, and the directory is trimmed to `max_size_mb` by evicting the
+    least recently used records first.
+    """
+
+    def __init__(self, cache_dir: str = 'data/cache/feeds', ttl_hours: float = 168, max_size_mb: float = 50):
+        self.logger = logging.getLogger(__name__)
+        self.cache_dir = Path(cache_dir)
+        self.ttl_seconds = ttl_hours * 3600
+        self.max_bytes = int(max_size_mb * 1024 * 1024)
+
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+
+    def get(self, url: str, ignore_ttl: bool = False) -> Optional[Dict]:
+        """Return the cached record for a feed, or None if missing or expired"""
+
+        path = self._path(url)
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                record = json.load(f)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            self.logger.warning("Discarding unreadable cache record for %s: %s", url, e)
+            self._remove(path)
+            return None
+
+        if not ignore_ttl and time.time() - record.get('validated_at', 0) > self.ttl_seconds:
+            self._remove(path)
+            return None
+
+        record['entries'] = [self._restore_entry(entry) for entry in record.get('entries', [])]
+
+        # Mark as recently used for LRU eviction
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+
+        return record
+
+    def contains(self, url: str) -> bool:
+        """Whether a record exists for the feed, without reading or expiring it"""
+        return self._path(url).exists()
+
+    def conditional_headers(self, record: Optional[Dict]) -> Dict[str, str]:
+        """Build If-None-Match / If-Modified-Since headers from a cached record"""
+
+        headers = {}
+        if not record:
+            return headers
+
+        if record.get('etag'):
+            headers['If-None-Match'] = record['etag']
+        if record.get('last_modified'):
+            headers['If-Modified-Since'] = record['last_modified']
+
+        return headers
+
+    def put(self, url: str, entries: List, response_headers: Dict[str, str]) -> None:
+        """Store parsed entries along with the validators the server sent"""
+
+        now = time.time()
+        record = {
+            'url': url,
+            'etag': response_headers.get('etag'),
+            'last_modified': response_headers.get('last-modified'),
+            'fetched_at': now,
+            'validated_at': now,
+            'entries': [dict(entry) for entry in entries],
+        }
+        self._write(self._path(url), record)
+
+    def mark_validated(self, url: str, record: Dict) -> None:
+        """Refresh a record after the server answered 304 Not Modified"""
+
+        updated = dict(record)
+        updated['validated_at'] = time.time()
+        self._write(self._path(url), updated)
+
+    def prune(self) -> int:
+        """Drop expired records and evict least recently used ones over the size limit"""
+
+        removed = 0
+        now = time.time()
+        files = []
+
+        for path in self.cache_dir.glob('*.json'):
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            # mtime is bumped on every write and read, so it doubles as last use
+            if now - stat.st_mtime > self.ttl_seconds:
+                removed += self._remove(path)
+            else:
+                files.append((stat.st_mtime, stat.st_size, path))
+
+        total_size = sum(size for _, size, _ in files)
+        for _, size, path in sorted(files):
+            if total_size <= self.max_bytes:
+                break
+            removed += self._remove(path)
+            total_size -= size
+
+        if removed:
+            self.logger.info("Feed cache pruned %s records", removed)
+
+        return removed
+
+    def _path(self, url: str) -> Path:
+        return self.cache_dir / f"{hashlib.sha256(url.encode('utf-8')).hexdigest()[:32]}.json"
+
+    def _write(self, path: Path, record: Dict) -> None:
+        tmp_path = path.with_suffix(f'.{os.getpid()}.tmp')
+        try:
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                # struct_time values serialize as plain lists
+                json.dump(record, f, ensure_ascii=False, default=str)
+            os.replace(tmp_path, path)
+        except (OSError, TypeError, ValueError) as e:
+            self.logger.warning("Could not write feed cache record %s: %s", path.name, e)
+            self._remove(tmp_path)
+
+    def _remove(self, path: Path) -> int:
+        try:
+            path.unlink()
+            return 1
+        except OSError:
+            return 0
+
+    def _restore_entry(self, entry: Dict) -> feedparser.FeedParserDict:
+        """Rebuild an entry with attribute access and struct_time dates"""
+
+        restored = feedparser.FeedParserDict(entry)
+        for key, value in entry.items():
+            if key.endswith('_parsed') and isinstance(value, list) and len(value) == 9:
+                restored[key] = time.struct_time(value)
+
+        return restored
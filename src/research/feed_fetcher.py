@@ -0,0 +1,116 @@
+import logging
+import threading
+import time
+from contextlib import contextmanager
+from typing import Dict, Iterator, Optional, Tuple
+from urllib.parse import urlparse
+
+import requests
+
+
+class HostThrottle:
+    """Space out requests to the same host without blocking other hosts"""
+
+    def __init__(self, min_interval: float = 0.5):
+        self.min_interval = min_interval
+        self._next_allowed = {}
+        self._lock = threading.Lock()
+
+    def wait(self, url: str) -> None:
+        """Block until the host of `url` may be contacted again"""
+
+        if self.min_interval <= 0:
+            return
+
+        host = urlparse(url).netloc.lower()
+
+        # Reserve the next slot under the lock, sleep outside of it
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_allowed.get(host, 0.0))
+            self._next_allowed[host] = slot + self.min_interval
+
+        delay = slot - now
+        if delay > 0:
+            time.sleep(delay)
+
+
+class FeedFetcher:
+    """Download raw feed documents with a hard per-feed timeout and size cap
+
+    Requests share one session, so connections to a host are kept alive
+    between feeds and, in a long-running process, between runs.
+    """
+
+    def __init__(self, headers: Dict[str, str], timeout: float = 10, per_host_delay: float = 0.5,
+                 max_bytes: int = 5 * 1024 * 1024, pool_size: int = 10):
+        self.logger = logging.getLogger(__name__)
+        self.headers = dict(headers)
+        self.timeout = timeout
+        self.max_bytes = max_bytes
+        self.throttle = HostThrottle(per_host_delay)
+        self.chunk_size = 16 * 1024
+
+        self.session = requests.Session()
+        adapter = requests.adapters.HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+
+    @contextmanager
+    def stream(self, url: str, extra_headers: Optional[Dict[str, str]] = None
+               ) -> Iterator[Tuple[Iterator[bytes], Dict[str, str], int]]:
+        """Open a feed download as (body chunks, lowercased response headers, status code)
+
+        The timeout covers the whole download, not just each socket read,
+        so one slow host cannot hold a worker for longer than `timeout`.
+        The chunks stop after `max_bytes`, and the connection is closed as
+        soon as the block exits, so callers may stop reading early. A body
+        cut off at `max_bytes` drops the ETag/Last-Modified validators from
+        the headers, since they describe the whole document. A 304 Not
+        Modified answer to a conditional request has no chunks.
+        """
+
+        self.throttle.wait(url)
+        started = time.monotonic()
+
+        request_headers = dict(self.headers)
+        if extra_headers:
+            request_headers.update(extra_headers)
+
+        with self.session.get(url, headers=request_headers, timeout=self.timeout, stream=True) as response:
+            response.raise_for_status()
+            response_headers = {k.lower(): v for k, v in response.headers.items()}
+
+            if response.status_code == 304:
+                yield iter(()), response_headers, response.status_code
+                return
+
+            yield self._iter_body(url, response, response_headers, started), response_headers, response.status_code
+
+    def fetch(self, url: str, extra_headers: Optional[Dict[str, str]] = None) -> Tuple[bytes, Dict[str, str], int]:
+        """Fetch a whole (capped) feed body, its response headers and status code"""
+
+        with self.stream(url, extra_headers) as (chunks, response_headers, status):
+            return b''.join(chunks), response_headers, status
+
+    def close(self) -> None:
+        self.session.close()
+
+    def _iter_body(self, url: str, response: requests.Response, response_headers: Dict[str, str],
+                   started: float) -> Iterator[bytes]:
+        received = 0
+        for chunk in response.iter_content(chunk_size=self.chunk_size):
+            if self.max_bytes and received + len(chunk) > self.max_bytes:
+                # A conditional request must not later answer 304 for the truncated copy
+                response_headers.pop('etag', None)
+                response_headers.pop('last-modified', None)
+                yield chunk[:self.max_bytes - received]
+                self.logger.warning("Feed %s exceeds %d bytes; reading no further", url, self.max_bytes)
+                return
+
+            received += len(chunk)
+            yield chunk
+            if time.monotonic() - started > self.timeout:
+                raise TimeoutError(f"Fetching {url} exceeded {self.timeout}s")
+
+        self.logger.debug("Fetched %s (%d bytes) in %.2fs", url, received, time.monotonic() - started)
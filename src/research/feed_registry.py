@@ -0,0 +1,203 @@
+import json
+import logging
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple, Union
+
+# Used when config.yaml has no `apis.news.feeds` list: free RSS feeds focused on AI and tech
+DEFAULT_FEEDS = [
+    "https://feeds.feedburner.com/oreilly/radar",
+    "https://feeds.bbci.co.uk/news/technology/rss.xml",
+    "https://techcrunch.com/category/artificial-intelligence/feed/",
+    "https://www.wired.com/feed/category/business/artificial-intelligence/rss",
+    "https://rss.cnn.com/rss/cnn_tech.rss",
+    "https://www.theverge.com/ai-artificial-intelligence/rss/index.xml",
+    "https://venturebeat.com/category/ai/feed/",
+]
+
+# What to do with a source on this run
+POLL = 'poll'
+NOT_DUE = 'not_due'
+CIRCUIT_OPEN = 'circuit_open'
+
+# Weight of the newest observation in the latency, error-rate and yield averages
+_EWMA_ALPHA = 0.3
+
+
+def _ewma(previous: Optional[float], value: float) -> float:
+    return value if previous is None else previous + _EWMA_ALPHA * (value - previous)
+
+
+class FeedRegistry:
+    """Configured feed sources with adaptive polling, a circuit breaker and health stats
+
+    Each source is polled again after an interval learned from how often it
+    publishes: the average gap between its recent entries when it had new
+    ones, growing by half when it had none, within the configured bounds.
+    After `failure_threshold` failures in a row a source's circuit opens
+    and it is skipped for `cooldown_minutes`, doubling on every further
+    trip up to `max_cooldown_hours`; one success closes it again.
+
+    Per-source health (average latency, error rate, relevant articles per
+    poll) and scheduling state persist in `state_file` between runs.
+    """
+
+    def __init__(self, sources: Optional[Iterable[Union[str, Dict]]] = None,
+                 state_file: str = 'data/cache/feed_health.json', min_interval_minutes: float = 30,
+                 max_interval_minutes: float = 720, failure_threshold: int = 3,
+                 cooldown_minutes: float = 360, max_cooldown_hours: float = 72):
+        self.logger = logging.getLogger(__name__)
+        self.state_file = Path(state_file)
+        self.min_interval = min_interval_minutes * 60
+        self.max_interval = max_interval_minutes * 60
+        self.failure_threshold = failure_threshold
+        self.cooldown = cooldown_minutes * 60
+        self.max_cooldown = max_cooldown_hours * 3600
+
+        self.sources: Dict[str, Dict] = {}
+        for source in sources if sources is not None else DEFAULT_FEEDS:
+            source = {'url': source} if isinstance(source, str) else dict(source)
+            if source.get('enabled', True):
+                self.sources[source['url']] = source
+
+        self.state = self._load()
+        self._lock = threading.Lock()
+
+    @property
+    def urls(self) -> List[str]:
+        """Enabled source URLs in configured order"""
+        return list(self.sources)
+
+    def decide(self, url: str, now: Optional[float] = None) -> str:
+        """POLL, NOT_DUE (its interval hasn't passed) or CIRCUIT_OPEN"""
+
+        now = now or time.time()
+        with self._lock:
+            state = self.state.get(url)
+        if not state:
+            return POLL
+        if state.get('circuit_open_until') and now < state['circuit_open_until']:
+            return CIRCUIT_OPEN
+        if now < state.get('next_poll', 0):
+            return NOT_DUE
+        return POLL
+
+    def record_success(self, url: str, latency: float, entry_times: List[float], relevant: int,
+                       now: Optional[float] = None) -> None:
+        """Fold a successful poll into the source's stats and schedule its next poll
+
+        `entry_times` are the publication timestamps of the entries read.
+        """
+
+        now = now or time.time()
+        with self._lock:
+            state = self.state.setdefault(url, self._new_state())
+            interval = state.get('interval') or self._bounds(url)[0]
+
+            newest_known = state.get('newest_entry') or 0
+            new_entries = sum(1 for published in entry_times if published > newest_known)
+            if new_entries:
+                ordered = sorted(entry_times)
+                gap = (ordered[-1] - ordered[0]) / (len(ordered) - 1) if len(ordered) > 1 else interval / 2
+                interval = (interval + gap) / 2
+            else:
+                interval *= 1.5
+
+            min_interval, max_interval = self._bounds(url)
+            state['interval'] = min(max(interval, min_interval), max_interval)
+            state['next_poll'] = now + state['interval']
+            state['newest_entry'] = max([newest_known, *entry_times])
+
+            state['polls'] += 1
+            state['last_success'] = now
+            state['consecutive_failures'] = 0
+            state['trips'] = 0
+            state['circuit_open_until'] = None
+            state['avg_latency'] = _ewma(state.get('avg_latency'), latency)
+            state['error_rate'] = _ewma(state.get('error_rate'), 0.0)
+            state['avg_relevant'] = _ewma(state.get('avg_relevant'), relevant)
+            state['new_entries'] = new_entries
+            state['relevant_total'] += relevant
+
+    def record_failure(self, url: str, error: Exception, latency: float, now: Optional[float] = None) -> None:
+        """Count a failed poll, opening the circuit after too many in a row"""
+
+        now = now or time.time()
+        with self._lock:
+            state = self.state.setdefault(url, self._new_state())
+            state['polls'] += 1
+            state['failures'] += 1
+            state['consecutive_failures'] += 1
+            state['last_error'] = f"{type(error).__name__}: {error}"
+            state['last_failure'] = now
+            state['avg_latency'] = _ewma(state.get('avg_latency'), latency)
+            state['error_rate'] = _ewma(state.get('error_rate'), 1.0)
+            state['next_poll'] = now + self._bounds(url)[0]
+
+            if state['consecutive_failures'] >= self.failure_threshold:
+                state['trips'] += 1
+                cooldown = min(self.cooldown * 2 ** (state['trips'] - 1), self.max_cooldown)
+                state['circuit_open_until'] = now + cooldown
+                self.logger.warning(
+                    "Circuit open for %s after %d failures in a row; skipping it for %.0f minutes",
+                    url, state['consecutive_failures'], cooldown / 60
+                )
+
+    def health(self) -> Dict[str, Dict]:
+        """Stats per enabled source, for logs and reports"""
+
+        report = {}
+        with self._lock:
+            for url, source in self.sources.items():
+                state = self.state.get(url, {})
+                report[url] = {
+                    'name': source.get('name', url),
+                    'polls': state.get('polls', 0),
+                    'error_rate': state.get('error_rate'),
+                    'avg_latency': state.get('avg_latency'),
+                    'avg_relevant': state.get('avg_relevant'),
+                    'interval_minutes': state['interval'] / 60 if state.get('interval') else None,
+                    'circuit_open_until': state.get('circuit_open_until'),
+                    'last_error': state.get('last_error')
+                }
+        return report
+
+    def save(self) -> None:
+        """Persist scheduling state and stats atomically"""
+
+        with self._lock:
+            payload = {'version': 1, 'sources': dict(self.state)}
+        try:
+            self.state_file.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.state_file.with_suffix(f'.{os.getpid()}.tmp')
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(payload, f, separators=(',', ':'))
+            os.replace(tmp_path, self.state_file)
+        except OSError as e:
+            self.logger.warning("Could not save feed health %s: %s", self.state_file, e)
+
+    def _bounds(self, url: str) -> Tuple[float, float]:
+        """Polling interval bounds in seconds; a source may override them"""
+
+        source = self.sources.get(url, {})
+        return (source.get('min_interval_minutes', self.min_interval / 60) * 60,
+                source.get('max_interval_minutes', self.max_interval / 60) * 60)
+
+    def _new_state(self) -> Dict:
+        return {'polls': 0, 'failures': 0, 'consecutive_failures': 0, 'trips': 0, 'relevant_total': 0}
+
+    def _load(self) -> Dict[str, Dict]:
+        try:
+            with open(self.state_file, 'r', encoding='utf-8') as f:
+                payload = json.load(f)
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError) as e:
+            self.logger.warning("Ignoring unreadable feed health %s: %s", self.state_file, e)
+            return {}
+
+        if not isinstance(payload, dict) or payload.get('version') != 1:
+            return {}
+        return {url: dict(self._new_state(), **state) for url, state in payload.get('sources', {}).items()}
@@ -0,0 +1,150 @@
+import time
+import xml.etree.ElementTree as ET
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import List, Optional
+
+import feedparser
+
+# Local names of the elements that hold one entry in RSS 0.9x/1.0/2.0 and Atom
+ENTRY_TAGS = {'item', 'entry'}
+
+
+def _local_name(tag: str) -> str:
+    return tag.rsplit('}', 1)[-1]
+
+
+def parse_feed_date(value: Optional[str]) -> Optional[time.struct_time]:
+    """RFC 822 (RSS) or ISO 8601 (Atom) date as a UTC struct_time, like feedparser's *_parsed fields"""
+
+    if not value:
+        return None
+    value = value.strip()
+
+    try:
+        parsed = parsedate_to_datetime(value)
+    except (TypeError, ValueError, IndexError):
+        try:
+            parsed = datetime.fromisoformat(value)
+        except ValueError:
+            return None
+
+    if parsed.tzinfo is not None:
+        parsed = parsed.astimezone(timezone.utc).replace(tzinfo=None)
+    return parsed.timetuple()
+
+
+class StreamingFeedParser:
+    """Incremental RSS/Atom reader that yields entries as their closing tags arrive
+
+    Feed bytes are pushed in with `feed()`, which returns the entries
+    completed so far as feedparser-style dicts (title, link, summary,
+    content, published/updated and their *_parsed dates). Each entry's
+    element is discarded once converted, so memory stays at roughly one
+    entry however long the feed is. Entry content is truncated to
+    `max_content_chars`.
+
+    Feeds list newest entries first, so once `stale_limit` entries in a row
+    are older than `cutoff`, `done` is set and the rest of the feed can be
+    skipped. Stale entries are never returned. Malformed XML (e.g. an
+    HTML-only entity) raises xml.etree.ElementTree.ParseError.
+    """
+
+    def __init__(self, cutoff: Optional[datetime] = None, stale_limit: int = 3, max_content_chars: int = 10000):
+        self.cutoff = cutoff
+        self.stale_limit = stale_limit
+        self.max_content_chars = max_content_chars
+        self.entries_seen = 0
+        self.done = False
+        self._stale_run = 0
+        self._parser = ET.XMLPullParser(events=('start', 'end'))
+        self._open: List[ET.Element] = []
+
+    def feed(self, data: bytes) -> List[feedparser.FeedParserDict]:
+        """Parse another chunk and return the entries it completed"""
+
+        if self.done:
+            return []
+
+        self._parser.feed(data)
+        return self._drain()
+
+    def close(self) -> List[feedparser.FeedParserDict]:
+        """Finish parsing at the end of the document"""
+
+        if self.done:
+            return []
+
+        self._parser.close()
+        return self._drain()
+
+    def _drain(self) -> List[feedparser.FeedParserDict]:
+        entries = []
+
+        for event, element in self._parser.read_events():
+            if event == 'start':
+                self._open.append(element)
+                continue
+
+            self._open.pop()
+            if _local_name(element.tag) not in ENTRY_TAGS:
+                continue
+
+            entry = self._to_entry(element)
+            self.entries_seen += 1
+
+            # Drop the converted entry so the tree never holds more than one
+            element.clear()
+            if self._open:
+                self._open[-1].remove(element)
+
+            published = entry.get('published_parsed') or entry.get('updated_parsed')
+            if self.cutoff and published and datetime(*published[:6]) < self.cutoff:
+                self._stale_run += 1
+                if self._stale_run >= self.stale_limit:
+                    self.done = True
+                    break
+                continue
+
+            self._stale_run = 0
+            entries.append(entry)
+
+        return entries
+
+    def _to_entry(self, element: ET.Element) -> feedparser.FeedParserDict:
+        entry = feedparser.FeedParserDict()
+        content = None
+
+        for child in element:
+            name = _local_name(child.tag)
+            text = ''.join(child.itertext()).strip()
+
+            if name == 'title':
+                entry['title'] = text
+            elif name == 'link':
+                # Atom links carry the URL in href; prefer rel="alternate"
+                href = child.get('href')
+                if href is None:
+                    entry.setdefault('link', text)
+                elif child.get('rel', 'alternate') == 'alternate' or 'link' not in entry:
+                    entry['link'] = href
+            elif name in ('description', 'summary'):
+                entry['summary'] = text[:self.max_content_chars]
+            elif name in ('encoded', 'content'):
+                content = text[:self.max_content_chars]
+            elif name in ('pubDate', 'published', 'date', 'issued'):
+                entry.setdefault('published', text)
+            elif name in ('updated', 'modified'):
+                entry['updated'] = text
+            elif name in ('guid', 'id'):
+                entry['id'] = text
+
+        if content:
+            entry['content'] = [{'value': content}]
+
+        for field in ('published', 'updated'):
+            parsed = parse_feed_date(entry.get(field))
+            if parsed:
+                entry[f'{field}_parsed'] = parsed
+
+        return entry
@@ -0,0 +1,138 @@
+import re
+from typing import Dict, Iterable, List, Optional, Tuple
+
+# Keywords also match their plurals ("llms", "neural networks", "biases")
+_PLURAL_SUFFIX = r'(?:e?s)?'
+
+
+def _normalize_term(term: str) -> str:
+    return ' '.join(term.lower().split())
+
+
+def _trie_regex(terms: Iterable[str]) -> str:
+    """Regex matching any of `terms`, factored into a prefix trie
+
+    Python's regex engine tries alternatives one by one, so sharing prefixes
+    ("ai", "ai safety", "ai ethics", ...) makes scanning several times faster
+    than a flat alternation. Optional suffixes are greedy, so the longest
+    keyword wins, like a longest-first alternation.
+    """
+
+    trie = {}
+    for term in terms:
+        node = trie
+        for char in term:
+            node = node.setdefault(char, {})
+        node[''] = {}
+
+    def build(node: Dict) -> str:
+        branches = []
+        for char in sorted(key for key in node if key):
+            # Spaces also match hyphens and line breaks
+            piece = r'[\s\-]+' if char == ' ' else re.escape(char)
+            branches.append(piece + build(node[char]))
+
+        if not branches:
+            return ''
+
+        body = branches[0] if len(branches) == 1 else '(?:' + '|'.join(branches) + ')'
+        return f'(?:{body})?' if '' in node else body
+
+    return build(trie)
+
+
+class KeywordIndex:
+    """Compiled keyword matcher shared by filtering, relevance and topic extraction
+
+    All keywords are folded into one trie-shaped regex, so a single pass
+    over the lowercased text yields per-keyword counts. Keywords match
+    whole words and their plurals ("LLMs", "biases"). The regex is a
+    lookahead tried at every word, so overlapping keywords ("generative AI
+    ethics" holds "generative AI" and "AI ethics") are all found; it
+    reports the longest keyword starting at each word, and that keyword
+    credits the shorter ones it starts with ("AI safety" starts with
+    "AI"). Counts are therefore the same as scanning for every keyword
+    separately.
+    """
+
+    def __init__(self,
+                 filter_keywords: Iterable[str],
+                 weighted_keywords: Optional[Dict[str, Tuple[float, int]]] = None,
+                 topic_keywords: Optional[Iterable[str]] = None):
+        weighted_keywords = weighted_keywords or {}
+        topic_keywords = list(topic_keywords) if topic_keywords is not None else list(filter_keywords)
+
+        # Original spelling of each keyword, used when reporting topics
+        self.display_names = {}
+        for keyword in list(filter_keywords) + list(weighted_keywords) + topic_keywords:
+            self.display_names.setdefault(_normalize_term(keyword), keyword)
+
+        self.filter_terms = frozenset(_normalize_term(k) for k in filter_keywords)
+        self.topic_terms = [_normalize_term(k) for k in dict.fromkeys(topic_keywords)]
+        self.weights = {_normalize_term(k): (float(w), int(cap)) for k, (w, cap) in weighted_keywords.items()}
+
+        # `pattern` runs on lowercased text and captures the matched keyword text, without any plural suffix
+        self.terms = sorted(self.display_names, key=lambda t: (-len(t), t))
+        self.pattern = re.compile(r'\b(?=(' + _trie_regex(self.terms) + r')' + _PLURAL_SUFFIX + r'\b)')
+
+        # Matched text -> keyword; grows with hyphen/whitespace variants seen
+        self._match_terms = {term: term for term in self.terms}
+
+        # Shorter keywords each keyword starts with; ones starting at a
+        # later word are matched there by the lookahead
+        self._implied = {}
+        for term in self.terms:
+            self._implied[term] = [
+                (other, 1) for other in self.terms
+                if len(other) < len(term) and re.match(rf'{re.escape(other)}{_PLURAL_SUFFIX}\b', term)
+            ]
+
+    def scan(self, text: str) -> Dict[str, int]:
+        """Count keyword occurrences in a single pass over `text`"""
+
+        counts = {}
+        if not text:
+            return counts
+
+        implied = self._implied
+
+        for matched in self.pattern.findall(text.lower()):
+            term = self.term_for(matched)
+            counts[term] = counts.get(term, 0) + 1
+            for other, occurrences in implied[term]:
+                counts[other] = counts.get(other, 0) + occurrences
+
+        return counts
+
+    def term_for(self, matched: str) -> str:
+        """Keyword for a string matched by `pattern` (e.g. "machine-learning")"""
+
+        term = self._match_terms.get(matched)
+        if term is None:
+            term = ' '.join(re.split(r'[\s\-]+', matched))
+            self._match_terms[matched] = term
+        return term
+
+    def implied(self, term: str) -> List[Tuple[str, int]]:
+        """Shorter keywords `term` starts with, with occurrence counts"""
+        return self._implied.get(term, [])
+
+    def is_ai_related(self, counts: Dict[str, int]) -> bool:
+        """True if any filter keyword was found"""
+        return any(term in self.filter_terms for term in counts)
+
+    def relevance(self, counts: Dict[str, int]) -> float:
+        """Weighted keyword score, capping repeated mentions per keyword"""
+
+        score = 0.0
+        for term, count in counts.items():
+            weighting = self.weights.get(term)
+            if weighting:
+                weight, cap = weighting
+                score += weight * min(count, cap)
+
+        return score
+
+    def topics(self, counts: Dict[str, int]) -> List[str]:
+        """Topic keywords present in the text, in their original spelling"""
+        return [self.display_names[term] for term in self.topic_terms if term in counts]
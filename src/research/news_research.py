@@ -1,28 +1,91 @@
-import requests
+import calendar
 import feedparser
-import json
 import logging
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import nullcontext
 from datetime import datetime, timedelta
-from typing import List, Dict
-import re
+from typing import Iterable, Iterator, List, Dict, Optional, Tuple
+import heapq
 import time
+import xml.etree.ElementTree as ET
+
+from research.dedup import ArticleDeduplicator
+from research.feed_cache import FeedCache
+from research.feed_fetcher import FeedFetcher
+from research.feed_registry import CIRCUIT_OPEN, NOT_DUE, POLL, FeedRegistry
+from research.feed_stream import StreamingFeedParser
+from research.keyword_index import KeywordIndex
+from research.topic_trends import TopicTrendStore
+
+class TopArticles:
+    """Bounded min-heap keeping the K best articles by (relevance_score, published_timestamp)"""
+    
+    def __init__(self, k: int):
+        self.k = k
+        self._heap = []
+        self._pushed = 0
+    
+    def push(self, article: Dict, order: Tuple = ()) -> None:
+        """Offer an article; earlier `order` (or earlier push) wins ties"""
+        
+        self._pushed += 1
+        if self.k <= 0:
+            return
+        
+        key = (
+            article.get('relevance_score', 0),
+            article.get('published_timestamp', 0),
+            tuple(-value for value in order),
+            -self._pushed
+        )
+        
+        if len(self._heap) < self.k:
+            heapq.heappush(self._heap, (key, article))
+        elif key > self._heap[0][0]:
+            heapq.heapreplace(self._heap, (key, article))
+    
+    def results(self) -> List[Dict]:
+        """Best articles first"""
+        return [article for _, article in sorted(self._heap, key=lambda item: item[0], reverse=True)]
 
 class NewsResearcher:
     """Research AI-related news from multiple free sources"""
     
-    def __init__(self):
+    def __init__(self, config: Optional[Dict] = None, offline: bool = False):
         self.logger = logging.getLogger(__name__)
         
-        # Free RSS feeds focused on AI and tech
-        self.rss_feeds = [
-            "https://feeds.feedburner.com/oreilly/radar",
-            "https://feeds.bbci.co.uk/news/technology/rss.xml",
-            "https://techcrunch.com/category/artificial-intelligence/feed/",
-            "https://www.wired.com/feed/category/business/artificial-intelligence/rss",
-            "https://rss.cnn.com/rss/cnn_tech.rss",
-            "https://www.theverge.com/ai-artificial-intelligence/rss/index.xml",
-            "https://venturebeat.com/category/ai/feed/",
-        ]
+        # Settings from the `apis.news` section of config.yaml
+        news_config = config or {}
+        self.max_articles = news_config.get('max_articles', 10)
+        self.request_timeout = news_config.get('request_timeout', 10)
+        self.concurrent_fetch = news_config.get('concurrent_fetch', True)
+        self.max_workers = news_config.get('max_workers', 8)
+        self.per_host_delay = news_config.get('per_host_delay', 0.5)
+        
+        # Per-feed bounds: bytes downloaded, characters kept per entry, and how many
+        # entries in a row older than hours_back end a feed early
+        self.max_feed_bytes = int(news_config.get('max_feed_mb', 5) * 1024 * 1024)
+        self.max_entry_chars = news_config.get('max_entry_chars', 10000)
+        self.stale_entries_to_stop = news_config.get('stale_entries_to_stop', 3)
+        
+        # Offline mode replays the feed cache without touching the network
+        self.offline = offline
+        
+        # Optional utils.metrics.StageMetrics, set by the agent to time per-feed stages
+        self.metrics = None
+        
+        # Feed sources from `apis.news.feeds`, each with its own polling schedule and health stats
+        registry_config = news_config.get('feed_registry') or {}
+        self.feed_registry = FeedRegistry(
+            news_config.get('feeds'),
+            state_file=registry_config.get('state_file', 'data/cache/feed_health.json'),
+            min_interval_minutes=registry_config.get('min_interval_minutes', 30),
+            max_interval_minutes=registry_config.get('max_interval_minutes', 720),
+            failure_threshold=registry_config.get('failure_threshold', 3),
+            cooldown_minutes=registry_config.get('cooldown_minutes', 360),
+            max_cooldown_hours=registry_config.get('max_cooldown_hours', 72)
+        )
+        self.rss_feeds = self.feed_registry.urls
         
         # AI-related keywords to filter content
         self.ai_keywords = [
@@ -34,82 +97,365 @@ class NewsResearcher:
             "AI transparency", "explainable AI", "AI audit"
         ]
         
+        # High-value keywords get more weight (capped at 3 mentions)
+        self.high_value_keywords = {
+            "responsible AI": 3.0,
+            "AI ethics": 2.5,
+            "AI bias": 2.5,
+            "algorithmic bias": 2.5,
+            "AI governance": 2.0,
+            "AI regulation": 2.0,
+            "AI safety": 2.0,
+            "AI transparency": 2.0,
+            "explainable AI": 2.0,
+            "AI audit": 1.5,
+            "algorithmic fairness": 2.0
+        }
+        
+        # Standard keywords (capped at 2 mentions)
+        self.standard_keywords = {
+            "artificial intelligence": 1.0,
+            "machine learning": 1.0,
+            "deep learning": 1.0,
+            "neural network": 0.8,
+            "algorithm": 0.6,
+            "automation": 0.5,
+            "generative AI": 1.2,
+            "large language model": 1.0,
+            "LLM": 1.0,
+            "GPT": 0.8
+        }
+        
+        # Cross-feed duplicate merging and suppression of earlier coverage
+        dedup_config = news_config.get('dedup') or {}
+        self.deduplicator = None
+        if dedup_config.get('enabled', True):
+            self.deduplicator = ArticleDeduplicator(
+                history_file=dedup_config.get('history_file', 'data/cache/article_history.json'),
+                similarity_threshold=dedup_config.get('similarity_threshold', 0.8),
+                history_days=dedup_config.get('history_days', 14)
+            )
+        
+        # Time-decayed topic counts that persist across runs
+        trends_config = news_config.get('topic_trends') or {}
+        self.topic_trends = None
+        if trends_config.get('enabled', True):
+            self.topic_trends = TopicTrendStore(
+                path=trends_config.get('store_file', 'data/cache/topic_trends.json'),
+                half_life_days=trends_config.get('half_life_days', 3.0)
+            )
+        
+        # One compiled matcher for filtering, relevance and topics
+        weighted_keywords = {keyword: (weight, 3) for keyword, weight in self.high_value_keywords.items()}
+        weighted_keywords.update({keyword: (weight, 2) for keyword, weight in self.standard_keywords.items()})
+        self.keyword_index = KeywordIndex(self.ai_keywords, weighted_keywords)
+        self._batch_scorer = None
+        
         # Request headers to avoid blocking
         self.headers = {
             'User-Agent': 'ResponsibleAI-NewsBot/1.0 (Educational Research)'
         }
+        
+        self.fetcher = FeedFetcher(self.headers, timeout=self.request_timeout, per_host_delay=self.per_host_delay,
+                                   max_bytes=self.max_feed_bytes, pool_size=self.max_workers)
+        
+        # Conditional-GET cache of parsed entries, shared across runs
+        cache_config = news_config.get('feed_cache') or {}
+        self.feed_cache = None
+        if cache_config.get('enabled', True) or offline:
+            self.feed_cache = FeedCache(
+                cache_dir=cache_config.get('directory', 'data/cache/feeds'),
+                ttl_hours=cache_config.get('ttl_hours', 168),
+                max_size_mb=cache_config.get('max_size_mb', 50)
+            )
     
-    def research_ai_news(self, hours_back: int = 24) -> List[Dict]:
+    def research_ai_news(self, hours_back: int = 24, concurrent: Optional[bool] = None) -> List[Dict]:
         """Find recent AI-related news articles"""
         
+        # Only the best max_articles are kept in memory while feeds stream in
+        top_articles = TopArticles(self.max_articles)
+        topic_counts = {}
+        
+        for feed_index, position, article in self._iter_feed_articles(hours_back, concurrent):
+            # Feed order breaks ties, so concurrent runs rank like sequential ones
+            top_articles.push(article, order=(feed_index, position))
+            
+            # Every relevant article, not just the shortlist, feeds long-term trends
+            if self.topic_trends:
+                for topic in self._article_topics(article):
+                    topic_counts[topic] = topic_counts.get(topic, 0) + 1
+        
+        if self.topic_trends and not self.offline:
+            self.topic_trends.update(topic_counts)
+        
+        # Return top 10 most relevant articles
+        top_articles = top_articles.results()
+        self.logger.info("Found %s relevant AI articles from %s sources", len(top_articles), len(self.rss_feeds))
+        
+        if self.deduplicator:
+            self.logger.info(
+                "Merged %s duplicate copies, suppressed %s previously covered articles",
+                self.deduplicator.merged_count, self.deduplicator.suppressed_count
+            )
+            if not self.offline:
+                self.deduplicator.record_covered(top_articles)
+        
+        return top_articles
+    
+    def iter_ai_news(self, hours_back: int = 24, concurrent: Optional[bool] = None) -> Iterator[Dict]:
+        """Yield relevant articles feed by feed, as soon as each feed has been processed"""
+        
+        for _, _, article in self._iter_feed_articles(hours_back, concurrent):
+            yield article
+    
+    def _iter_feed_articles(self, hours_back: int, concurrent: Optional[bool]) -> Iterator[Tuple[int, int, Dict]]:
+        """Yield (feed index, position in feed, article) in configured feed order
+        
+        Feeds download concurrently, but their entries are deduplicated and
+        scored one feed at a time in configured order. The copy kept for a
+        story syndicated by several feeds is then always the one from the
+        first feed, whichever download finished first, so concurrent runs
+        keep the same articles, sources and links as sequential ones.
+        """
+        
         cutoff_time = datetime.now() - timedelta(hours=hours_back)
-        relevant_articles = []
         
-        for feed_url in self.rss_feeds:
+        if concurrent is None:
+            concurrent = self.concurrent_fetch
+        
+        # Offline replays ignore coverage history so they stay reproducible
+        if self.deduplicator:
+            self.deduplicator.start_run(use_history=not self.offline)
+        
+        # Sources that aren't due or whose circuit is open replay their cached entries instead
+        plan = {} if self.offline else {feed_url: self.feed_registry.decide(feed_url) for feed_url in self.rss_feeds}
+        skipped = [feed_url for feed_url, decision in plan.items() if decision != POLL]
+        if skipped:
+            self.logger.info(
+                "Polling %d of %d feeds (%d not due, %d with open circuits)",
+                len(plan) - len(skipped), len(plan),
+                sum(1 for decision in plan.values() if decision == NOT_DUE),
+                sum(1 for decision in plan.values() if decision == CIRCUIT_OPEN)
+            )
+        
+        if concurrent and len(self.rss_feeds) > 1:
+            max_workers = max(1, min(self.max_workers, len(self.rss_feeds)))
+            executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='feed')
             try:
-                self.logger.info(f"Fetching from: {feed_url}")
+                futures = [
+                    executor.submit(self._fetch_feed, feed_url, cutoff_time, plan.get(feed_url, POLL))
+                    for feed_url in self.rss_feeds
+                ]
+                # Later feeds keep downloading while an earlier one is processed
+                for index, future in enumerate(futures):
+                    for position, article in enumerate(self._process_feed(future.result())):
+                        yield index, position, article
+            finally:
+                # Don't wait on feeds nobody will consume if the caller stops early
+                executor.shutdown(wait=False, cancel_futures=True)
+        else:
+            for index, feed_url in enumerate(self.rss_feeds):
+                for position, article in enumerate(self._research_feed(feed_url, cutoff_time, plan.get(feed_url, POLL))):
+                    yield index, position, article
+        
+        if not self.offline:
+            self.feed_registry.save()
+            if self.feed_cache:
+                self.feed_cache.prune()
+    
+    def _research_feed(self, feed_url: str, cutoff_time: datetime, decision: str = POLL) -> List[Dict]:
+        """Fetch one feed (or replay it, if it isn't due) and return its relevant articles"""
+        return self._process_feed(self._fetch_feed(feed_url, cutoff_time, decision))
+    
+    def _fetch_feed(self, feed_url: str, cutoff_time: datetime, decision: str = POLL) -> Dict:
+        """Download or replay one feed's entries; safe to run in a worker thread"""
+        
+        poll = decision == POLL and not self.offline
+        if decision == NOT_DUE and not (self.feed_cache and self.feed_cache.contains(feed_url)):
+            # Nothing to replay, so polling early beats dropping the source for this run
+            poll = True
+        
+        fetched = {'feed_url': feed_url, 'cutoff_time': cutoff_time, 'decision': decision, 'poll': poll,
+                   'entries': [], 'error': None}
+        started = time.monotonic()
+        
+        try:
+            fetched['entries'], fetched_at = self._load_feed_entries(feed_url, cutoff_time, poll=poll)
+            
+            # Replayed snapshots are filtered relative to when they were fetched
+            if self.offline:
+                fetched['cutoff_time'] = cutoff_time - (datetime.now() - fetched_at)
+        except Exception as e:
+            fetched['error'] = e
+        
+        fetched['latency'] = time.monotonic() - started
+        return fetched
+    
+    def _process_feed(self, fetched: Dict) -> List[Dict]:
+        """Deduplicate and score a fetched feed's entries, then record the poll in the feed registry"""
+        
+        feed_url = fetched['feed_url']
+        cutoff_time = fetched['cutoff_time']
+        entries = fetched['entries']
+        relevant_articles = []
+        
+        try:
+            if fetched['error'] is not None:
+                raise fetched['error']
+            
+            if not entries and fetched['decision'] != CIRCUIT_OPEN:
+                self.logger.warning("No entries found for %s", feed_url)
+            
+            for entry in entries:
+                # Check if article is recent
+                article_date = None
+                try:
+                    if hasattr(entry, 'published_parsed') and entry.published_parsed:
+                        article_date = datetime(*entry.published_parsed[:6])
+                    elif hasattr(entry, 'updated_parsed') and entry.updated_parsed:
+                        article_date = datetime(*entry.updated_parsed[:6])
+                except (TypeError, ValueError) as e:
+                    self.logger.debug("Could not parse date for article: %s", e)
                 
-                # Add timeout and error handling
-                feed = feedparser.parse(feed_url, agent=self.headers['User-Agent'])
+                # If we can't determine the date, include recent articles anyway
+                if article_date and article_date < cutoff_time:
+                    continue
                 
-                # Check if feed was parsed successfully
-                if hasattr(feed, 'bozo') and feed.bozo:
-                    self.logger.warning(f"Feed parse warning for {feed_url}: {getattr(feed, 'bozo_exception', 'Unknown')}")
+                # Check if article is AI-related
+                title = entry.get('title', '').lower()
+                summary = entry.get('summary', '').lower()
+                content = entry.get('content', [{}])
+                content_text = ''
                 
-                if not hasattr(feed, 'entries') or not feed.entries:
-                    self.logger.warning(f"No entries found for {feed_url}")
-                    continue
+                # Extract content text if available
+                if isinstance(content, list) and content:
+                    content_text = content[0].get('value', '').lower()
                 
-                for entry in feed.entries:
-                    # Check if article is recent
-                    article_date = None
-                    try:
-                        if hasattr(entry, 'published_parsed') and entry.published_parsed:
-                            article_date = datetime(*entry.published_parsed[:6])
-                        elif hasattr(entry, 'updated_parsed') and entry.updated_parsed:
-                            article_date = datetime(*entry.updated_parsed[:6])
-                    except (TypeError, ValueError) as e:
-                        self.logger.debug(f"Could not parse date for article: {e}")
-                    
-                    # If we can't determine the date, include recent articles anyway
-                    if article_date and article_date < cutoff_time:
+                full_text = f"{title} {summary} {content_text}"
+                
+                # Single keyword pass shared by filtering and scoring
+                keyword_counts = self.keyword_index.scan(full_text)
+                
+                if self.keyword_index.is_ai_related(keyword_counts):
+                    # Skip copies of stories already seen in an earlier feed; only
+                    # relevant entries count, so an off-topic copy can't claim a story
+                    if self.deduplicator and self.deduplicator.absorb(entry.get('title', ''), entry.get('link', ''), feed_url):
                         continue
                     
-                    # Check if article is AI-related
-                    title = entry.get('title', '').lower()
-                    summary = entry.get('summary', '').lower()
-                    content = entry.get('content', [{}])
-                    content_text = ''
-                    
-                    # Extract content text if available
-                    if isinstance(content, list) and content:
-                        content_text = content[0].get('value', '').lower()
-                    
-                    full_text = f"{title} {summary} {content_text}"
-                    
-                    if self._is_ai_related(full_text):
-                        # Clean and validate article data
-                        article = self._create_article_dict(entry, feed_url, full_text)
-                        if article:
-                            relevant_articles.append(article)
-                
-                # Add delay to be respectful to servers
-                time.sleep(0.5)
+                    # Clean and validate article data
+                    article = self._create_article_dict(entry, feed_url, full_text, keyword_counts)
+                    if article and (not self.deduplicator or self.deduplicator.add(article)):
+                        relevant_articles.append(article)
                         
-            except Exception as e:
-                self.logger.error(f"Error fetching {feed_url}: {e}")
-                continue
+        except Exception as e:
+            self.logger.error("Error fetching %s: %s", feed_url, e)
+            if fetched['poll']:
+                self.feed_registry.record_failure(feed_url, e, fetched['latency'])
+            return relevant_articles
         
-        # Sort by relevance score and recency
-        relevant_articles.sort(key=lambda x: (x['relevance_score'], x.get('published_timestamp', 0)), reverse=True)
+        if fetched['poll']:
+            entry_times = [
+                calendar.timegm(parsed) for parsed in
+                (entry.get('published_parsed') or entry.get('updated_parsed') for entry in entries) if parsed
+            ]
+            self.feed_registry.record_success(feed_url, fetched['latency'], entry_times, len(relevant_articles))
         
-        # Return top 10 most relevant articles
-        top_articles = relevant_articles[:10]
-        self.logger.info(f"Found {len(top_articles)} relevant AI articles from {len(self.rss_feeds)} sources")
+        return relevant_articles
+    
+    def _load_feed_entries(self, feed_url: str, cutoff_time: datetime, poll: bool = True) -> Tuple[List, datetime]:
+        """Return a feed's entries and fetch time, using the cache when possible"""
         
-        return top_articles
+        record = self.feed_cache.get(feed_url, ignore_ttl=self.offline) if self.feed_cache else None
+        
+        # Not due or circuit open: serve what the cache has without touching the network
+        if not poll and not self.offline:
+            if record is None:
+                return [], datetime.now()
+            return record['entries'], datetime.fromtimestamp(record.get('fetched_at', time.time()))
+        
+        if self.offline:
+            if record is None:
+                self.logger.warning("No cached snapshot for %s", feed_url)
+                return [], datetime.now()
+            self.logger.info("Replaying %d cached entries for: %s", len(record['entries']), feed_url)
+            return record['entries'], datetime.fromtimestamp(record.get('fetched_at', time.time()))
+        
+        # Per-feed logs pass lazy %-style arguments; the logging listener formats them after
+        # this call returns, so only strings and numbers go in (see utils.logger.LazyQueueHandler)
+        self.logger.info("Fetching from: %s", feed_url)
+        
+        # Download with a hard timeout, size cap and per-host politeness delay, parsing as it arrives
+        conditional_headers = self.feed_cache.conditional_headers(record) if self.feed_cache else {}
+        with self._stage('feed_fetch', feed=feed_url) as stage, \
+                self.fetcher.stream(feed_url, conditional_headers) as (chunks, response_headers, status):
+            stage['http_status'] = status
+            entries = [] if status == 304 else self._parse_feed_stream(feed_url, chunks, response_headers, cutoff_time, stage)
+        
+        if status == 304 and record is not None:
+            self.logger.info("Not modified, reusing %d cached entries for: %s", len(record['entries']), feed_url)
+            self.feed_cache.mark_validated(feed_url, record)
+            return record['entries'], datetime.now()
+        
+        # A timed-out download raises before this point, and one cut off at the byte cap
+        # arrives without validators, so only complete documents can later answer 304
+        if self.feed_cache and entries:
+            self.feed_cache.put(feed_url, entries, response_headers)
+        
+        return entries, datetime.now()
     
-    def _create_article_dict(self, entry, source_url: str, full_text: str) -> Dict:
+    def _parse_feed_stream(self, feed_url: str, chunks: Iterable[bytes], response_headers: Dict[str, str],
+                           cutoff_time: datetime, stage: Dict) -> List:
+        """Parse entries while the body downloads, stopping once they fall past the cutoff
+        
+        Documents the XML parser rejects (typically HTML entities that aren't
+        valid XML) are handed to feedparser instead, still within the byte cap.
+        """
+        
+        parser = StreamingFeedParser(cutoff_time, stale_limit=self.stale_entries_to_stop,
+                                     max_content_chars=self.max_entry_chars)
+        entries = []
+        received = []
+        
+        try:
+            for chunk in chunks:
+                received.append(chunk)
+                entries.extend(parser.feed(chunk))
+                if parser.done:
+                    break
+        except ET.ParseError as e:
+            self.logger.debug("Streaming parse of %s failed (%s), falling back to feedparser", feed_url, e)
+            return self._parse_with_feedparser(feed_url, b''.join(received) + b''.join(chunks), response_headers, stage)
+        
+        if not parser.done:
+            try:
+                entries.extend(parser.close())
+            except ET.ParseError as e:
+                # A document cut off at the byte cap still yields the entries read so far
+                self.logger.debug("Feed %s ended early (%s), keeping %d entries", feed_url, e, len(entries))
+        
+        stage.update(parser='stream', bytes=sum(len(chunk) for chunk in received), entries=len(entries),
+                     entries_read=parser.entries_seen, stopped_at_cutoff=parser.done)
+        return entries
+    
+    def _parse_with_feedparser(self, feed_url: str, body: bytes, response_headers: Dict[str, str], stage: Dict) -> List:
+        with self._stage('feed_parse', feed=feed_url) as parse_stage:
+            feed = feedparser.parse(body, response_headers=response_headers)
+            parse_stage['entries'] = len(getattr(feed, 'entries', []))
+        
+        # Check if feed was parsed successfully
+        if hasattr(feed, 'bozo') and feed.bozo:
+            self.logger.warning("Feed parse warning for %s: %s", feed_url, getattr(feed, 'bozo_exception', 'Unknown'))
+        
+        entries = list(getattr(feed, 'entries', []))
+        stage.update(parser='feedparser', bytes=len(body), entries=len(entries))
+        return entries
+    
+    def _stage(self, name: str, **labels):
+        """Time a block when metrics are attached; a dict to annotate either way"""
+        return self.metrics.stage(name, **labels) if self.metrics else nullcontext({})
+    
+    def _create_article_dict(self, entry, source_url: str, full_text: str,
+                             keyword_counts: Optional[Dict[str, int]] = None) -> Dict:
         """Create standardized article dictionary"""
         try:
             title = entry.get('title', '').strip()
@@ -120,7 +466,7 @@ class NewsResearcher:
                 return None
             
             # Calculate relevance score
-            relevance_score = self._calculate_relevance(full_text)
+            relevance_score = self._calculate_relevance(full_text, keyword_counts)
             
             # Extract published timestamp for sorting
             published_timestamp = 0
@@ -145,107 +491,56 @@ class NewsResearcher:
             return article
             
         except Exception as e:
-            self.logger.warning(f"Could not create article dict: {e}")
+            self.logger.warning("Could not create article dict: %s", e)
             return None
     
     def _is_ai_related(self, text: str) -> bool:
         """Check if text contains AI-related keywords"""
         if not text:
             return False
-            
-        # Convert to lowercase for matching
-        text_lower = text.lower()
-        
-        # Check for exact keyword matches
-        for keyword in self.ai_keywords:
-            if keyword in text_lower:
-                return True
-        
-        # Additional patterns that might indicate AI content
-        ai_patterns = [
-            r'\bai\b',  # Standalone "AI" word
-            r'machine.*learning',
-            r'artificial.*intelligence',
-            r'neural.*network',
-            r'deep.*learning',
-            r'algorithm.*bias',
-        ]
         
-        for pattern in ai_patterns:
-            if re.search(pattern, text_lower):
-                return True
-        
-        return False
+        return self.keyword_index.is_ai_related(self.keyword_index.scan(text))
     
-    def _calculate_relevance(self, text: str) -> float:
+    def _calculate_relevance(self, text: str, keyword_counts: Optional[Dict[str, int]] = None) -> float:
         """Calculate relevance score based on keyword frequency and importance"""
         
-        # High-value keywords get more weight
-        high_value_keywords = {
-            "responsible AI": 3.0,
-            "AI ethics": 2.5,
-            "AI bias": 2.5,
-            "algorithmic bias": 2.5,
-            "AI governance": 2.0,
-            "AI regulation": 2.0,
-            "AI safety": 2.0,
-            "AI transparency": 2.0,
-            "explainable AI": 2.0,
-            "AI audit": 1.5,
-            "algorithmic fairness": 2.0
-        }
+        if keyword_counts is None:
+            keyword_counts = self.keyword_index.scan(text)
         
-        # Standard keywords
-        standard_keywords = {
-            "artificial intelligence": 1.0,
-            "machine learning": 1.0,
-            "deep learning": 1.0,
-            "neural network": 0.8,
-            "algorithm": 0.6,
-            "automation": 0.5,
-            "generative AI": 1.2,
-            "large language model": 1.0,
-            "LLM": 1.0,
-            "GPT": 0.8
-        }
-        
-        score = 0.0
-        text_lower = text.lower()
-        
-        # Check high-value keywords
-        for keyword, weight in high_value_keywords.items():
-            count = text_lower.count(keyword)
-            if count > 0:
-                score += weight * min(count, 3)  # Cap at 3 mentions
-        
-        # Check standard keywords
-        for keyword, weight in standard_keywords.items():
-            count = text_lower.count(keyword)
-            if count > 0:
-                score += weight * min(count, 2)  # Cap at 2 mentions
+        score = self.keyword_index.relevance(keyword_counts)
         
         # Boost score for title mentions (more important)
-        if 'title' in text_lower:
+        if 'title' in text.lower():
             score *= 1.2
         
         return min(score, 10.0)  # Cap maximum score at 10.0
     
-    def get_trending_topics(self, articles: List[Dict]) -> List[str]:
-        """Extract trending topics from articles"""
+    def calculate_relevance_batch(self, texts: List[str], workers: int = 1) -> List[float]:
+        """Score many texts at once, e.g. when backfilling archived feeds
+        
+        Uses NumPy when it is installed and scores one text at a time
+        otherwise; the scores are the same either way.
+        """
+        
+        # Imported lazily so the daily pipeline does not need NumPy
+        if self._batch_scorer is None:
+            try:
+                from research.batch_scoring import BatchRelevanceScorer
+            except ImportError:
+                self.logger.info("NumPy is not installed; scoring %d texts one at a time", len(texts))
+                return [self._calculate_relevance(text) for text in texts]
+            self._batch_scorer = BatchRelevanceScorer(self.keyword_index)
+        
+        return self._batch_scorer.score(texts, workers).tolist()
+    
+    def get_trending_topics(self, articles: Iterable[Dict]) -> List[str]:
+        """Extract trending topics from articles (any iterable, consumed in one pass)"""
         
         topic_counts = {}
         
         for article in articles:
-            title = article.get('title', '').lower()
-            summary = article.get('summary', '').lower()
-            text = f"{title} {summary}"
-            
-            # Extract topics using keyword matching
-            for keyword in self.ai_keywords:
-                if keyword in text:
-                    # Normalize similar terms
-                    normalized_keyword = self._normalize_topic(keyword)
-                    topic_counts[normalized_keyword] = topic_counts.get(normalized_keyword, 0) + 1
+            for topic in self._article_topics(article):
+                topic_counts[topic] = topic_counts.get(topic, 0) + 1
         
         # Sort by frequency and return top 5
         trending_topics = sorted(topic_counts.items(), key=lambda x: x[1], reverse=True)
@@ -258,6 +553,24 @@ class NewsResearcher:
         
         return filtered_topics[:5]  # Return top 5
     
+    def get_topic_trends(self, limit: int = 5) -> List[Dict]:
+        """Topics trending across runs, from time-decayed mention counts"""
+        
+        if not self.topic_trends:
+            return []
+        
+        return [{'topic': topic, 'score': round(score, 3)} for topic, score in self.topic_trends.top(limit)]
+    
+    def _article_topics(self, article: Dict) -> List[str]:
+        """Normalized topics mentioned in an article's title and summary"""
+        
+        title = article.get('title', '').lower()
+        summary = article.get('summary', '').lower()
+        text = f"{title} {summary}"
+        
+        # Extract topics using keyword matching, normalizing similar terms
+        return [self._normalize_topic(keyword) for keyword in self.keyword_index.topics(self.keyword_index.scan(text))]
+    
     def _normalize_topic(self, keyword: str) -> str:
         """Normalize similar keywords into consistent topics"""
         keyword_lower = keyword.lower()
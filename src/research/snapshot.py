@@ -0,0 +1,94 @@
+import hashlib
+import json
+import logging
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Dict, Optional
+
+from utils.serialization import json_default, write_json
+
+# Bump when the layout of the snapshot file or of the research dict changes
+SNAPSHOT_VERSION = 1
+
+
+def content_hash(obj) -> str:
+    """SHA-256 of a canonical (sorted-key, stdlib) JSON encoding of `obj`"""
+
+    canonical = json.dumps(obj, default=json_default, ensure_ascii=False, sort_keys=True, separators=(',', ':'))
+    return hashlib.sha256(canonical.encode('utf-8')).hexdigest()
+
+
+class ResearchSnapshotStore:
+    """The latest research phase output, saved so later runs can skip fetching
+
+    A snapshot holds the articles, their scores and the topics, plus:
+
+    - `version`, so snapshots from an older layout are ignored
+    - `snapshot_id`, a hash of the research content, also checked on load
+    - `config_key`, a hash of the news settings it was researched with and
+      whether it was replayed offline
+
+    A snapshot is reused while it is younger than `max_age_minutes` and the
+    news settings haven't changed. Reusing also means dedup history and
+    topic trends are recorded only once per snapshot.
+    """
+
+    def __init__(self, path: str = 'data/cache/research_snapshot.json', max_age_minutes: float = 180):
+        self.logger = logging.getLogger(__name__)
+        self.path = Path(path)
+        self.max_age = timedelta(minutes=max_age_minutes)
+
+    def load(self, config_key: str, now: Optional[datetime] = None) -> Optional[Dict]:
+        """Research from a fresh, intact snapshot, or None if there isn't one"""
+
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                snapshot = json.load(f)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            self.logger.warning("Ignoring unreadable research snapshot %s: %s", self.path, e)
+            return None
+
+        if not isinstance(snapshot, dict):
+            self.logger.warning("Ignoring research snapshot %s: not a JSON object", self.path)
+            return None
+        if snapshot.get('version') != SNAPSHOT_VERSION or snapshot.get('config_key') != config_key:
+            return None
+
+        try:
+            age = (now or datetime.now()) - datetime.fromisoformat(snapshot['created_at'])
+        except (KeyError, TypeError, ValueError):
+            return None
+        if age > self.max_age:
+            return None
+
+        research = snapshot.get('research')
+        if not isinstance(research, dict) or content_hash(research) != snapshot.get('snapshot_id'):
+            self.logger.warning("Ignoring research snapshot %s: content does not match its hash", self.path)
+            return None
+
+        return dict(research, snapshot_id=snapshot['snapshot_id'], snapshot_age_minutes=round(age.total_seconds() / 60, 1))
+
+    def save(self, research: Dict, config_key: str, now: Optional[datetime] = None) -> str:
+        """Write a new snapshot and return its id (the research content hash)"""
+
+        snapshot_id = content_hash(research)
+        write_json(self.path, {
+            'version': SNAPSHOT_VERSION,
+            'snapshot_id': snapshot_id,
+            'created_at': (now or datetime.now()).isoformat(),
+            'config_key': config_key,
+            'research': research
+        })
+        return snapshot_id
+
+    @staticmethod
+    def config_key(news_config: Dict, offline: bool = False) -> str:
+        """Hash of the news settings and research mode, so editing them invalidates the snapshot
+
+        Offline replays of the feed cache get their own key, so a live run
+        never reuses replayed research as if it were fresh.
+        """
+
+        return content_hash({'news': news_config, 'offline': offline})
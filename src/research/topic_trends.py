@@ -0,0 +1,111 @@
+import json
+import logging
+import os
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+# Rebase stored scores before 2**(age / half_life) grows unwieldy
+_MAX_EXPONENT = 40
+# Topics whose decayed count falls below this are dropped on rebase
+_MIN_SCORE = 0.01
+
+
+class TopicTrendStore:
+    """Exponentially decayed topic counts that persist across runs
+
+    Scores are stored pre-scaled by 2**((t - epoch) / half_life), so adding
+    new mentions only touches the topics involved and never rewrites the
+    rest of the store. The current day's counts are kept apart and replaced
+    (not added) when the pipeline runs again on the same day, so re-runs
+    don't inflate trends.
+    """
+
+    def __init__(self, path: str = 'data/cache/topic_trends.json', half_life_days: float = 3.0):
+        self.logger = logging.getLogger(__name__)
+        self.path = Path(path)
+        self.half_life_seconds = half_life_days * 86400
+        self.state = self._load()
+
+    def update(self, topic_counts: Dict[str, int], now: Optional[float] = None) -> None:
+        """Record today's topic mentions and persist the store"""
+
+        now = now or time.time()
+        day = datetime.fromtimestamp(now).date().isoformat()
+        today = self.state['today']
+
+        if not self.state['scores'] and not today.get('counts'):
+            self.state['epoch'] = now
+
+        # A new day: fold the previous day's counts into the decayed scores
+        if today.get('day') != day and today.get('counts'):
+            scale = self._growth(today['recorded_at'])
+            scores = self.state['scores']
+            for topic, count in today['counts'].items():
+                scores[topic] = scores.get(topic, 0.0) + count * scale
+
+        self.state['today'] = {'day': day, 'recorded_at': now, 'counts': dict(topic_counts)}
+
+        if (now - self.state['epoch']) / self.half_life_seconds > _MAX_EXPONENT:
+            self._rebase(now)
+
+        self._save()
+
+    def top(self, limit: int = 5, now: Optional[float] = None) -> List[Tuple[str, float]]:
+        """Most mentioned topics, weighting recent days more heavily"""
+
+        now = now or time.time()
+        decay = 1.0 / self._growth(now)
+
+        totals = {topic: score * decay for topic, score in self.state['scores'].items()}
+
+        today = self.state['today']
+        if today.get('counts'):
+            today_decay = self._growth(today['recorded_at']) * decay
+            for topic, count in today['counts'].items():
+                totals[topic] = totals.get(topic, 0.0) + count * today_decay
+
+        ranked = sorted(totals.items(), key=lambda item: item[1], reverse=True)
+        return [(topic, score) for topic, score in ranked[:limit] if score >= _MIN_SCORE]
+
+    def _growth(self, timestamp: float) -> float:
+        return 2.0 ** ((timestamp - self.state['epoch']) / self.half_life_seconds)
+
+    def _rebase(self, now: float) -> None:
+        decay = 1.0 / self._growth(now)
+        self.state['scores'] = {
+            topic: score * decay
+            for topic, score in self.state['scores'].items()
+            if score * decay >= _MIN_SCORE
+        }
+        self.state['epoch'] = now
+
+    def _load(self) -> Dict:
+        empty = {'version': 1, 'epoch': time.time(), 'scores': {}, 'today': {}}
+
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                state = json.load(f)
+        except FileNotFoundError:
+            return empty
+        except (OSError, ValueError) as e:
+            self.logger.warning("Ignoring unreadable topic trend store %s: %s", self.path, e)
+            return empty
+
+        if not isinstance(state, dict) or state.get('version') != 1:
+            return empty
+
+        state.setdefault('scores', {})
+        state.setdefault('today', {})
+        return state
+
+    def _save(self) -> None:
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.path.with_suffix(f'.{os.getpid()}.tmp')
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(self.state, f, separators=(',', ':'))
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            self.logger.warning("Could not save topic trend store %s: %s", self.path, e)
@@ -0,0 +1,40 @@
+import logging
+from pathlib import Path
+from typing import Dict, Optional
+
+import yaml
+
+# config.yaml lives at the repository root, next to src/
+CONFIG_PATH = Path(__file__).resolve().parents[2] / 'config.yaml'
+
+# libyaml's loader parses config.yaml about 8x faster than the pure-Python one
+_Loader = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+
+
+def load_config(path: Optional[str] = None) -> Dict:
+    """Load the agent configuration, falling back to an empty dict"""
+
+    config_path = Path(path) if path else CONFIG_PATH
+    logger = logging.getLogger(__name__)
+
+    try:
+        with open(config_path, 'r', encoding='utf-8') as f:
+            return yaml.load(f, Loader=_Loader) or {}
+    except FileNotFoundError:
+        logger.warning("Config file not found at %s, using defaults", config_path)
+    except yaml.YAMLError as e:
+        logger.error("Could not parse config file %s: %s", config_path, e)
+
+    return {}
+
+
+def get_section(config: Dict, dotted_key: str) -> Dict:
+    """Return a nested config section such as 'apis.news' (empty dict if missing)"""
+
+    section = config or {}
+    for key in dotted_key.split('.'):
+        if not isinstance(section, dict):
+            return {}
+        section = section.get(key) or {}
+
+    return section if isinstance(section, dict) else {}
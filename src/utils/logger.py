@@ -1,40 +1,167 @@
+import atexit
 import logging
+import logging.handlers
 import os
+import queue
+import time
 from datetime import datetime
 from pathlib import Path
+from typing import Dict, Optional
 
-def setup_logging():
-    """Set up logging configuration with proper directory handling"""
-    
-    log_level = os.getenv('LOG_LEVEL', 'INFO')
-    
-    # Ensure logs directory exists
-    logs_dir = Path('logs')
-    logs_dir.mkdir(exist_ok=True)
-    
-    # Create log filename
-    log_filename = logs_dir / f'ai_agent_{datetime.now().strftime("%Y%m%d")}.log'
-    
-    # Configure logging with error handling
+from utils.serialization import dumps
+
+DEFAULT_FORMAT = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+
+# Attributes every LogRecord has; anything else on a record came from `extra=`
+_RECORD_ATTRIBUTES = frozenset(vars(logging.LogRecord('', 0, '', 0, '', None, None))) | {'message', 'asctime'}
+
+_listener: Optional[logging.handlers.QueueListener] = None
+_queue_handler: Optional[logging.Handler] = None
+
+
+class JSONFormatter(logging.Formatter):
+    """One JSON object per line, with any `extra=` fields kept as top-level keys"""
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            'time': datetime.fromtimestamp(record.created).isoformat(timespec='milliseconds'),
+            'level': record.levelname,
+            'logger': record.name,
+            'message': record.getMessage(),
+            'thread': record.threadName,
+        }
+        for key, value in vars(record).items():
+            if key not in _RECORD_ATTRIBUTES and not key.startswith('_'):
+                entry[key] = value
+        if record.exc_info:
+            entry['exception'] = self.formatException(record.exc_info)
+        if record.stack_info:
+            entry['stack'] = self.formatStack(record.stack_info)
+        return dumps(entry)
+
+
+class LazyQueueHandler(logging.handlers.QueueHandler):
+    """Enqueue records untouched, leaving %-formatting to the listener thread
+
+    The stock QueueHandler formats every record on the calling thread so it
+    can be pickled; the queue here never leaves the process, so that work is
+    skipped. Arguments are therefore formatted when the listener gets to
+    them, possibly after the caller has moved on. Only pass values that
+    don't change after the call (strings, numbers, exceptions); render a
+    list or dict that may still be mutated into a string first, as
+    ResponsibleAIContentGenerator does with candidate scores.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
+
+class RetentionFileHandler(logging.handlers.TimedRotatingFileHandler):
+    """Rolls over at midnight or once the file reaches `max_bytes`
+
+    Rotated files are named <file>.<date>[.<n>] and deleted once they are
+    older than `retention_days`.
+    """
+
+    def __init__(self, filename: str, max_bytes: int = 0, retention_days: float = 30):
+        super().__init__(filename, when='midnight', backupCount=0, encoding='utf-8', delay=True)
+        self.max_bytes = max_bytes
+        self.retention_seconds = retention_days * 86400
+
+    def shouldRollover(self, record: logging.LogRecord) -> bool:
+        if super().shouldRollover(record):
+            return True
+        if not self.max_bytes:
+            return False
+        if self.stream is None:
+            self.stream = self._open()
+        return self.stream.tell() >= self.max_bytes
+
+    def rotation_filename(self, default_name: str) -> str:
+        # Several size rollovers in one day would otherwise overwrite each other
+        name, counter = default_name, 1
+        while os.path.exists(name):
+            name = f"{default_name}.{counter}"
+            counter += 1
+        return name
+
+    def doRollover(self) -> None:
+        super().doRollover()
+
+        cutoff = time.time() - self.retention_seconds
+        log_file = Path(self.baseFilename)
+        for path in log_file.parent.glob(f"{log_file.name}.*"):
+            try:
+                if path.stat().st_mtime < cutoff:
+                    path.unlink()
+            except OSError:
+                pass
+
+
+def setup_logging(config: Optional[Dict] = None):
+    """Route all logging through a queue so callers never wait on console or file I/O
+
+    Settings come from the `logging` section of config.yaml; LOG_LEVEL
+    overrides its level. The console gets `format`, and logs/ai_agent.jsonl
+    gets one JSON object per record. Calling this again replaces the
+    previous setup.
+    """
+
+    global _listener, _queue_handler
+
+    config = config or {}
+    log_level = os.getenv('LOG_LEVEL') or config.get('level', 'INFO')
+    level = getattr(logging, log_level.upper(), logging.INFO)
+
+    console_handler = logging.StreamHandler()
+    console_handler.setFormatter(logging.Formatter(config.get('format', DEFAULT_FORMAT)))
+    handlers = [console_handler]
+
+    log_filename = Path(config.get('file', 'logs/ai_agent.jsonl'))
     try:
-        logging.basicConfig(
-            level=getattr(logging, log_level.upper()),
-            format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-            handlers=[
-                logging.StreamHandler(),  # Console output
-                logging.FileHandler(log_filename, encoding='utf-8')  # File output with UTF-8 encoding
-            ]
+        log_filename.parent.mkdir(parents=True, exist_ok=True)
+        file_handler = RetentionFileHandler(
+            str(log_filename),
+            max_bytes=int(config.get('max_file_mb', 10) * 1024 * 1024),
+            retention_days=config.get('file_retention_days', 30)
         )
+        file_handler.setFormatter(JSONFormatter())
+        handlers.append(file_handler)
     except Exception as e:
-        # Fallback to console only if file logging fails
-        logging.basicConfig(
-            level=getattr(logging, log_level.upper()),
-            format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-            handlers=[logging.StreamHandler()]
-        )
+        # Fall back to console only if file logging fails
         print(f"Warning: Could not create log file {log_filename}: {e}")
-    
+        log_filename = None
+
+    root = logging.getLogger()
+    _stop_listener()
+
+    _queue_handler = LazyQueueHandler(queue.SimpleQueue())
+    root.addHandler(_queue_handler)
+    root.setLevel(level)
+
+    _listener = logging.handlers.QueueListener(_queue_handler.queue, *handlers, respect_handler_level=True)
+    _listener.start()
+
     logger = logging.getLogger(__name__)
-    logger.info(f"Logging initialized - Level: {log_level}, File: {log_filename}")
-    
+    logger.info("Logging initialized - Level: %s, File: %s", logging.getLevelName(level), log_filename)
+
     return logger
+
+
+def _stop_listener() -> None:
+    """Flush queued records and detach the current queue handler, if any"""
+
+    global _listener, _queue_handler
+
+    if _queue_handler is not None:
+        logging.getLogger().removeHandler(_queue_handler)
+        _queue_handler = None
+
+    if _listener is not None:
+        _listener.stop()
+        for handler in _listener.handlers:
+            handler.close()
+        _listener = None
+
+
+atexit.register(_stop_listener)
@@ -0,0 +1,185 @@
+import logging
+import os
+import threading
+import time
+import tracemalloc
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Dict, Iterator, List, Optional
+
+from utils.serialization import write_json
+
+PROFILERS = ('cprofile', 'pyinstrument')
+
+
+class StageMetrics:
+    """Wall time, CPU time and peak memory for each stage of a pipeline run
+
+    Stages on the main thread use process CPU time, so a stage that fans
+    out to worker threads still counts their work. Stages running on other
+    threads (e.g. one feed's fetch) use that thread's CPU time. Peak memory
+    comes from tracemalloc, whose peak is process-wide, so it is only
+    recorded for main-thread stages; nested stages report their own peak
+    and also count towards their parent's.
+    """
+
+    def __init__(self, trace_memory: bool = False):
+        self.logger = logging.getLogger(__name__)
+        self.trace_memory = trace_memory
+        self.started_at = datetime.now()
+        self.stages: List[Dict] = []
+        self._origin = time.perf_counter()
+        self._lock = threading.Lock()
+        # Absolute tracemalloc peaks of the open main-thread stages, innermost last
+        self._memory_stack: List[List[int]] = []
+        self._started_tracing = False
+
+        if trace_memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started_tracing = True
+
+    @contextmanager
+    def stage(self, name: str, **labels) -> Iterator[Dict]:
+        """Measure the enclosed block; extra fields can be added to the yielded record"""
+
+        on_main_thread = threading.current_thread() is threading.main_thread()
+        cpu_clock = time.process_time if on_main_thread else time.thread_time
+        track_memory = self.trace_memory and on_main_thread and tracemalloc.is_tracing()
+
+        record = {'stage': name, **labels}
+        if track_memory:
+            memory_start = self._enter_memory_frame()
+
+        wall_start = time.perf_counter()
+        cpu_start = cpu_clock()
+        try:
+            yield record
+            record.setdefault('status', 'ok')
+        except BaseException as e:
+            record['status'] = 'error'
+            record['error'] = f"{type(e).__name__}: {e}"
+            raise
+        finally:
+            record['offset_seconds'] = round(wall_start - self._origin, 6)
+            record['wall_seconds'] = round(time.perf_counter() - wall_start, 6)
+            record['cpu_seconds'] = round(cpu_clock() - cpu_start, 6)
+            record['peak_memory_bytes'] = self._exit_memory_frame(memory_start) if track_memory else None
+            with self._lock:
+                self.stages.append(record)
+
+    def _enter_memory_frame(self) -> int:
+        current, peak = tracemalloc.get_traced_memory()
+        if self._memory_stack:
+            # Keep the parent's peak so far before resetting it for the child
+            self._memory_stack[-1][0] = max(self._memory_stack[-1][0], peak)
+        tracemalloc.reset_peak()
+        self._memory_stack.append([current])
+        return current
+
+    def _exit_memory_frame(self, memory_start: int) -> int:
+        peak = max(self._memory_stack.pop()[0], tracemalloc.get_traced_memory()[1])
+        if self._memory_stack:
+            self._memory_stack[-1][0] = max(self._memory_stack[-1][0], peak)
+        return max(0, peak - memory_start)
+
+    def summary(self) -> Dict[str, Dict]:
+        """Totals per stage name, so repeated stages like feed fetches collapse to one row"""
+
+        totals: Dict[str, Dict] = {}
+        with self._lock:
+            stages = list(self.stages)
+
+        for record in stages:
+            total = totals.setdefault(record['stage'], {
+                'count': 0, 'errors': 0, 'wall_seconds': 0.0, 'max_wall_seconds': 0.0,
+                'cpu_seconds': 0.0, 'peak_memory_bytes': None
+            })
+            total['count'] += 1
+            total['errors'] += record['status'] == 'error'
+            total['wall_seconds'] = round(total['wall_seconds'] + record['wall_seconds'], 6)
+            total['max_wall_seconds'] = max(total['max_wall_seconds'], record['wall_seconds'])
+            total['cpu_seconds'] = round(total['cpu_seconds'] + record['cpu_seconds'], 6)
+            if record['peak_memory_bytes'] is not None:
+                total['peak_memory_bytes'] = max(total['peak_memory_bytes'] or 0, record['peak_memory_bytes'])
+
+        return totals
+
+    def to_dict(self) -> Dict:
+        with self._lock:
+            stages = sorted(self.stages, key=lambda record: record['offset_seconds'])
+        return {
+            'run_started': self.started_at.isoformat(),
+            'trace_memory': self.trace_memory,
+            'summary': self.summary(),
+            'stages': stages
+        }
+
+    def write(self, path: str) -> None:
+        """Write the metrics as JSON, creating the directory if needed"""
+
+        write_json(path, self.to_dict())
+
+    def close(self) -> None:
+        """Stop tracemalloc if this instance started it"""
+
+        if self._started_tracing:
+            tracemalloc.stop()
+            self._started_tracing = False
+
+
+@contextmanager
+def profiled(profiler: Optional[str], output_dir: str = 'data/analytics/profiles') -> Iterator[Optional[str]]:
+    """Profile the enclosed block with cProfile or pyinstrument and dump it to `output_dir`
+
+    Yields the path the profile will be written to, or None if profiling is
+    off, the profiler name is unknown or pyinstrument isn't installed.
+    """
+
+    logger = logging.getLogger(__name__)
+
+    if not profiler:
+        yield None
+        return
+
+    if profiler not in PROFILERS:
+        # A config typo shouldn't cost the run
+        logger.warning(
+            "Unknown profiler '%s' (expected one of: %s); running without a profiler", profiler, ', '.join(PROFILERS)
+        )
+        yield None
+        return
+
+    os.makedirs(output_dir, exist_ok=True)
+    stem = os.path.join(output_dir, f"pipeline_{datetime.now().strftime('%Y-%m-%d_%H%M%S')}")
+
+    if profiler == 'cprofile':
+        import cProfile
+
+        path = f"{stem}.prof"
+        profile = cProfile.Profile()
+        profile.enable()
+        try:
+            yield path
+        finally:
+            profile.disable()
+            profile.dump_stats(path)
+            logger.info("cProfile output written to %s (view with: python -m pstats %s)", path, path)
+        return
+
+    try:
+        from pyinstrument import Profiler
+    except ImportError:
+        logger.warning("pyinstrument is not installed; running without a profiler")
+        yield None
+        return
+
+    path = f"{stem}.html"
+    profile = Profiler()
+    profile.start()
+    try:
+        yield path
+    finally:
+        profile.stop()
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(profile.output_html())
+        logger.info("pyinstrument output written to %s", path)
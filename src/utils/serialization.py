@@ -0,0 +1,73 @@
+import json
+import math
+import os
+from pathlib import Path
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # Optional speedup; the stdlib encoder is used without it
+    orjson = None
+
+_ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS if orjson else 0
+
+
+def json_default(obj: Any) -> Any:
+    """Encode what JSON can't: dates and datetimes as ISO strings, anything else via str()
+
+    Tuple subclasses (feedparser's time.struct_time dates, namedtuples) become
+    lists, which is what the stdlib encoder does without asking.
+    """
+
+    if hasattr(obj, 'isoformat'):
+        return obj.isoformat()
+    if isinstance(obj, tuple):
+        return list(obj)
+    return str(obj)
+
+
+def _finite(obj: Any) -> Any:
+    """Copy of `obj` with NaN and infinities replaced by None, as orjson writes them"""
+
+    if isinstance(obj, float):
+        return obj if math.isfinite(obj) else None
+    if isinstance(obj, dict):
+        return {key: _finite(value) for key, value in obj.items()}
+    if isinstance(obj, (list, tuple)):
+        return [_finite(value) for value in obj]
+    return obj
+
+
+def dumps(obj: Any, indent: bool = False) -> str:
+    """Serialize straight from the live objects, without copying them first
+
+    Uses orjson when it is installed and falls back to the stdlib encoder
+    for anything orjson rejects (e.g. integers wider than 64 bits). Both
+    produce the same JSON: non-finite floats are written as null rather
+    than the stdlib's invalid NaN/Infinity tokens.
+    """
+
+    if orjson is not None:
+        try:
+            option = _ORJSON_OPTIONS | (orjson.OPT_INDENT_2 if indent else 0)
+            return orjson.dumps(obj, default=json_default, option=option).decode('utf-8')
+        except TypeError:
+            pass
+
+    kwargs = {'indent': 2} if indent else {'separators': (',', ':')}
+    try:
+        return json.dumps(obj, default=json_default, ensure_ascii=False, allow_nan=False, **kwargs)
+    except ValueError:
+        # Only payloads that actually contain NaN/Infinity pay for the copy
+        return json.dumps(_finite(obj), default=json_default, ensure_ascii=False, allow_nan=False, **kwargs)
+
+
+def write_json(path: str, obj: Any, indent: bool = False) -> None:
+    """Atomically write `obj` as JSON, creating the parent directory"""
+
+    target = Path(path)
+    target.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = target.with_suffix(f'.{os.getpid()}.tmp')
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        f.write(dumps(obj, indent=indent))
+    os.replace(tmp_path, target)
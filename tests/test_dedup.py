@@ -0,0 +1,43 @@
+from research.dedup import ArticleDeduplicator, signature_similarity, title_signature
+
+
+def make_deduplicator(tmp_path):
+    return ArticleDeduplicator(history_file=str(tmp_path / 'article_history.json'))
+
+
+def article(title, link, source='https://feed.example/rss'):
+    return {'title': title, 'link': link, 'source': source}
+
+
+def test_syndicated_copy_is_merged(tmp_path):
+    dedup = make_deduplicator(tmp_path)
+    first = article('Google releases Gemini 2', 'https://news.example/gemini-2')
+
+    assert dedup.add(first)
+    assert dedup.absorb('Google Releases the Gemini 2!', 'https://other.example/story/123', 'https://other.example/rss')
+    assert len(first['sources']) == 2
+    assert dedup.merged_count == 1
+
+
+def test_near_identical_titles_of_different_stories_are_kept(tmp_path):
+    dedup = make_deduplicator(tmp_path)
+    pairs = [
+        ('Google releases Gemini 2', 'Google releases Gemini 3'),
+        ('OpenAI launches GPT-5 for enterprise customers', 'OpenAI launches GPT-6 for enterprise customers'),
+        ('Anthropic raises $2 billion in new funding round', 'Anthropic raises $4 billion in new funding round'),
+    ]
+
+    for index, (first, second) in enumerate(pairs):
+        assert dedup.add(article(first, f'https://news.example/{index}/a'))
+        assert not dedup.absorb(second, f'https://news.example/{index}/b', 'https://news.example/rss')
+        assert dedup.add(article(second, f'https://news.example/{index}/b'))
+
+    assert dedup.merged_count == 0
+
+
+def test_signature_similarity_tracks_title_overlap():
+    same = signature_similarity(title_signature('Google releases Gemini 2'), title_signature('GOOGLE RELEASES THE GEMINI 2'))
+    different = signature_similarity(title_signature('Google releases Gemini 2'), title_signature('Google releases Gemini 3'))
+
+    assert same == 1.0
+    assert different < 0.8
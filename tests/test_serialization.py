@@ -0,0 +1,68 @@
+import json
+import math
+import time
+from datetime import datetime, timezone
+
+import pytest
+
+from utils import serialization
+
+orjson = pytest.importorskip('orjson')
+
+
+def research_payload():
+    published = time.strptime('2024-05-01 08:30:00', '%Y-%m-%d %H:%M:%S')
+    return {
+        'timestamp': datetime(2024, 5, 1, 9, 15, 30, 123456),
+        'collected_at': datetime(2024, 5, 1, 9, 15, tzinfo=timezone.utc),
+        'news_articles': [
+            {
+                'title': 'OpenAI ships a new model — café edition ✨',
+                'link': 'https://news.example/openai?id=1',
+                'published_parsed': published,
+                'relevance_score': 0.8125,
+                'keyword_counts': {'openai': 2, 'model': 1},
+                'sources': [{'title': 'OpenAI ships', 'link': 'https://a.example/1', 'source': 'feed'}],
+            },
+            {
+                'title': 'Empty summary',
+                'link': 'https://news.example/2',
+                'published_parsed': None,
+                'relevance_score': float('nan'),
+                'trend_score': float('inf'),
+                'keyword_counts': {},
+                'sources': [],
+            },
+        ],
+        'trending_topics': [('agents', 3), ('gpt', 1.5)],
+        'metrics': {'latency': -float('inf'), 'feeds': 12, 'ok': True, 'error': None},
+    }
+
+
+def encode_both(payload, indent):
+    encoded = serialization.dumps(payload, indent=indent)
+    saved = serialization.orjson
+    serialization.orjson = None
+    try:
+        fallback = serialization.dumps(payload, indent=indent)
+    finally:
+        serialization.orjson = saved
+    return encoded, fallback
+
+
+@pytest.mark.parametrize('indent', [False, True])
+def test_orjson_and_stdlib_encoders_match(indent):
+    encoded, fallback = encode_both(research_payload(), indent)
+
+    assert encoded == fallback
+    decoded = json.loads(encoded)
+    assert decoded['news_articles'][0]['published_parsed'][:3] == [2024, 5, 1]
+    assert decoded['news_articles'][1]['relevance_score'] is None
+    assert decoded['metrics']['latency'] is None
+
+
+def test_fallback_keeps_the_payload_unchanged():
+    payload = research_payload()
+    encode_both(payload, indent=False)
+
+    assert math.isnan(payload['news_articles'][1]['relevance_score'])